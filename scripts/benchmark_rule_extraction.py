@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+Rule Extraction Benchmark - Compares utils/rule_extraction.py (instance
+``__dict__`` lookups) with the previous ``hasattr`` chains on a synthetic
+catalog of SDK rule models. Neither side copies its output, as the previous
+implementation returned freshly extracted dictionaries.
+Both implementations are checked to produce identical output first.
+
+Usage:
+    python scripts/benchmark_rule_extraction.py [--rules 10000] [--repeat 5]
+"""
+
+import argparse
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+# Add src to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from azure.mgmt.securityinsight import models
+
+from utils.lighthouse import SentinelWorkspace
+from utils.rule_extraction import extract_rule_details, extract_rule_summary
+
+
+# Previous implementation, kept verbatim as the baseline
+
+def legacy_extract_rule_summary(
+    rule: Any, workspace: SentinelWorkspace
+) -> Dict[str, Any]:
+    """
+    Extract summary information from a rule object
+
+    Args:
+        rule: Alert rule object from Azure SDK
+        workspace: SentinelWorkspace the rule belongs to
+
+    Returns:
+        Dictionary with rule summary information
+    """
+    # Get the rule kind (type)
+    kind = getattr(rule, "kind", "Unknown")
+
+    # Basic information available for all rule types
+    summary = {
+        "rule_id": rule.name,
+        "rule_name": getattr(rule, "display_name", rule.name),
+        "kind": kind,
+        "enabled": getattr(rule, "enabled", False),
+        "workspace_name": workspace.workspace_name,
+        "workspace_id": workspace.workspace_id,
+    }
+
+    # Add type-specific information
+    if hasattr(rule, "severity"):
+        summary["severity"] = rule.severity
+
+    if hasattr(rule, "tactics"):
+        summary["tactics"] = rule.tactics if rule.tactics else []
+
+    if hasattr(rule, "techniques"):
+        summary["techniques"] = rule.techniques if rule.techniques else []
+
+    if hasattr(rule, "description"):
+        summary["description"] = rule.description
+
+    if hasattr(rule, "last_modified_utc"):
+        summary["last_modified"] = rule.last_modified_utc.isoformat() if rule.last_modified_utc else None
+
+    return summary
+
+def legacy_extract_rule_details(
+    rule: Any, workspace: SentinelWorkspace
+) -> Dict[str, Any]:
+    """
+    Extract detailed information from a rule object
+
+    Args:
+        rule: Alert rule object from Azure SDK
+        workspace: SentinelWorkspace the rule belongs to
+
+    Returns:
+        Dictionary with detailed rule information
+    """
+    # Start with summary information
+    details = legacy_extract_rule_summary(rule, workspace)
+
+    # Get the rule kind
+    kind = getattr(rule, "kind", "Unknown")
+
+    # Add detailed configuration based on rule type
+    details["configuration"] = {}
+
+    # Scheduled query rules (most common type)
+    if kind == "Scheduled":
+        if hasattr(rule, "query"):
+            details["configuration"]["query"] = rule.query
+
+        if hasattr(rule, "query_frequency"):
+            details["configuration"]["query_frequency"] = str(rule.query_frequency)
+
+        if hasattr(rule, "query_period"):
+            details["configuration"]["query_period"] = str(rule.query_period)
+
+        if hasattr(rule, "trigger_operator"):
+            details["configuration"]["trigger_operator"] = rule.trigger_operator
+
+        if hasattr(rule, "trigger_threshold"):
+            details["configuration"]["trigger_threshold"] = rule.trigger_threshold
+
+        if hasattr(rule, "suppression_enabled"):
+            details["configuration"]["suppression_enabled"] = rule.suppression_enabled
+
+        if hasattr(rule, "suppression_duration"):
+            details["configuration"]["suppression_duration"] = str(rule.suppression_duration)
+
+    # Microsoft Security Incident Creation rules
+    elif kind == "MicrosoftSecurityIncidentCreation":
+        if hasattr(rule, "product_filter"):
+            details["configuration"]["product_filter"] = rule.product_filter
+
+        if hasattr(rule, "display_name_filter"):
+            details["configuration"]["display_name_filter"] = rule.display_name_filter
+
+    # Fusion rules
+    elif kind == "Fusion":
+        if hasattr(rule, "alert_rule_template_name"):
+            details["configuration"]["template_name"] = rule.alert_rule_template_name
+
+    # Machine Learning Behavioral Analytics
+    elif kind == "MLBehaviorAnalytics":
+        if hasattr(rule, "alert_rule_template_name"):
+            details["configuration"]["template_name"] = rule.alert_rule_template_name
+
+    # Add incident configuration if available
+    if hasattr(rule, "incident_configuration"):
+        incident_config = rule.incident_configuration
+        details["incident_configuration"] = {
+            "create_incident": getattr(incident_config, "create_incident", False),
+        }
+
+        if hasattr(incident_config, "grouping_configuration"):
+            grouping = incident_config.grouping_configuration
+            details["incident_configuration"]["grouping"] = {
+                "enabled": getattr(grouping, "enabled", False),
+                "reopen_closed_incidents": getattr(grouping, "reopen_closed_incident", False),
+                "lookback_duration": str(getattr(grouping, "lookback_duration", "PT5H")),
+                "matching_method": getattr(grouping, "matching_method", "AllEntities"),
+            }
+
+            if hasattr(grouping, "group_by_entities"):
+                details["incident_configuration"]["grouping"]["group_by_entities"] = grouping.group_by_entities
+
+            if hasattr(grouping, "group_by_alert_details"):
+                details["incident_configuration"]["grouping"]["group_by_alert_details"] = grouping.group_by_alert_details
+
+    # Add alert details configuration if available
+    if hasattr(rule, "alert_details_override"):
+        alert_override = rule.alert_details_override
+        details["alert_details_override"] = {}
+
+        if hasattr(alert_override, "alert_display_name_format"):
+            details["alert_details_override"]["display_name_format"] = alert_override.alert_display_name_format
+
+        if hasattr(alert_override, "alert_description_format"):
+            details["alert_details_override"]["description_format"] = alert_override.alert_description_format
+
+        if hasattr(alert_override, "alert_severity_column_name"):
+            details["alert_details_override"]["severity_column"] = alert_override.alert_severity_column_name
+
+        if hasattr(alert_override, "alert_tactics_column_name"):
+            details["alert_details_override"]["tactics_column"] = alert_override.alert_tactics_column_name
+
+    # Add entity mappings if available
+    if hasattr(rule, "entity_mappings") and rule.entity_mappings:
+        details["entity_mappings"] = []
+        for mapping in rule.entity_mappings:
+            entity_map = {
+                "entity_type": getattr(mapping, "entity_type", None),
+                "field_mappings": []
+            }
+
+            if hasattr(mapping, "field_mappings"):
+                for field_map in mapping.field_mappings:
+                    entity_map["field_mappings"].append({
+                        "identifier": getattr(field_map, "identifier", None),
+                        "column_name": getattr(field_map, "column_name", None),
+                    })
+
+            details["entity_mappings"].append(entity_map)
+
+    # Add custom details if available
+    if hasattr(rule, "custom_details") and rule.custom_details:
+        details["custom_details"] = dict(rule.custom_details)
+
+    return details
+
+
+def make_rule(index: int) -> Any:
+    """Create a synthetic rule; mostly Scheduled, like real catalogs"""
+    common = {
+        "display_name": f"Rule {index}",
+        "enabled": index % 3 != 0,
+        "description": f"Synthetic rule {index}",
+        "tactics": ["CredentialAccess", "InitialAccess"],
+    }
+    kind = index % 10
+    if kind == 8:
+        rule = models.FusionAlertRule(alert_rule_template_name=f"template-{index}")
+    elif kind == 9:
+        rule = models.MicrosoftSecurityIncidentCreationAlertRule(
+            product_filter="Microsoft Defender Advanced Threat Protection"
+        )
+    else:
+        rule = models.ScheduledAlertRule(
+            query=f"SigninLogs | where ResultType == {index} | summarize count() by UserPrincipalName",
+            query_frequency=timedelta(hours=1),
+            query_period=timedelta(hours=1),
+            severity="Medium",
+            trigger_operator="GreaterThan",
+            trigger_threshold=5,
+            suppression_duration=timedelta(hours=5),
+            suppression_enabled=False,
+            techniques=["T1110"],
+            incident_configuration=models.IncidentConfiguration(
+                create_incident=True,
+                grouping_configuration=models.GroupingConfiguration(
+                    enabled=True,
+                    reopen_closed_incident=False,
+                    lookback_duration=timedelta(hours=5),
+                    matching_method="AllEntities",
+                ),
+            ),
+            entity_mappings=[
+                models.EntityMapping(
+                    entity_type="Account",
+                    field_mappings=[
+                        models.FieldMapping(identifier="FullName", column_name="UserPrincipalName")
+                    ],
+                )
+            ],
+            custom_details={"Count": "count_"},
+        )
+    # Read-only and kind-specific attributes are set as deserialization would
+    for attribute, value in common.items():
+        if attribute in type(rule)._attribute_map:
+            setattr(rule, attribute, value)
+    rule.name = f"rule-{index:05d}"
+    rule.last_modified_utc = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    return rule
+
+
+def best_of(operation: Callable[[Any], Any], items: List[Any], repeat: int) -> float:
+    """Best wall time of applying the operation to every item, in seconds"""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for item in items:
+            operation(item)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main() -> None:
+    """Run the benchmark"""
+    parser = argparse.ArgumentParser(description="Benchmark analytics rule extraction")
+    parser.add_argument("--rules", type=int, default=10000, help="Synthetic catalog size")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per variant (best is reported)")
+    args = parser.parse_args()
+
+    workspace = SentinelWorkspace(
+        workspace_id="/subscriptions/sub/resourceGroups/rg/providers/Microsoft.OperationalInsights/workspaces/bench",
+        workspace_name="bench",
+        resource_group="rg",
+        subscription_id="sub",
+        tenant_id="tenant",
+        tenant_name="Tenant",
+        location="westeurope",
+    )
+    rules = [make_rule(index) for index in range(args.rules)]
+
+    for legacy, current in (
+        (legacy_extract_rule_summary, extract_rule_summary),
+        (legacy_extract_rule_details, extract_rule_details),
+    ):
+        for rule in rules:
+            if legacy(rule, workspace) != current(rule, workspace):
+                sys.exit(f"Output differs for {rule.name} ({current.__name__})")
+
+    cases = (
+        ("extract summary",
+         lambda rule: legacy_extract_rule_summary(rule, workspace),
+         lambda rule: extract_rule_summary(rule, workspace), rules),
+        ("extract details",
+         lambda rule: legacy_extract_rule_details(rule, workspace),
+         lambda rule: extract_rule_details(rule, workspace), rules),
+    )
+
+    print(f"{args.rules} rules, best of {args.repeat} runs\n")
+    print(f"{'':<16} {'before (ms)':>12} {'after (ms)':>12} {'ratio':>9}")
+    for label, before_operation, after_operation, items in cases:
+        before = best_of(before_operation, items, args.repeat)
+        after = best_of(after_operation, items, args.repeat)
+        print(f"{label:<16} {before * 1000:>12.1f} {after * 1000:>12.1f} {before / after:>8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
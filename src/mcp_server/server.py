@@ -5,8 +5,9 @@ FastMCP-based server providing Microsoft Sentinel management and automation tool
 """
 
 import asyncio
+from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Optional
+from typing import AsyncIterator, Dict, List, Optional
 import structlog
 from fastmcp import FastMCP
 
@@ -14,12 +15,18 @@ from utils.config import get_settings
 from utils.logging import setup_logging
 from utils.auth import get_authenticator
 from utils.lighthouse import get_lighthouse_manager
+from utils.client_registry import close_client_registry
+from utils.executor import shutdown_blocking_executor
 from mcp_server.tools.management.health_check import check_sentinel_health
 from mcp_server.tools.powershell.sentinel_manager import register_powershell_tools
 from mcp_server.tools.exploration.analytics_rules import (
     list_analytics_rules,
     get_analytics_rule_details,
+    get_analytics_rule_details_batch,
 )
+from mcp_server.tools.exploration.rule_fingerprints import compare_rule_deployments
+from mcp_server.tools.exploration.rule_search import search_analytics_rules
+from mcp_server.tools.exploration.attack_coverage import get_attack_coverage
 
 logger = structlog.get_logger(__name__)
 
@@ -33,19 +40,44 @@ setup_logging(
     log_requests=settings.log_requests,
 )
 
+# Global authenticator and lighthouse manager (initialized on first request)
+_authenticator = None
+_lighthouse_manager = None
+
+
+async def close_azure_resources() -> None:
+    """Close the shared Azure clients, async credential and worker threads"""
+    global _lighthouse_manager
+    if _lighthouse_manager is not None:
+        await _lighthouse_manager.tenant_directory.close()
+    # The manager holds the registry and executor being closed; rebuild on next use
+    _lighthouse_manager = None
+    await close_client_registry()
+    if _authenticator is not None:
+        await _authenticator.close()
+    shutdown_blocking_executor()
+    logger.info("Azure resources closed")
+
+
+@asynccontextmanager
+async def server_lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Release the shared Azure resources when the server stops"""
+    try:
+        yield
+    finally:
+        await close_azure_resources()
+
+
 # Create MCP server
 mcp = FastMCP(
     name=settings.mcp_server_name,
     version=settings.mcp_server_version,
+    lifespan=server_lifespan,
 )
 
 # Register PowerShell tools
 register_powershell_tools(mcp)
 
-# Global authenticator and lighthouse manager (initialized on first request)
-_authenticator = None
-_lighthouse_manager = None
-
 
 async def get_auth():
     """Get or create authenticator instance"""
@@ -66,7 +98,8 @@ async def get_lighthouse():
     global _lighthouse_manager
     if _lighthouse_manager is None:
         auth = await get_auth()
-        _lighthouse_manager = await get_lighthouse_manager(auth)
+        _lighthouse_manager = await get_lighthouse_manager(auth, settings)
+        await _lighthouse_manager.warm_up()
         logger.info("Lighthouse manager initialized")
     return _lighthouse_manager
 
@@ -87,7 +120,9 @@ async def sentinel_health_check(
 
     Args:
         tenant_scope: Scope of tenants to check. Use "all" for all tenants,
-                     or provide a tenant name to filter. Default: "all"
+                     or provide a tenant ID or customer tenant name to filter. Exact
+                     names match only that tenant; otherwise substrings and globs
+                     such as "Contoso*" are matched. Default: "all"
         check_depth: Depth of the health check. Options:
                     - "quick": Fast check of connectors and rules
                     - "detailed": Includes data ingestion metrics (slower)
@@ -97,6 +132,8 @@ async def sentinel_health_check(
         Dictionary containing:
         - summary: Overall health summary with counts and status
         - workspaces: List of individual workspace health check results
+        - runtime: Connection pool, blocking executor, ARM read rate,
+          single-flight and rule catalog counters of the server
 
     Examples:
         Check all workspaces (quick):
@@ -152,6 +189,10 @@ async def sentinel_list_analytics_rules(
     workspace_filter: str = "",
     tenant_filter: str = "",
     enabled_only: bool = False,
+    page_size: int = 0,
+    cursor: str = "",
+    fields: str = "",
+    columnar: bool = False,
 ) -> dict:
     """
     List Microsoft Sentinel Analytics Rules across workspaces.
@@ -162,21 +203,40 @@ async def sentinel_list_analytics_rules(
 
     Args:
         workspace_filter: Optional workspace name filter. Only workspaces matching this
-                         string will be included. Default: "" (all workspaces)
-        tenant_filter: Optional tenant name filter. Only tenants matching this string
-                      will be included. Default: "" (all tenants)
+                         substring or glob pattern (e.g. "prod-*") will be included.
+                         Default: "" (all workspaces)
+        tenant_filter: Optional tenant filter: a tenant ID, an exact customer tenant name,
+                      or a substring/glob pattern. Default: "" (all tenants)
         enabled_only: If True, only return enabled rules. If False, return all rules.
                      Default: False (return all rules)
+        page_size: Number of rules per page. Large listings are kept server-side and
+                  returned page by page. Default: 0 (return everything at once)
+        cursor: next_cursor from a previous page. Follow-up pages are served from
+               the stored listing without re-querying Azure; the filters of the
+               first call apply. Default: "" (first page)
+        fields: Comma-separated rule fields to return, e.g. "rule_name,enabled".
+               rule_id is always included. Available: rule_id, rule_name, kind,
+               enabled, severity, tactics, techniques, description, last_modified,
+               workspace_name, workspace_id. Default: "" (all fields)
+        columnar: If True, return the column names once in "columns" and each
+                 workspace's rules as "rows" of values, which is much smaller for
+                 large listings; workspace_name and workspace_id appear once per
+                 workspace instead of in each row. Default: False (rules as objects)
 
     Returns:
         Dictionary containing:
         - timestamp: When the query was executed
         - workspaces_queried: Number of workspaces checked
         - total_rules: Total number of rules found
-        - workspaces: List of workspaces with their rules:
+        - duration_ms: Total time taken, in milliseconds
+        - page_size / next_cursor: When paginating; next_cursor is None on the last page
+        - workspaces: List of workspaces with their rules, sorted by tenant and workspace name:
             - workspace_name: Name of the workspace
+            - workspace_id: Full Azure resource ID of the workspace
             - tenant_name: Name of the tenant
             - rules_count: Number of rules in this workspace
+            - duration_ms: Time spent listing this workspace, in milliseconds
+            - error: Present if the workspace failed, timed out or was skipped
             - rules: List of rule objects with:
                 - rule_id: Unique identifier
                 - rule_name: Display name of the rule
@@ -186,6 +246,8 @@ async def sentinel_list_analytics_rules(
                 - tactics: MITRE ATT&CK tactics
                 - description: Rule description
                 - last_modified: When the rule was last modified
+            - rows: Instead of rules when columnar=True, one list of values per rule
+        - columns: Column names of the rows when columnar=True
 
     Examples:
         List all analytics rules:
@@ -200,6 +262,13 @@ async def sentinel_list_analytics_rules(
         List rules for a specific workspace:
         >>> sentinel_list_analytics_rules(workspace_filter="prod-sentinel")
 
+        Page through all rules 200 at a time:
+        >>> page = sentinel_list_analytics_rules(page_size=200)
+        >>> sentinel_list_analytics_rules(cursor=page["next_cursor"])
+
+        Compact listing of names and state across all tenants:
+        >>> sentinel_list_analytics_rules(fields="rule_name,enabled", columnar=True)
+
     Raises:
         Authentication errors if Azure credentials are invalid
         Permission errors if access to workspaces is denied
@@ -209,6 +278,10 @@ async def sentinel_list_analytics_rules(
         workspace_filter=workspace_filter,
         tenant_filter=tenant_filter,
         enabled_only=enabled_only,
+        page_size=page_size,
+        paged=bool(cursor),
+        fields=fields,
+        columnar=columnar,
     )
 
     try:
@@ -223,6 +296,10 @@ async def sentinel_list_analytics_rules(
             workspace_filter=workspace_filter or None,
             tenant_filter=tenant_filter or None,
             enabled_only=enabled_only,
+            page_size=page_size,
+            cursor=cursor or None,
+            fields=[field.strip() for field in fields.split(",") if field.strip()],
+            columnar=columnar,
         )
 
         logger.info(
@@ -248,6 +325,8 @@ async def sentinel_list_analytics_rules(
 async def sentinel_get_analytics_rule(
     workspace_name: str,
     rule_id: str,
+    subscription_id: str = "",
+    resource_group: str = "",
 ) -> dict:
     """
     Get detailed information about a specific Microsoft Sentinel Analytics Rule.
@@ -263,9 +342,14 @@ async def sentinel_get_analytics_rule(
     Use this after listing rules to get the complete detection logic and configuration.
 
     Args:
-        workspace_name: Name of the Sentinel workspace containing the rule.
-                       Use the exact workspace name from sentinel_list_analytics_rules.
+        workspace_name: Name of the Sentinel workspace containing the rule, or its full
+                       resource ID (workspace_id from sentinel_list_analytics_rules).
+                       A resource ID, or a name with subscription_id and resource_group,
+                       is resolved directly without enumerating workspaces.
         rule_id: The rule ID to retrieve. Use the rule_id from sentinel_list_analytics_rules.
+        subscription_id: Optional subscription ID of the workspace. Default: ""
+        resource_group: Optional resource group of the workspace (used together with
+                       subscription_id). Default: ""
 
     Returns:
         Dictionary containing:
@@ -298,6 +382,13 @@ async def sentinel_get_analytics_rule(
         ...     rule_id="12345678-1234-1234-1234-123456789012"
         ... )
 
+        Get a rule by workspace resource ID (no workspace enumeration):
+        >>> sentinel_get_analytics_rule(
+        ...     workspace_name="/subscriptions/<sub>/resourceGroups/rg-sec/providers/"
+        ...                    "Microsoft.OperationalInsights/workspaces/prod-sentinel",
+        ...     rule_id="12345678-1234-1234-1234-123456789012"
+        ... )
+
     Raises:
         ValueError: If workspace or rule is not found
         Authentication errors if Azure credentials are invalid
@@ -320,6 +411,8 @@ async def sentinel_get_analytics_rule(
             lighthouse_manager=lighthouse,
             workspace_name=workspace_name,
             rule_id=rule_id,
+            subscription_id=subscription_id or None,
+            resource_group=resource_group or None,
         )
 
         logger.info(
@@ -344,6 +437,417 @@ async def sentinel_get_analytics_rule(
         }
 
 
+@mcp.tool()
+async def sentinel_get_analytics_rules_batch(
+    rules: List[Dict[str, str]],
+) -> dict:
+    """
+    Get detailed information about several Microsoft Sentinel Analytics Rules in one call.
+
+    Returns the same rule details as sentinel_get_analytics_rule for up to 100 rules.
+    Requests are grouped by workspace: each workspace is resolved once and listed once
+    when several of its rules are requested, and workspaces are fetched concurrently.
+    A failing item does not fail the batch.
+
+    Args:
+        rules: List of items, each with:
+              - workspace: Workspace name or full resource ID (workspace_id from
+                           sentinel_list_analytics_rules)
+              - rule_id: The rule ID to retrieve
+              - subscription_id / resource_group: Optional, to address the workspace
+                directly by name
+
+    Returns:
+        Dictionary containing:
+        - timestamp: When the query was executed
+        - requested / succeeded / failed: Item counts
+        - duration_ms: Total time taken, in milliseconds
+        - results: One entry per item, in request order, with workspace, rule_id and
+                   either rule (same fields as sentinel_get_analytics_rule) or error
+
+    Examples:
+        Get three rules from two workspaces:
+        >>> sentinel_get_analytics_rules_batch(rules=[
+        ...     {"workspace": "prod-sentinel", "rule_id": "rule-1"},
+        ...     {"workspace": "prod-sentinel", "rule_id": "rule-2"},
+        ...     {"workspace": "customer-b-sentinel", "rule_id": "rule-3"},
+        ... ])
+    """
+    logger.info("sentinel_get_analytics_rules_batch called", count=len(rules))
+
+    try:
+        auth = await get_auth()
+        lighthouse = await get_lighthouse()
+
+        result = await get_analytics_rule_details_batch(
+            authenticator=auth,
+            lighthouse_manager=lighthouse,
+            rules=rules,
+        )
+
+        logger.info(
+            "sentinel_get_analytics_rules_batch completed",
+            succeeded=result["succeeded"],
+            failed=result["failed"],
+        )
+
+        return result
+
+    except Exception as e:
+        logger.error("sentinel_get_analytics_rules_batch failed", error=str(e))
+        return {
+            "timestamp": datetime.utcnow().isoformat(),
+            "error": str(e),
+            "results": [],
+        }
+
+
+@mcp.tool()
+async def sentinel_compare_rule_deployments(
+    rule: str,
+    reference_workspace: str = "",
+    workspace_filter: str = "",
+    tenant_filter: str = "",
+) -> dict:
+    """
+    Compare how a Scheduled analytics rule is deployed across workspaces and tenants.
+
+    Every Scheduled rule is fingerprinted by a hash of its normalized KQL query
+    (comments and formatting ignored), query frequency, query period and trigger
+    threshold. Deployments of the same detection (same template, or same display
+    name) are grouped, answering in one call which workspaces run the rule as-is,
+    which run a modified variant, and which lack it.
+
+    Args:
+        rule: The detection to compare: a fingerprint, a rule_id, an alert rule
+             template name or a rule display name
+        reference_workspace: Optional workspace name or ID whose version is the
+                            baseline. Cannot be combined with a fingerprint, which is
+                            its own baseline. Default: "" (the most common version)
+        workspace_filter: Optional workspace name filter (substring or glob).
+                         Default: "" (all workspaces)
+        tenant_filter: Optional tenant filter: a tenant ID, an exact customer tenant
+                      name, or a substring/glob pattern. Default: "" (all tenants)
+
+    Returns:
+        Dictionary containing:
+        - timestamp: When the comparison was made
+        - workspaces_queried: Number of workspaces checked
+        - scheduled_rules_indexed: Number of Scheduled rules fingerprinted
+        - fingerprint: Fingerprint of the baseline version
+        - baseline: Normalized query, frequency, period and trigger of the baseline
+        - identical: Workspaces running the baseline version (workspace_name,
+                     tenant_name, rule_id, rule_name, enabled, fingerprint)
+        - variants: Workspaces running another version, with "differences" listing
+                    the settings that differ from the baseline
+        - missing: Workspaces without the rule
+        - errors: Workspaces that could not be checked, with the error
+
+    Examples:
+        Which customers run the brute-force detection, and in which version:
+        >>> sentinel_compare_rule_deployments(rule="Brute force attack against Azure Portal")
+
+        Compare against the version deployed in the reference workspace:
+        >>> sentinel_compare_rule_deployments(
+        ...     rule="Brute force attack against Azure Portal",
+        ...     reference_workspace="mssp-golden"
+        ... )
+    """
+    logger.info(
+        "sentinel_compare_rule_deployments called",
+        rule=rule,
+        reference_workspace=reference_workspace,
+        workspace_filter=workspace_filter,
+        tenant_filter=tenant_filter,
+    )
+
+    try:
+        auth = await get_auth()
+        lighthouse = await get_lighthouse()
+
+        result = await compare_rule_deployments(
+            authenticator=auth,
+            lighthouse_manager=lighthouse,
+            rule=rule,
+            reference_workspace=reference_workspace or None,
+            workspace_filter=workspace_filter or None,
+            tenant_filter=tenant_filter or None,
+        )
+
+        logger.info(
+            "sentinel_compare_rule_deployments completed",
+            identical=len(result["identical"]),
+            variants=len(result["variants"]),
+            missing=len(result["missing"]),
+        )
+
+        return result
+
+    except Exception as e:
+        logger.error("sentinel_compare_rule_deployments failed", rule=rule, error=str(e))
+        return {
+            "timestamp": datetime.utcnow().isoformat(),
+            "error": str(e),
+            "identical": [],
+            "variants": [],
+            "missing": [],
+        }
+
+
+@mcp.tool()
+async def sentinel_search_analytics_rules(
+    text: str,
+    fields: str = "",
+    workspace_filter: str = "",
+    tenant_filter: str = "",
+    limit: int = 50,
+) -> dict:
+    """
+    Search Microsoft Sentinel Analytics Rules across all workspaces and tenants.
+
+    Full-text search over rule names, descriptions, KQL detection queries and the
+    tables each query reads, e.g. "which rules reference SigninLogs" or "which
+    rules mention mimikatz". Searches are served from an in-memory index kept in
+    sync with the cached rule definitions, so only changed rules are re-indexed.
+
+    Args:
+        text: Words to search for. Every word must match (case-insensitive).
+        fields: Comma-separated fields to search: name, description, query, tables.
+               Default: "" (all fields)
+        workspace_filter: Optional workspace name filter (substring or glob).
+                         Default: "" (all workspaces)
+        tenant_filter: Optional tenant filter: a tenant ID, an exact customer tenant
+                      name, or a substring/glob pattern. Default: "" (all tenants)
+        limit: Maximum number of matches to return (at least 1). Default: 50
+
+    Returns:
+        Dictionary containing:
+        - timestamp: When the search ran
+        - workspaces_queried: Number of workspaces searched
+        - rules_searched: Number of rules in those workspaces
+        - total_matches: Number of matching rules (may exceed limit)
+        - duration_ms / search_ms: Total time, and time spent in the index lookup
+        - matches: Best matches first, each with workspace_name, tenant_name, rule_id,
+                   rule_name, kind, enabled, tables (tables the query reads),
+                   matched_fields and score
+        - errors: Workspaces that could not be searched, with the error
+
+    Examples:
+        Rules reading the sign-in logs:
+        >>> sentinel_search_analytics_rules(text="SigninLogs", fields="tables")
+
+        Rules mentioning mimikatz anywhere:
+        >>> sentinel_search_analytics_rules(text="mimikatz")
+    """
+    logger.info(
+        "sentinel_search_analytics_rules called",
+        text=text,
+        fields=fields,
+        workspace_filter=workspace_filter,
+        tenant_filter=tenant_filter,
+    )
+
+    try:
+        auth = await get_auth()
+        lighthouse = await get_lighthouse()
+
+        result = await search_analytics_rules(
+            authenticator=auth,
+            lighthouse_manager=lighthouse,
+            text=text,
+            fields=[field.strip() for field in fields.split(",") if field.strip()],
+            workspace_filter=workspace_filter or None,
+            tenant_filter=tenant_filter or None,
+            limit=limit,
+        )
+
+        logger.info(
+            "sentinel_search_analytics_rules completed",
+            total_matches=result["total_matches"],
+            search_ms=result["search_ms"],
+        )
+
+        return result
+
+    except Exception as e:
+        logger.error("sentinel_search_analytics_rules failed", text=text, error=str(e))
+        return {
+            "timestamp": datetime.utcnow().isoformat(),
+            "error": str(e),
+            "total_matches": 0,
+            "matches": [],
+        }
+
+
+@mcp.tool()
+async def sentinel_attack_coverage(
+    workspace_filter: str = "",
+    tenant_filter: str = "",
+    include_heatmap: bool = True,
+) -> dict:
+    """
+    Show MITRE ATT&CK coverage of analytics rules across workspaces and tenants.
+
+    Aggregates the tactics and techniques of every analytics rule into a workspace x
+    technique matrix. A technique counts as covered by a workspace when at least one
+    enabled rule maps to it.
+
+    Args:
+        workspace_filter: Optional workspace name filter (substring or glob).
+                         Default: "" (all workspaces)
+        tenant_filter: Optional tenant filter: a tenant ID, an exact customer tenant
+                      name, or a substring/glob pattern. Default: "" (all tenants)
+        include_heatmap: If True, include per-technique and per-tactic fleet heatmaps.
+                        Default: True
+
+    Returns:
+        Dictionary containing:
+        - timestamp: When the matrix was built
+        - workspaces_queried: Number of workspaces checked
+        - techniques_total / techniques_covered: Techniques referenced by any rule,
+          and those covered by an enabled rule somewhere in the fleet
+        - workspaces: Per workspace: techniques_covered, techniques_disabled_only
+                      (only disabled rules map to them), tactics_covered and
+                      fleet_coverage_pct (share of fleet-covered techniques)
+        - tenants: Per tenant: techniques_covered and gaps (techniques other tenants
+                   cover but this tenant does not)
+        - heatmap: Per technique: workspaces_covered, coverage_pct, enabled_rules,
+                   disabled_rules
+        - tactics: Per tactic: workspaces_covered, coverage_pct
+        - errors: Workspaces that could not be checked, with the error
+
+    Examples:
+        Fleet-wide coverage and per-tenant gaps:
+        >>> sentinel_attack_coverage()
+
+        Coverage of one customer without the heatmaps:
+        >>> sentinel_attack_coverage(tenant_filter="Customer A", include_heatmap=False)
+    """
+    logger.info(
+        "sentinel_attack_coverage called",
+        workspace_filter=workspace_filter,
+        tenant_filter=tenant_filter,
+    )
+
+    try:
+        auth = await get_auth()
+        lighthouse = await get_lighthouse()
+
+        result = await get_attack_coverage(
+            authenticator=auth,
+            lighthouse_manager=lighthouse,
+            workspace_filter=workspace_filter or None,
+            tenant_filter=tenant_filter or None,
+            include_heatmap=include_heatmap,
+        )
+
+        logger.info(
+            "sentinel_attack_coverage completed",
+            workspaces_queried=result["workspaces_queried"],
+            techniques_covered=result["techniques_covered"],
+        )
+
+        return result
+
+    except Exception as e:
+        logger.error("sentinel_attack_coverage failed", error=str(e))
+        return {
+            "timestamp": datetime.utcnow().isoformat(),
+            "error": str(e),
+            "workspaces_queried": 0,
+            "workspaces": [],
+            "tenants": [],
+        }
+
+
+@mcp.tool()
+async def sentinel_validate_workspace_access(
+    workspace_filter: str = "",
+    tenant_filter: str = "",
+    use_cache: bool = True,
+) -> dict:
+    """
+    Validate access to Microsoft Sentinel workspaces across tenants.
+
+    Probes each matching workspace concurrently and records the result, so later
+    health checks and rule listings skip workspaces that deny access instead of
+    waiting on repeated 403 responses.
+
+    Args:
+        workspace_filter: Optional workspace name filter (substring or glob).
+                         Default: "" (all workspaces)
+        tenant_filter: Optional tenant filter: a tenant ID, an exact customer tenant
+                      name, or a substring/glob pattern. Default: "" (all tenants)
+        use_cache: If True, reuse recent results instead of probing again.
+                  Default: True
+
+    Returns:
+        Dictionary containing:
+        - timestamp: When the sweep was executed
+        - workspaces_checked: Number of workspaces validated
+        - accessible: Number of workspaces with access
+        - denied: Number of workspaces without access
+        - workspaces: List of workspaces with workspace_name, tenant_name,
+          workspace_id and access (true/false)
+
+    Examples:
+        Validate all workspaces:
+        >>> sentinel_validate_workspace_access()
+
+        Re-probe a single tenant ignoring cached results:
+        >>> sentinel_validate_workspace_access(tenant_filter="Customer A", use_cache=False)
+    """
+    logger.info(
+        "sentinel_validate_workspace_access called",
+        workspace_filter=workspace_filter,
+        tenant_filter=tenant_filter,
+        use_cache=use_cache,
+    )
+
+    try:
+        lighthouse = await get_lighthouse()
+
+        workspaces = await lighthouse.find_workspaces(
+            workspace_filter=workspace_filter or None,
+            tenant_filter=tenant_filter or None,
+        )
+        access = await lighthouse.validate_workspaces_access(workspaces, use_cache=use_cache)
+
+        results = [
+            {
+                "workspace_name": ws.workspace_name,
+                "tenant_name": ws.tenant_name,
+                "workspace_id": ws.workspace_id,
+                "access": access[ws.workspace_id],
+            }
+            for ws in workspaces
+        ]
+        accessible = sum(1 for r in results if r["access"])
+
+        logger.info(
+            "sentinel_validate_workspace_access completed",
+            workspaces_checked=len(results),
+            accessible=accessible,
+        )
+
+        return {
+            "timestamp": datetime.utcnow().isoformat(),
+            "workspaces_checked": len(results),
+            "accessible": accessible,
+            "denied": len(results) - accessible,
+            "workspaces": results,
+        }
+
+    except Exception as e:
+        logger.error("sentinel_validate_workspace_access failed", error=str(e))
+        return {
+            "timestamp": datetime.utcnow().isoformat(),
+            "error": str(e),
+            "workspaces_checked": 0,
+            "workspaces": [],
+        }
+
+
 # Prompts commented out - FastMCP prompt API usage needs review
 # TODO: Implement prompts correctly in future version
 #
@@ -7,30 +7,97 @@ Provides functionality to explore and retrieve Microsoft Sentinel Analytics Rule
 - Filter rules by status, type, or workspace
 """
 
-from typing import List, Dict, Any, Optional
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 from datetime import datetime
+import asyncio
+import time
 import structlog
-from azure.mgmt.securityinsight import SecurityInsights
-from azure.core.exceptions import AzureError
 
-from utils.lighthouse import SentinelWorkspace, LighthouseManager
+from utils.lighthouse import SentinelWorkspace, LighthouseManager, is_access_denied_error
 from utils.auth import AzureAuthenticator
+from utils.circuit_breaker import TenantGuard, get_tenant_guard, guard_key
+from utils.config import get_settings
+from utils.snapshots import decode_cursor, encode_cursor, get_snapshot_store
+from utils.client_registry import SecurityInsightsClientRegistry, get_client_registry
+from utils.rule_catalog import CachedRule, get_rule_catalog
+from utils.rule_extraction import extract_rule_details, extract_rule_summary
+from utils.single_flight import get_single_flight, workspace_read_key
 
 logger = structlog.get_logger(__name__)
 
+# Fields of a rule summary, in output order; available to the fields projection
+RULE_SUMMARY_FIELDS = (
+    "rule_id",
+    "rule_name",
+    "kind",
+    "enabled",
+    "severity",
+    "tactics",
+    "techniques",
+    "description",
+    "last_modified",
+    "workspace_name",
+    "workspace_id",
+)
+
+# Fields shared by all rules of a workspace; columnar listings carry them once
+# on the workspace entry instead of in every row
+WORKSPACE_FIELDS = ("workspace_name", "workspace_id")
+
 
 class AnalyticsRulesExplorer:
     """Explores and retrieves Analytics Rules from Sentinel workspaces"""
 
-    def __init__(self, authenticator: AzureAuthenticator):
+    def __init__(
+        self,
+        authenticator: AzureAuthenticator,
+        client_registry: Optional[SecurityInsightsClientRegistry] = None,
+    ):
         """
         Initialize Analytics Rules Explorer
 
         Args:
             authenticator: AzureAuthenticator instance
+            client_registry: Optional client registry (defaults to the global one)
         """
         self.authenticator = authenticator
-        self.credential = authenticator.get_credential()
+        self.credential = authenticator.get_async_credential()
+        self.client_registry = client_registry or get_client_registry(self.credential)
+        self.single_flight = get_single_flight()
+        self.rule_catalog = get_rule_catalog()
+
+    async def get_catalog(self, workspace: SentinelWorkspace) -> List[CachedRule]:
+        """
+        Get the rule catalog entries of a workspace
+
+        Served from the catalog until its TTL expires; the workspace is then
+        re-listed (sharing any identical listing in flight) and only rules
+        whose etag changed get new entries.
+
+        Args:
+            workspace: SentinelWorkspace to query
+
+        Returns:
+            Catalog entries with the SDK rule objects
+        """
+        sentinel_client = self.client_registry.get_client(workspace.subscription_id)
+
+        async def fetch_rules():
+            return [
+                rule
+                async for rule in sentinel_client.alert_rules.list(
+                    resource_group_name=workspace.resource_group,
+                    workspace_name=workspace.workspace_name,
+                )
+            ]
+
+        return await self.rule_catalog.get_or_load(
+            workspace,
+            lambda: self.single_flight.do(
+                workspace_read_key("alert_rules.list", workspace), fetch_rules
+            ),
+        )
 
     async def list_rules(
         self,
@@ -54,34 +121,23 @@ class AnalyticsRulesExplorer:
         )
 
         try:
-            sentinel_client = SecurityInsights(
-                self.credential,
-                workspace.subscription_id,
-            )
-
-            # Get all alert rules
-            rules = list(
-                sentinel_client.alert_rules.list(
-                    resource_group_name=workspace.resource_group,
-                    workspace_name=workspace.workspace_name,
-                )
-            )
+            entries = await self.get_catalog(workspace)
 
             logger.info(
                 "Retrieved analytics rules",
                 workspace_name=workspace.workspace_name,
-                total_count=len(rules),
+                total_count=len(entries),
             )
 
             # Process rules into a standardized format
             rule_list = []
-            for rule in rules:
+            for entry in entries:
                 # Filter by enabled status if requested
-                enabled = getattr(rule, "enabled", False)
+                enabled = getattr(entry.rule, "enabled", False)
                 if enabled_only and not enabled:
                     continue
 
-                rule_info = self._extract_rule_summary(rule, workspace)
+                rule_info = self._cached_view(entry, "summary", workspace)
                 rule_list.append(rule_info)
 
             logger.info(
@@ -122,17 +178,20 @@ class AnalyticsRulesExplorer:
         )
 
         try:
-            sentinel_client = SecurityInsights(
-                self.credential,
-                workspace.subscription_id,
-            )
-
-            # Get the specific rule
-            rule = sentinel_client.alert_rules.get(
-                resource_group_name=workspace.resource_group,
-                workspace_name=workspace.workspace_name,
-                rule_id=rule_id,
-            )
+            entry = self.rule_catalog.get_rule(workspace, rule_id)
+            if entry is None:
+                sentinel_client = self.client_registry.get_client(workspace.subscription_id)
+
+                # Get the specific rule, sharing any identical read in flight
+                rule = await self.single_flight.do(
+                    workspace_read_key("alert_rules.get", workspace, rule_id=rule_id),
+                    lambda: sentinel_client.alert_rules.get(
+                        resource_group_name=workspace.resource_group,
+                        workspace_name=workspace.workspace_name,
+                        rule_id=rule_id,
+                    ),
+                )
+                entry = self.rule_catalog.put_rule(workspace, rule)
 
             logger.info(
                 "Retrieved rule details",
@@ -141,7 +200,7 @@ class AnalyticsRulesExplorer:
             )
 
             # Extract detailed information
-            rule_details = self._extract_rule_details(rule, workspace)
+            rule_details = self._cached_view(entry, "details", workspace)
 
             return rule_details
 
@@ -154,6 +213,27 @@ class AnalyticsRulesExplorer:
             )
             raise
 
+    def _cached_view(
+        self, entry: CachedRule, view: str, workspace: SentinelWorkspace
+    ) -> Dict[str, Any]:
+        """
+        Get the summary or details of a cached rule, extracting them only once
+        per rule version
+
+        Args:
+            entry: Catalog entry of the rule
+            view: "summary" or "details"
+            workspace: SentinelWorkspace the rule belongs to
+
+        Returns:
+            Extracted dictionary, shared with later calls (treated as read-only)
+        """
+        extracted = entry.derived.get(view)
+        if extracted is None:
+            extract = self._extract_rule_summary if view == "summary" else self._extract_rule_details
+            extracted = entry.derived[view] = extract(entry.rule, workspace)
+        return extracted
+
     def _extract_rule_summary(
         self, rule: Any, workspace: SentinelWorkspace
     ) -> Dict[str, Any]:
@@ -167,36 +247,7 @@ class AnalyticsRulesExplorer:
         Returns:
             Dictionary with rule summary information
         """
-        # Get the rule kind (type)
-        kind = getattr(rule, "kind", "Unknown")
-
-        # Basic information available for all rule types
-        summary = {
-            "rule_id": rule.name,
-            "rule_name": getattr(rule, "display_name", rule.name),
-            "kind": kind,
-            "enabled": getattr(rule, "enabled", False),
-            "workspace_name": workspace.workspace_name,
-            "workspace_id": workspace.workspace_id,
-        }
-
-        # Add type-specific information
-        if hasattr(rule, "severity"):
-            summary["severity"] = rule.severity
-
-        if hasattr(rule, "tactics"):
-            summary["tactics"] = rule.tactics if rule.tactics else []
-
-        if hasattr(rule, "techniques"):
-            summary["techniques"] = rule.techniques if rule.techniques else []
-
-        if hasattr(rule, "description"):
-            summary["description"] = rule.description
-
-        if hasattr(rule, "last_modified_utc"):
-            summary["last_modified"] = rule.last_modified_utc.isoformat() if rule.last_modified_utc else None
-
-        return summary
+        return extract_rule_summary(rule, workspace)
 
     def _extract_rule_details(
         self, rule: Any, workspace: SentinelWorkspace
@@ -211,118 +262,7 @@ class AnalyticsRulesExplorer:
         Returns:
             Dictionary with detailed rule information
         """
-        # Start with summary information
-        details = self._extract_rule_summary(rule, workspace)
-
-        # Get the rule kind
-        kind = getattr(rule, "kind", "Unknown")
-
-        # Add detailed configuration based on rule type
-        details["configuration"] = {}
-
-        # Scheduled query rules (most common type)
-        if kind == "Scheduled":
-            if hasattr(rule, "query"):
-                details["configuration"]["query"] = rule.query
-
-            if hasattr(rule, "query_frequency"):
-                details["configuration"]["query_frequency"] = str(rule.query_frequency)
-
-            if hasattr(rule, "query_period"):
-                details["configuration"]["query_period"] = str(rule.query_period)
-
-            if hasattr(rule, "trigger_operator"):
-                details["configuration"]["trigger_operator"] = rule.trigger_operator
-
-            if hasattr(rule, "trigger_threshold"):
-                details["configuration"]["trigger_threshold"] = rule.trigger_threshold
-
-            if hasattr(rule, "suppression_enabled"):
-                details["configuration"]["suppression_enabled"] = rule.suppression_enabled
-
-            if hasattr(rule, "suppression_duration"):
-                details["configuration"]["suppression_duration"] = str(rule.suppression_duration)
-
-        # Microsoft Security Incident Creation rules
-        elif kind == "MicrosoftSecurityIncidentCreation":
-            if hasattr(rule, "product_filter"):
-                details["configuration"]["product_filter"] = rule.product_filter
-
-            if hasattr(rule, "display_name_filter"):
-                details["configuration"]["display_name_filter"] = rule.display_name_filter
-
-        # Fusion rules
-        elif kind == "Fusion":
-            if hasattr(rule, "alert_rule_template_name"):
-                details["configuration"]["template_name"] = rule.alert_rule_template_name
-
-        # Machine Learning Behavioral Analytics
-        elif kind == "MLBehaviorAnalytics":
-            if hasattr(rule, "alert_rule_template_name"):
-                details["configuration"]["template_name"] = rule.alert_rule_template_name
-
-        # Add incident configuration if available
-        if hasattr(rule, "incident_configuration"):
-            incident_config = rule.incident_configuration
-            details["incident_configuration"] = {
-                "create_incident": getattr(incident_config, "create_incident", False),
-            }
-
-            if hasattr(incident_config, "grouping_configuration"):
-                grouping = incident_config.grouping_configuration
-                details["incident_configuration"]["grouping"] = {
-                    "enabled": getattr(grouping, "enabled", False),
-                    "reopen_closed_incidents": getattr(grouping, "reopen_closed_incident", False),
-                    "lookback_duration": str(getattr(grouping, "lookback_duration", "PT5H")),
-                    "matching_method": getattr(grouping, "matching_method", "AllEntities"),
-                }
-
-                if hasattr(grouping, "group_by_entities"):
-                    details["incident_configuration"]["grouping"]["group_by_entities"] = grouping.group_by_entities
-
-                if hasattr(grouping, "group_by_alert_details"):
-                    details["incident_configuration"]["grouping"]["group_by_alert_details"] = grouping.group_by_alert_details
-
-        # Add alert details configuration if available
-        if hasattr(rule, "alert_details_override"):
-            alert_override = rule.alert_details_override
-            details["alert_details_override"] = {}
-
-            if hasattr(alert_override, "alert_display_name_format"):
-                details["alert_details_override"]["display_name_format"] = alert_override.alert_display_name_format
-
-            if hasattr(alert_override, "alert_description_format"):
-                details["alert_details_override"]["description_format"] = alert_override.alert_description_format
-
-            if hasattr(alert_override, "alert_severity_column_name"):
-                details["alert_details_override"]["severity_column"] = alert_override.alert_severity_column_name
-
-            if hasattr(alert_override, "alert_tactics_column_name"):
-                details["alert_details_override"]["tactics_column"] = alert_override.alert_tactics_column_name
-
-        # Add entity mappings if available
-        if hasattr(rule, "entity_mappings") and rule.entity_mappings:
-            details["entity_mappings"] = []
-            for mapping in rule.entity_mappings:
-                entity_map = {
-                    "entity_type": getattr(mapping, "entity_type", None),
-                    "field_mappings": []
-                }
-
-                if hasattr(mapping, "field_mappings"):
-                    for field_map in mapping.field_mappings:
-                        entity_map["field_mappings"].append({
-                            "identifier": getattr(field_map, "identifier", None),
-                            "column_name": getattr(field_map, "column_name", None),
-                        })
-
-                details["entity_mappings"].append(entity_map)
-
-        # Add custom details if available
-        if hasattr(rule, "custom_details") and rule.custom_details:
-            details["custom_details"] = dict(rule.custom_details)
-
-        return details
+        return extract_rule_details(rule, workspace)
 
 
 async def list_analytics_rules(
@@ -331,20 +271,58 @@ async def list_analytics_rules(
     workspace_filter: Optional[str] = None,
     tenant_filter: Optional[str] = None,
     enabled_only: bool = False,
+    page_size: int = 0,
+    cursor: Optional[str] = None,
+    fields: Optional[List[str]] = None,
+    columnar: bool = False,
 ) -> Dict[str, Any]:
     """
     List analytics rules across workspaces
 
+    With a page_size, the full listing is kept as a server-side snapshot and
+    returned one page at a time; pass the returned next_cursor to get the
+    following page from memory without querying Azure again.
+
+    fields and columnar only shape the response, so they may differ between
+    pages of the same snapshot.
+
     Args:
         authenticator: AzureAuthenticator instance
         lighthouse_manager: LighthouseManager instance
         workspace_filter: Optional workspace name filter
         tenant_filter: Optional tenant name filter
         enabled_only: If True, only return enabled rules
+        page_size: Rules per page (0 returns the whole listing)
+        cursor: Cursor from a previous page; filters are taken from its snapshot
+        fields: Rule fields to return (see RULE_SUMMARY_FIELDS); rule_id is
+            always included. Defaults to all fields
+        columnar: If True, return column names once and each workspace's
+            rules as rows of values instead of objects
 
     Returns:
         Dictionary containing rules grouped by workspace
+
+    Raises:
+        ValueError: If page_size is negative, a field is unknown, or the
+            cursor is invalid or its snapshot has expired
     """
+    if page_size < 0:
+        raise ValueError("page_size must be 0 (no pagination) or a positive number of rules")
+    columns = _resolve_fields(fields)
+    snapshots = get_snapshot_store()
+    if cursor:
+        snapshot_id, offset, cursor_page_size = decode_cursor(cursor)
+        page_size = page_size or cursor_page_size
+        if offset < 0 or page_size <= 0:
+            raise ValueError("Invalid cursor")
+        listing = snapshots.get(snapshot_id)
+        if listing is None:
+            raise ValueError(
+                "Cursor has expired; repeat the listing without a cursor to start over"
+            )
+        page = _paginate_listing(listing, snapshot_id, offset, page_size)
+        return _format_listing(page, columns, columnar)
+
     logger.info(
         "Listing analytics rules across workspaces",
         workspace_filter=workspace_filter,
@@ -354,66 +332,305 @@ async def list_analytics_rules(
 
     explorer = AnalyticsRulesExplorer(authenticator)
 
-    # Get workspaces
-    workspaces = await lighthouse_manager.get_sentinel_workspaces()
+    started = time.monotonic()
+    outcomes = await run_per_workspace(
+        lighthouse_manager,
+        lambda workspace: explorer.list_rules(workspace, enabled_only=enabled_only),
+        workspace_filter=workspace_filter,
+        tenant_filter=tenant_filter,
+    )
 
-    # Apply filters
-    if tenant_filter:
-        workspaces = [
-            ws
-            for ws in workspaces
-            if ws.tenant_name and tenant_filter.lower() in ws.tenant_name.lower()
-        ]
+    results = []
+    for outcome in outcomes:
+        if outcome.error is not None:
+            results.append(
+                _workspace_error_result(outcome.workspace, outcome.error, outcome.duration_ms)
+            )
+            continue
+        results.append({
+            "workspace_name": outcome.workspace.workspace_name,
+            "workspace_id": outcome.workspace.workspace_id,
+            "tenant_name": outcome.workspace.tenant_name,
+            "rules_count": len(outcome.result),
+            "rules": outcome.result,
+            "duration_ms": outcome.duration_ms,
+        })
+    total_rules = sum(r["rules_count"] for r in results)
+
+    logger.info("Workspaces queried", count=len(outcomes))
+
+    listing = {
+        "timestamp": datetime.utcnow().isoformat(),
+        "workspaces_queried": len(outcomes),
+        "total_rules": total_rules,
+        "enabled_only": enabled_only,
+        "duration_ms": _elapsed_ms(started),
+        "workspaces": results,
+    }
+    if page_size:
+        listing = _paginate_listing(listing, snapshots.put(listing), 0, page_size)
 
-    if workspace_filter:
-        workspaces = [
-            ws
-            for ws in workspaces
-            if workspace_filter.lower() in ws.workspace_name.lower()
-        ]
+    return _format_listing(listing, columns, columnar)
 
-    logger.info("Workspaces to query", count=len(workspaces))
 
-    # Collect rules from all workspaces
-    results = []
-    total_rules = 0
+@dataclass
+class WorkspaceOutcome:
+    """Result of running an operation on one workspace of a fan-out"""
 
-    for workspace in workspaces:
-        try:
-            rules = await explorer.list_rules(workspace, enabled_only=enabled_only)
+    workspace: SentinelWorkspace
+    result: Any = None
+    error: Optional[str] = None
+    duration_ms: float = 0.0
+
+
+async def run_guarded(
+    lighthouse_manager: LighthouseManager,
+    workspace: SentinelWorkspace,
+    operation: Callable[[SentinelWorkspace], Awaitable[Any]],
+    tenant_guard: TenantGuard,
+    timeout: float,
+) -> WorkspaceOutcome:
+    """
+    Run an operation on one workspace under its tenant guard
+
+    Workspaces with a cached access denial or an open circuit are skipped.
+    The operation runs inside the bulkhead with one deadline; failures are
+    recorded on the circuit breaker, and access denials on the workspace
+    access cache.
+
+    Args:
+        lighthouse_manager: LighthouseManager instance
+        workspace: Workspace to run on
+        operation: Coroutine function called with the workspace
+        tenant_guard: TenantGuard instance
+        timeout: Deadline for the operation, in seconds
+
+    Returns:
+        Outcome of the operation
+    """
+    # Skip workspaces already known to deny access
+    if lighthouse_manager.is_access_denied(workspace):
+        return WorkspaceOutcome(
+            workspace, error="Access denied (cached result, workspace skipped)"
+        )
 
-            workspace_result = {
-                "workspace_name": workspace.workspace_name,
-                "workspace_id": workspace.workspace_id,
-                "tenant_name": workspace.tenant_name,
-                "rules_count": len(rules),
-                "rules": rules,
-            }
+    key = guard_key(workspace)
 
-            results.append(workspace_result)
-            total_rules += len(rules)
+    # Skip tenants that keep failing, without waiting for a worker
+    if tenant_guard.is_open(key):
+        return WorkspaceOutcome(workspace, error=tenant_guard.open_circuit_message(key))
 
+    async with tenant_guard.bulkhead(key):
+        if not tenant_guard.allow(key):
+            return WorkspaceOutcome(workspace, error=tenant_guard.open_circuit_message(key))
+
+        started = time.monotonic()
+        try:
+            result = await asyncio.wait_for(operation(workspace), timeout=timeout)
         except Exception as e:
+            duration_ms = _elapsed_ms(started)
+            error = (
+                f"Timed out after {timeout}s"
+                if isinstance(e, asyncio.TimeoutError)
+                else str(e)
+            )
             logger.error(
-                "Failed to list rules for workspace",
+                "Workspace rule operation failed",
                 workspace_name=workspace.workspace_name,
-                error=str(e),
+                error=error,
+                duration_ms=duration_ms,
             )
-            results.append({
-                "workspace_name": workspace.workspace_name,
-                "workspace_id": workspace.workspace_id,
-                "tenant_name": workspace.tenant_name,
-                "rules_count": 0,
-                "rules": [],
-                "error": str(e),
+            tenant_guard.record_failure(key)
+            if is_access_denied_error(e):
+                lighthouse_manager.record_workspace_access(workspace, False)
+            return WorkspaceOutcome(workspace, error=error, duration_ms=duration_ms)
+
+    tenant_guard.record_success(key)
+    return WorkspaceOutcome(workspace, result=result, duration_ms=_elapsed_ms(started))
+
+
+async def run_per_workspace(
+    lighthouse_manager: LighthouseManager,
+    operation: Callable[[SentinelWorkspace], Awaitable[Any]],
+    workspace_filter: Optional[str] = None,
+    tenant_filter: Optional[str] = None,
+) -> List[WorkspaceOutcome]:
+    """
+    Run an operation concurrently on every matching workspace
+
+    Each workspace starts as soon as it is discovered, so enumeration overlaps
+    with the operation. Workspaces with a cached access denial or an open
+    tenant circuit are skipped; the rest run under the tenant bulkheads with a
+    QUERY_TIMEOUT_SECONDS deadline each. A failing workspace only affects its
+    own outcome.
+
+    Args:
+        lighthouse_manager: LighthouseManager instance
+        operation: Coroutine function called with each workspace
+        workspace_filter: Optional workspace name filter
+        tenant_filter: Optional tenant name filter
+
+    Returns:
+        One outcome per workspace, sorted by tenant and workspace name
+    """
+    tenant_guard = get_tenant_guard()
+    timeout = get_settings().query_timeout_seconds
+
+    async def run(workspace: SentinelWorkspace) -> WorkspaceOutcome:
+        return await run_guarded(lighthouse_manager, workspace, operation, tenant_guard, timeout)
+
+    tasks = []
+    try:
+        async for workspace in lighthouse_manager.iter_sentinel_workspaces(
+            workspace_filter=workspace_filter,
+            tenant_filter=tenant_filter,
+        ):
+            tasks.append(asyncio.create_task(run(workspace)))
+
+        outcomes = list(await asyncio.gather(*tasks))
+    finally:
+        for pending in tasks:
+            pending.cancel()
+
+    # Discovery order varies between runs, so sort for a stable response
+    outcomes.sort(
+        key=lambda o: (
+            (o.workspace.tenant_name or "").lower(),
+            o.workspace.workspace_name.lower(),
+            o.workspace.workspace_id.lower(),
+        )
+    )
+    return outcomes
+
+
+def _resolve_fields(fields: Optional[List[str]]) -> Optional[List[str]]:
+    """
+    Validate a fields projection
+
+    Args:
+        fields: Requested rule fields, or None/empty for all fields
+
+    Returns:
+        Ordered, de-duplicated fields starting with rule_id, or None for all
+
+    Raises:
+        ValueError: If a field is unknown
+    """
+    if not fields:
+        return None
+
+    unknown = [field for field in fields if field not in RULE_SUMMARY_FIELDS]
+    if unknown:
+        raise ValueError(
+            f"Unknown rule field(s): {', '.join(unknown)}. "
+            f"Available fields: {', '.join(RULE_SUMMARY_FIELDS)}"
+        )
+    return list(dict.fromkeys(["rule_id", *fields]))
+
+
+def _format_listing(
+    listing: Dict[str, Any], fields: Optional[List[str]], columnar: bool
+) -> Dict[str, Any]:
+    """
+    Apply a fields projection and/or the columnar layout to a listing
+
+    Args:
+        listing: Listing (or page) built from full rule summaries
+        fields: Fields to keep, or None for all
+        columnar: If True, replace each workspace's rules with rows, leaving
+            the workspace fields on the workspace entry only
+
+    Returns:
+        The listing unchanged if neither option is set, otherwise a new
+        listing; columnar listings carry the column names in "columns"
+    """
+    if fields is None and not columnar:
+        return listing
+
+    columns = fields or list(RULE_SUMMARY_FIELDS)
+    if columnar:
+        columns = [column for column in columns if column not in WORKSPACE_FIELDS]
+    workspaces = []
+    for workspace_result in listing["workspaces"]:
+        formatted = dict(workspace_result)
+        rules = formatted.pop("rules")
+        if columnar:
+            formatted["rows"] = [[rule.get(column) for column in columns] for rule in rules]
+        else:
+            formatted["rules"] = [
+                {column: rule[column] for column in columns if column in rule}
+                for rule in rules
+            ]
+        workspaces.append(formatted)
+
+    formatted_listing = {**listing, "workspaces": workspaces}
+    if columnar:
+        formatted_listing["columns"] = columns
+    return formatted_listing
+
+
+def _paginate_listing(
+    listing: Dict[str, Any], snapshot_id: str, offset: int, page_size: int
+) -> Dict[str, Any]:
+    """
+    Cut one page out of a rules listing snapshot
+
+    Pages hold page_size rules; a workspace without rules (or with an error)
+    takes one slot so it still appears exactly once. A workspace spread over
+    several pages appears on each with its share of the rules.
+
+    Args:
+        listing: Full listing returned by list_analytics_rules
+        snapshot_id: ID of the listing in the snapshot store
+        offset: Index of the first slot of the page
+        page_size: Slots per page
+
+    Returns:
+        Listing with only this page's workspaces and rules, plus next_cursor
+    """
+    page: List[Dict[str, Any]] = []
+    position = 0
+    end = offset + page_size
+
+    for workspace_result in listing["workspaces"]:
+        rules = workspace_result["rules"]
+        slots = max(1, len(rules))
+        if position + slots > offset and position < end:
+            start_index = max(0, offset - position)
+            page.append({
+                **workspace_result,
+                "rules": rules[start_index:end - position],
             })
+        position += slots
+        if position >= end:
+            break
 
+    total_slots = sum(max(1, len(ws["rules"])) for ws in listing["workspaces"])
     return {
-        "timestamp": datetime.utcnow().isoformat(),
-        "workspaces_queried": len(workspaces),
-        "total_rules": total_rules,
-        "enabled_only": enabled_only,
-        "workspaces": results,
+        **listing,
+        "workspaces": page,
+        "page_size": page_size,
+        "next_cursor": encode_cursor(snapshot_id, end, page_size) if end < total_slots else None,
+    }
+
+
+def _elapsed_ms(started: float) -> float:
+    """Milliseconds elapsed since a time.monotonic() reading"""
+    return round((time.monotonic() - started) * 1000, 1)
+
+
+def _workspace_error_result(
+    workspace: SentinelWorkspace, error: str, duration_ms: float = 0.0
+) -> Dict[str, Any]:
+    """Build the rule listing entry for a workspace that returned no rules"""
+    return {
+        "workspace_name": workspace.workspace_name,
+        "workspace_id": workspace.workspace_id,
+        "tenant_name": workspace.tenant_name,
+        "rules_count": 0,
+        "rules": [],
+        "duration_ms": duration_ms,
+        "error": error,
     }
 
 
@@ -422,21 +639,29 @@ async def get_analytics_rule_details(
     lighthouse_manager: LighthouseManager,
     workspace_name: str,
     rule_id: str,
+    subscription_id: Optional[str] = None,
+    resource_group: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
     Get detailed information about a specific analytics rule
 
+    A full workspace resource ID, or a workspace name with subscription and
+    resource group, is resolved without enumerating workspaces, so the
+    lookup costs a single rule GET.
+
     Args:
         authenticator: AzureAuthenticator instance
         lighthouse_manager: LighthouseManager instance
-        workspace_name: Name of the workspace containing the rule
+        workspace_name: Name or full resource ID of the workspace containing the rule
         rule_id: The rule ID to retrieve
+        subscription_id: Optional subscription ID of the workspace
+        resource_group: Optional resource group of the workspace
 
     Returns:
         Detailed rule information
 
     Raises:
-        ValueError: If workspace not found
+        ValueError: If workspace not found or its resource ID is malformed
     """
     logger.info(
         "Getting analytics rule details",
@@ -447,13 +672,9 @@ async def get_analytics_rule_details(
     explorer = AnalyticsRulesExplorer(authenticator)
 
     # Find the workspace
-    workspaces = await lighthouse_manager.get_sentinel_workspaces()
-    workspace = None
-
-    for ws in workspaces:
-        if ws.workspace_name.lower() == workspace_name.lower():
-            workspace = ws
-            break
+    workspace = await lighthouse_manager.resolve_workspace(
+        workspace_name, subscription_id=subscription_id, resource_group=resource_group
+    )
 
     if not workspace:
         raise ValueError(f"Workspace '{workspace_name}' not found")
@@ -465,3 +686,157 @@ async def get_analytics_rule_details(
         "timestamp": datetime.utcnow().isoformat(),
         "rule": rule_details,
     }
+
+
+# Most rules a single batch request may ask for
+MAX_BATCH_RULES = 100
+
+
+async def get_analytics_rule_details_batch(
+    authenticator: AzureAuthenticator,
+    lighthouse_manager: LighthouseManager,
+    rules: List[Dict[str, str]],
+) -> Dict[str, Any]:
+    """
+    Get detailed information about several analytics rules at once
+
+    Requests are grouped by workspace: each distinct workspace address is
+    resolved once, items are grouped by the resolved workspace (so a name and
+    a resource ID of the same workspace share a group), and a workspace asked
+    for more than one rule is listed once (through the rule
+    catalog) instead of fetching each rule separately. Workspaces are
+    processed concurrently through run_guarded (access-denial cache, tenant
+    circuit breakers and bulkheads, one QUERY_TIMEOUT_SECONDS deadline per
+    workspace), and their rules concurrently within each workspace.
+
+    Args:
+        authenticator: AzureAuthenticator instance
+        lighthouse_manager: LighthouseManager instance
+        rules: Items with "workspace" (name or resource ID) and "rule_id", and
+            optionally "subscription_id" and "resource_group"
+
+    Returns:
+        Dictionary with one result per item, in request order; failed items
+        carry an error instead of the rule
+
+    Raises:
+        ValueError: If the batch is empty, too large or has malformed items
+    """
+    if not rules:
+        raise ValueError("No rules requested")
+    if len(rules) > MAX_BATCH_RULES:
+        raise ValueError(f"At most {MAX_BATCH_RULES} rules can be requested at once")
+    for position, item in enumerate(rules):
+        if not item.get("workspace") or not item.get("rule_id"):
+            raise ValueError(f"Item {position} needs both 'workspace' and 'rule_id'")
+
+    logger.info("Getting analytics rule details in batch", count=len(rules))
+
+    explorer = AnalyticsRulesExplorer(authenticator)
+    tenant_guard = get_tenant_guard()
+    timeout = get_settings().query_timeout_seconds
+
+    addresses: Dict[tuple, List[int]] = {}
+    for position, item in enumerate(rules):
+        address = (
+            item["workspace"].lower(),
+            (item.get("subscription_id") or "").lower(),
+            (item.get("resource_group") or "").lower(),
+        )
+        addresses.setdefault(address, []).append(position)
+
+    results: List[Optional[Dict[str, Any]]] = [None] * len(rules)
+
+    def set_error(position: int, error: str) -> None:
+        item = rules[position]
+        results[position] = {
+            "workspace": item["workspace"],
+            "rule_id": item["rule_id"],
+            "error": error,
+        }
+
+    async def resolve(positions: List[int]) -> Optional[SentinelWorkspace]:
+        first = rules[positions[0]]
+        try:
+            workspace = await lighthouse_manager.resolve_workspace(
+                first["workspace"],
+                subscription_id=first.get("subscription_id") or None,
+                resource_group=first.get("resource_group") or None,
+            )
+        except Exception as e:
+            workspace, error = None, str(e)
+        else:
+            error = f"Workspace '{first['workspace']}' not found"
+        if workspace is None:
+            for position in positions:
+                set_error(position, error)
+        return workspace
+
+    async def fetch_rules(workspace: SentinelWorkspace, positions: List[int]) -> None:
+        if len(positions) > 1:
+            # One listing fills the catalog for all of this workspace's rules
+            await explorer.get_catalog(workspace)
+        fetched = await asyncio.gather(
+            *(explorer.get_rule_details(workspace, rules[p]["rule_id"]) for p in positions),
+            return_exceptions=True,
+        )
+        for position, rule in zip(positions, fetched):
+            if isinstance(rule, Exception):
+                # A denial applies to the whole workspace
+                if is_access_denied_error(rule):
+                    raise rule
+                set_error(position, str(rule))
+            else:
+                item = rules[position]
+                results[position] = {
+                    "workspace": item["workspace"],
+                    "rule_id": item["rule_id"],
+                    "rule": rule,
+                }
+
+    async def fetch_group(workspace: SentinelWorkspace, positions: List[int]) -> None:
+        outcome = await run_guarded(
+            lighthouse_manager,
+            workspace,
+            lambda ws: fetch_rules(ws, positions),
+            tenant_guard,
+            timeout,
+        )
+        if outcome.error is not None:
+            for position in positions:
+                if results[position] is None:
+                    set_error(position, outcome.error)
+
+    started = time.monotonic()
+    resolved = await asyncio.gather(*(resolve(positions) for positions in addresses.values()))
+
+    # Different spellings (name, resource ID, name with subscription) of one
+    # workspace share a group, so it is listed and guarded only once
+    groups: Dict[str, List[int]] = {}
+    workspaces: Dict[str, SentinelWorkspace] = {}
+    for workspace, positions in zip(resolved, addresses.values()):
+        if workspace is not None:
+            key = workspace.workspace_id.lower()
+            workspaces.setdefault(key, workspace)
+            groups.setdefault(key, []).extend(positions)
+
+    await asyncio.gather(
+        *(fetch_group(workspaces[key], sorted(positions)) for key, positions in groups.items())
+    )
+
+    failed = sum(1 for result in results if "error" in result)
+    logger.info(
+        "Batch rule details retrieved",
+        requested=len(rules),
+        workspaces=len(groups),
+        failed=failed,
+    )
+
+    return {
+        "timestamp": datetime.utcnow().isoformat(),
+        "requested": len(rules),
+        "succeeded": len(rules) - failed,
+        "failed": failed,
+        "duration_ms": _elapsed_ms(started),
+        "results": results,
+    }
@@ -0,0 +1,96 @@
+"""
+Sentinel ATT&CK Coverage Tool
+
+Aggregates the MITRE ATT&CK tactics and techniques of analytics rules
+across workspaces and tenants:
+- Coverage per workspace (enabled rules only) and techniques covered only by disabled rules
+- Per-tenant gaps against what the rest of the fleet covers
+- Fleet-wide technique and tactic heatmaps
+"""
+
+from typing import Any, Dict, Optional
+from datetime import datetime
+import time
+import structlog
+
+from utils.lighthouse import LighthouseManager
+from utils.auth import AzureAuthenticator
+from utils.coverage_matrix import CoverageMatrix
+from mcp_server.tools.exploration.analytics_rules import (
+    AnalyticsRulesExplorer,
+    run_per_workspace,
+)
+
+logger = structlog.get_logger(__name__)
+
+
+async def get_attack_coverage(
+    authenticator: AzureAuthenticator,
+    lighthouse_manager: LighthouseManager,
+    workspace_filter: Optional[str] = None,
+    tenant_filter: Optional[str] = None,
+    include_heatmap: bool = True,
+) -> Dict[str, Any]:
+    """
+    Build the ATT&CK coverage matrix across workspaces
+
+    Args:
+        authenticator: AzureAuthenticator instance
+        lighthouse_manager: LighthouseManager instance
+        workspace_filter: Optional workspace name filter
+        tenant_filter: Optional tenant name filter
+        include_heatmap: If True, include the per-technique and per-tactic heatmaps
+
+    Returns:
+        Dictionary with workspace coverage, tenant gaps and heatmaps
+    """
+    logger.info(
+        "Building ATT&CK coverage",
+        workspace_filter=workspace_filter,
+        tenant_filter=tenant_filter,
+    )
+
+    explorer = AnalyticsRulesExplorer(authenticator)
+
+    started = time.monotonic()
+    outcomes = await run_per_workspace(
+        lighthouse_manager,
+        explorer.get_catalog,
+        workspace_filter=workspace_filter,
+        tenant_filter=tenant_filter,
+    )
+
+    errors = [
+        {
+            "workspace_name": outcome.workspace.workspace_name,
+            "workspace_id": outcome.workspace.workspace_id,
+            "tenant_name": outcome.workspace.tenant_name,
+            "error": outcome.error,
+        }
+        for outcome in outcomes
+        if outcome.error is not None
+    ]
+    matrix = CoverageMatrix(
+        (outcome.workspace, outcome.result) for outcome in outcomes if outcome.error is None
+    )
+
+    logger.info(
+        "ATT&CK coverage built",
+        workspaces=len(matrix.workspaces),
+        techniques=len(matrix.techniques),
+    )
+
+    result = {
+        "timestamp": datetime.utcnow().isoformat(),
+        "workspaces_queried": len(outcomes),
+        "techniques_total": len(matrix.techniques),
+        "techniques_covered": int(matrix.fleet_covered().sum()),
+        "duration_ms": round((time.monotonic() - started) * 1000, 1),
+        "workspaces": matrix.workspace_summary(),
+        "tenants": matrix.tenant_gaps(),
+        "errors": errors,
+    }
+    if include_heatmap:
+        result["heatmap"] = matrix.heatmap()
+        result["tactics"] = matrix.tactic_heatmap()
+    return result
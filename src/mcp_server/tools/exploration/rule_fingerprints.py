@@ -0,0 +1,381 @@
+"""
+Sentinel Rule Fingerprint Tool
+
+Compares detection deployments across workspaces and tenants:
+- Fingerprint Scheduled rules by normalized KQL query, frequency, period and threshold
+- Index fingerprints from the rule catalog of every workspace
+- Report which workspaces run a rule as-is, run a variant, or lack it
+"""
+
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+from datetime import datetime
+import hashlib
+import json
+import time
+import structlog
+
+from utils.lighthouse import SentinelWorkspace, LighthouseManager
+from utils.auth import AzureAuthenticator
+from utils.rule_catalog import CachedRule
+from mcp_server.tools.exploration.analytics_rules import (
+    AnalyticsRulesExplorer,
+    run_per_workspace,
+)
+
+logger = structlog.get_logger(__name__)
+
+# Rule settings that make up a fingerprint, in hashing order
+FINGERPRINT_COMPONENTS = (
+    "query",
+    "query_frequency",
+    "query_period",
+    "trigger_operator",
+    "trigger_threshold",
+)
+
+
+@dataclass
+class RuleFingerprint:
+    """Fingerprint of a Scheduled rule's detection logic"""
+
+    # Key shared by deployments of the same detection (template or display name)
+    identity: str
+    digest: str
+    components: Dict[str, Any]
+
+
+@dataclass
+class IndexedRule:
+    """A fingerprinted rule in one workspace"""
+
+    workspace: SentinelWorkspace
+    rule_id: str
+    rule_name: str
+    enabled: bool
+    fingerprint: RuleFingerprint
+
+
+def normalize_query(query: str) -> str:
+    """
+    Normalize a KQL query so formatting changes do not alter its fingerprint
+
+    Removes ``//`` comments outside string literals and collapses all runs of
+    whitespace to a single space. In verbatim strings (``@"..."``,
+    ``@'...'``) a backslash is literal and a doubled quote escapes the quote.
+
+    Args:
+        query: KQL query text
+
+    Returns:
+        Normalized query
+    """
+    kept = []
+    quote = None
+    verbatim = False
+    i = 0
+    while i < len(query):
+        char = query[i]
+        if quote:
+            kept.append(char)
+            if char == "\\" and not verbatim and i + 1 < len(query):
+                kept.append(query[i + 1])
+                i += 1
+            elif char == quote:
+                if verbatim and query.startswith(quote, i + 1):
+                    kept.append(quote)
+                    i += 1
+                else:
+                    quote = None
+        elif char in ("'", '"'):
+            quote = char
+            verbatim = query[i - 1 : i] == "@"
+            kept.append(char)
+        elif query.startswith("//", i):
+            end = query.find("\n", i)
+            i = len(query) if end == -1 else end
+            continue
+        else:
+            kept.append(char)
+        i += 1
+    return " ".join("".join(kept).split())
+
+
+def fingerprint_rule(rule: Any) -> Optional[RuleFingerprint]:
+    """
+    Fingerprint a Scheduled rule
+
+    Args:
+        rule: Alert rule object from Azure SDK
+
+    Returns:
+        RuleFingerprint, or None for other rule kinds and rules without a query
+    """
+    if getattr(rule, "kind", None) != "Scheduled" or not getattr(rule, "query", None):
+        return None
+
+    components = {}
+    for name in FINGERPRINT_COMPONENTS:
+        value = getattr(rule, name, None)
+        if name == "query":
+            value = normalize_query(value)
+        elif value is not None and not isinstance(value, int):
+            value = str(getattr(value, "value", value))
+        components[name] = value
+
+    payload = json.dumps([components[name] for name in FINGERPRINT_COMPONENTS])
+    identity = getattr(rule, "alert_rule_template_name", None) or getattr(
+        rule, "display_name", None
+    ) or rule.name
+    return RuleFingerprint(
+        identity=identity.strip().lower(),
+        digest=hashlib.sha256(payload.encode()).hexdigest()[:16],
+        components=components,
+    )
+
+
+def cached_fingerprint(entry: CachedRule) -> Optional[RuleFingerprint]:
+    """Get the fingerprint of a catalog entry, computed once per rule version"""
+    if "fingerprint" not in entry.derived:
+        entry.derived["fingerprint"] = fingerprint_rule(entry.rule)
+    return entry.derived["fingerprint"]
+
+
+class RuleFingerprintIndex:
+    """Index of Scheduled rule fingerprints across workspaces"""
+
+    def __init__(self):
+        """Initialize an empty index"""
+        self.workspaces: List[SentinelWorkspace] = []
+        self.rules: List[IndexedRule] = []
+        self._by_identity: Dict[str, List[IndexedRule]] = defaultdict(list)
+        self._by_digest: Dict[str, List[IndexedRule]] = defaultdict(list)
+        self._by_rule_id: Dict[str, List[IndexedRule]] = defaultdict(list)
+
+    def add_workspace(self, workspace: SentinelWorkspace, entries: List[CachedRule]) -> None:
+        """
+        Index the Scheduled rules of a workspace
+
+        Args:
+            workspace: Workspace the rules belong to
+            entries: The workspace's rule catalog entries
+        """
+        self.workspaces.append(workspace)
+        for entry in entries:
+            fingerprint = cached_fingerprint(entry)
+            if fingerprint is None:
+                continue
+            indexed = IndexedRule(
+                workspace=workspace,
+                rule_id=entry.rule.name,
+                rule_name=getattr(entry.rule, "display_name", None) or entry.rule.name,
+                enabled=bool(getattr(entry.rule, "enabled", False)),
+                fingerprint=fingerprint,
+            )
+            self.rules.append(indexed)
+            self._by_identity[fingerprint.identity].append(indexed)
+            self._by_digest[fingerprint.digest].append(indexed)
+            self._by_rule_id[indexed.rule_id.lower()].append(indexed)
+
+    def lookup(self, rule: str) -> List[IndexedRule]:
+        """
+        Find indexed rules by fingerprint, rule ID, template name or display name
+
+        Args:
+            rule: Fingerprint digest, rule ID, template name or display name
+
+        Returns:
+            Matching indexed rules (empty if none)
+        """
+        key = rule.strip().lower()
+        return list(
+            self._by_digest.get(key)
+            or self._by_rule_id.get(key)
+            or self._by_identity.get(key)
+            or []
+        )
+
+    def compare(self, rule: str, reference_workspace: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Compare the deployments of a detection across the indexed workspaces
+
+        The baseline version is the given fingerprint, else the rule in
+        reference_workspace, else the most common fingerprint.
+
+        Args:
+            rule: Fingerprint digest, rule ID, template name or display name
+            reference_workspace: Optional workspace name or ID holding the baseline
+
+        Returns:
+            Dictionary with the baseline fingerprint and the identical,
+            variant and missing workspaces
+
+        Raises:
+            ValueError: If no Scheduled rule matches, the reference workspace
+                does not have it, or a reference workspace is given with a
+                fingerprint
+        """
+        matches = self.lookup(rule)
+        if not matches:
+            raise ValueError(f"No Scheduled rule matches '{rule}'")
+
+        identities = {match.fingerprint.identity for match in matches}
+        deployments = [
+            indexed for identity in sorted(identities) for indexed in self._by_identity[identity]
+        ]
+
+        if rule.strip().lower() in self._by_digest:
+            if reference_workspace:
+                raise ValueError(
+                    "A fingerprint is its own baseline; pass a rule ID, template name "
+                    "or display name to compare against reference_workspace"
+                )
+            baseline = matches[0].fingerprint
+        elif reference_workspace:
+            reference = reference_workspace.lower()
+            baseline = next(
+                (
+                    indexed.fingerprint
+                    for indexed in deployments
+                    if reference
+                    in (indexed.workspace.workspace_name.lower(), indexed.workspace.workspace_id.lower())
+                ),
+                None,
+            )
+            if baseline is None:
+                raise ValueError(f"Workspace '{reference_workspace}' has no rule matching '{rule}'")
+        else:
+            digest = Counter(match.fingerprint.digest for match in matches).most_common(1)[0][0]
+            baseline = self._by_digest[digest][0].fingerprint
+
+        identical = []
+        variants = []
+        for indexed in sorted(deployments, key=self._sort_key):
+            if indexed.fingerprint.digest == baseline.digest:
+                identical.append(self._deployment(indexed))
+            else:
+                variant = self._deployment(indexed)
+                variant["differences"] = [
+                    name
+                    for name in FINGERPRINT_COMPONENTS
+                    if indexed.fingerprint.components[name] != baseline.components[name]
+                ]
+                variants.append(variant)
+
+        deployed = {indexed.workspace.workspace_id.lower() for indexed in deployments}
+        missing = [
+            _workspace_ref(workspace)
+            for workspace in self.workspaces
+            if workspace.workspace_id.lower() not in deployed
+        ]
+
+        return {
+            "fingerprint": baseline.digest,
+            "baseline": baseline.components,
+            "identical": identical,
+            "variants": variants,
+            "missing": missing,
+        }
+
+    @staticmethod
+    def _sort_key(indexed: IndexedRule):
+        return (
+            (indexed.workspace.tenant_name or "").lower(),
+            indexed.workspace.workspace_name.lower(),
+            indexed.rule_id.lower(),
+        )
+
+    @staticmethod
+    def _deployment(indexed: IndexedRule) -> Dict[str, Any]:
+        return {
+            **_workspace_ref(indexed.workspace),
+            "rule_id": indexed.rule_id,
+            "rule_name": indexed.rule_name,
+            "enabled": indexed.enabled,
+            "fingerprint": indexed.fingerprint.digest,
+        }
+
+
+def _workspace_ref(workspace: SentinelWorkspace) -> Dict[str, Any]:
+    """Identify a workspace in tool output"""
+    return {
+        "workspace_name": workspace.workspace_name,
+        "workspace_id": workspace.workspace_id,
+        "tenant_name": workspace.tenant_name,
+    }
+
+
+async def compare_rule_deployments(
+    authenticator: AzureAuthenticator,
+    lighthouse_manager: LighthouseManager,
+    rule: str,
+    reference_workspace: Optional[str] = None,
+    workspace_filter: Optional[str] = None,
+    tenant_filter: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Find which workspaces run a detection, a variant of it, or lack it
+
+    The fingerprint index is built from the rule catalog of every matching
+    workspace; fingerprints are computed once per rule version.
+
+    Args:
+        authenticator: AzureAuthenticator instance
+        lighthouse_manager: LighthouseManager instance
+        rule: Fingerprint digest, rule ID, template name or display name
+        reference_workspace: Optional workspace whose version is the baseline
+        workspace_filter: Optional workspace name filter
+        tenant_filter: Optional tenant name filter
+
+    Returns:
+        Dictionary with the baseline fingerprint, identical, variant and
+        missing workspaces, and workspaces that could not be indexed
+
+    Raises:
+        ValueError: If no Scheduled rule matches
+    """
+    logger.info(
+        "Comparing rule deployments",
+        rule=rule,
+        workspace_filter=workspace_filter,
+        tenant_filter=tenant_filter,
+    )
+
+    explorer = AnalyticsRulesExplorer(authenticator)
+
+    started = time.monotonic()
+    outcomes = await run_per_workspace(
+        lighthouse_manager,
+        explorer.get_catalog,
+        workspace_filter=workspace_filter,
+        tenant_filter=tenant_filter,
+    )
+
+    index = RuleFingerprintIndex()
+    errors = []
+    for outcome in outcomes:
+        if outcome.error is not None:
+            errors.append({**_workspace_ref(outcome.workspace), "error": outcome.error})
+        else:
+            index.add_workspace(outcome.workspace, outcome.result)
+
+    comparison = index.compare(rule, reference_workspace)
+
+    logger.info(
+        "Rule deployments compared",
+        rule=rule,
+        identical=len(comparison["identical"]),
+        variants=len(comparison["variants"]),
+        missing=len(comparison["missing"]),
+    )
+
+    return {
+        "timestamp": datetime.utcnow().isoformat(),
+        "rule": rule,
+        "workspaces_queried": len(outcomes),
+        "scheduled_rules_indexed": len(index.rules),
+        "duration_ms": round((time.monotonic() - started) * 1000, 1),
+        **comparison,
+        "errors": errors,
+    }
@@ -0,0 +1,125 @@
+"""
+Sentinel Rule Search Tool
+
+Full-text search over analytics rules across all workspaces and tenants:
+- Search rule names, descriptions, KQL queries and referenced tables
+- Served from an in-memory inverted index kept in sync with the rule catalog
+"""
+
+from typing import Any, Dict, List, Optional
+from datetime import datetime
+import time
+import structlog
+
+from utils.lighthouse import LighthouseManager
+from utils.auth import AzureAuthenticator
+from utils.search_index import get_search_index, parse_search
+from mcp_server.tools.exploration.analytics_rules import (
+    AnalyticsRulesExplorer,
+    run_per_workspace,
+)
+
+logger = structlog.get_logger(__name__)
+
+
+async def search_analytics_rules(
+    authenticator: AzureAuthenticator,
+    lighthouse_manager: LighthouseManager,
+    text: str,
+    fields: Optional[List[str]] = None,
+    workspace_filter: Optional[str] = None,
+    tenant_filter: Optional[str] = None,
+    limit: int = 50,
+) -> Dict[str, Any]:
+    """
+    Search analytics rules across workspaces
+
+    Each matching workspace's rule catalog is synced into the search index
+    first; only rules whose catalog entry changed are re-indexed, so repeated
+    searches are answered from memory. An unfiltered search also drops the
+    rules of workspaces that are no longer discovered.
+
+    Args:
+        authenticator: AzureAuthenticator instance
+        lighthouse_manager: LighthouseManager instance
+        text: Search text; every word must match
+        fields: Fields to search ("name", "description", "query", "tables");
+            defaults to all
+        workspace_filter: Optional workspace name filter
+        tenant_filter: Optional tenant name filter
+        limit: Maximum matches returned
+
+    Returns:
+        Dictionary with the best matches and the total match count
+
+    Raises:
+        ValueError: If limit is below 1, a field is unknown or the text has no
+            searchable words
+    """
+    logger.info(
+        "Searching analytics rules",
+        text=text,
+        fields=fields,
+        workspace_filter=workspace_filter,
+        tenant_filter=tenant_filter,
+    )
+
+    # Reject unusable searches before querying any workspace
+    parse_search(text, fields, limit)
+
+    explorer = AnalyticsRulesExplorer(authenticator)
+    index = get_search_index()
+
+    started = time.monotonic()
+    outcomes = await run_per_workspace(
+        lighthouse_manager,
+        explorer.get_catalog,
+        workspace_filter=workspace_filter,
+        tenant_filter=tenant_filter,
+    )
+
+    searched = set()
+    rules_searched = 0
+    errors = []
+    for outcome in outcomes:
+        if outcome.error is not None:
+            errors.append({
+                "workspace_name": outcome.workspace.workspace_name,
+                "workspace_id": outcome.workspace.workspace_id,
+                "tenant_name": outcome.workspace.tenant_name,
+                "error": outcome.error,
+            })
+            continue
+        index.update_workspace(outcome.workspace, outcome.result)
+        searched.add(outcome.workspace.workspace_id.lower())
+        rules_searched += len(outcome.result)
+
+    if not workspace_filter and not tenant_filter:
+        index.retain_workspaces(
+            {outcome.workspace.workspace_id.lower() for outcome in outcomes}
+        )
+
+    search_started = time.monotonic()
+    total_matches, matches = index.search(
+        text, fields=fields, workspace_ids=searched, limit=limit
+    )
+    search_ms = round((time.monotonic() - search_started) * 1000, 2)
+
+    logger.info(
+        "Analytics rules searched",
+        text=text,
+        total_matches=total_matches,
+        search_ms=search_ms,
+    )
+
+    return {
+        "timestamp": datetime.utcnow().isoformat(),
+        "text": text,
+        "workspaces_queried": len(outcomes),
+        "rules_searched": rules_searched,
+        "total_matches": total_matches,
+        "duration_ms": round((time.monotonic() - started) * 1000, 1),
+        "search_ms": search_ms,
+        "matches": matches,
+        "errors": errors,
+    }
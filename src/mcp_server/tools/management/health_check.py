@@ -13,12 +13,19 @@ from datetime import datetime, timedelta
 from enum import Enum
 import asyncio
 import structlog
-from azure.mgmt.securityinsight import SecurityInsights
-from azure.monitor.query import LogsQueryClient, LogsQueryStatus
-from azure.core.exceptions import AzureError
+from azure.mgmt.securityinsight.aio import SecurityInsights
+from azure.monitor.query import LogsQueryStatus
+from azure.monitor.query.aio import LogsQueryClient
 
-from utils.lighthouse import SentinelWorkspace, LighthouseManager
+from utils.lighthouse import SentinelWorkspace, LighthouseManager, is_access_denied_error
 from utils.auth import AzureAuthenticator
+from utils.circuit_breaker import get_tenant_guard, guard_key
+from utils.config import get_settings
+from utils.client_registry import SecurityInsightsClientRegistry, get_client_registry
+from utils.rate_limiter import get_rate_limiter
+from utils.rule_catalog import get_rule_catalog
+from utils.search_index import get_search_index
+from utils.single_flight import get_single_flight, workspace_read_key
 
 logger = structlog.get_logger(__name__)
 
@@ -32,18 +39,31 @@ class HealthStatus(str, Enum):
     UNKNOWN = "unknown"
 
 
+# Issue types raised when the workspace calls themselves fail; only these
+# count against the tenant's circuit breaker
+CALL_FAILURE_ISSUES = frozenset({"health_check_error", "access_denied", "timeout"})
+
+
 class SentinelHealthChecker:
     """Performs health checks on Sentinel workspaces"""
 
-    def __init__(self, authenticator: AzureAuthenticator):
+    def __init__(
+        self,
+        authenticator: AzureAuthenticator,
+        client_registry: Optional[SecurityInsightsClientRegistry] = None,
+    ):
         """
         Initialize health checker
 
         Args:
             authenticator: AzureAuthenticator instance
+            client_registry: Optional client registry (defaults to the global one)
         """
         self.authenticator = authenticator
-        self.credential = authenticator.get_credential()
+        self.credential = authenticator.get_async_credential()
+        self.client_registry = client_registry or get_client_registry(self.credential)
+        self.single_flight = get_single_flight()
+        self.rule_catalog = get_rule_catalog()
 
     async def check_workspace_health(
         self, workspace: SentinelWorkspace, check_depth: str = "quick"
@@ -64,24 +84,11 @@ class SentinelHealthChecker:
             check_depth=check_depth,
         )
 
-        result = {
-            "workspace_id": workspace.workspace_id,
-            "workspace_name": workspace.workspace_name,
-            "tenant_name": workspace.tenant_name,
-            "subscription_id": workspace.subscription_id,
-            "resource_group": workspace.resource_group,
-            "timestamp": datetime.utcnow().isoformat(),
-            "status": HealthStatus.UNKNOWN,
-            "issues": [],
-            "metrics": {},
-        }
+        result = self._new_result(workspace)
 
         try:
-            # Initialize clients
-            sentinel_client = SecurityInsights(
-                self.credential,
-                workspace.subscription_id,
-            )
+            # Reuse the pooled client for this subscription
+            sentinel_client = self.client_registry.get_client(workspace.subscription_id)
 
             # Check data connectors
             connector_status = await self._check_data_connectors(
@@ -114,26 +121,120 @@ class SentinelHealthChecker:
                 error=str(e),
             )
             result["status"] = HealthStatus.ERROR
-            result["issues"].append(
-                {
-                    "type": "health_check_error",
-                    "message": f"Health check failed: {str(e)}",
-                    "severity": "high",
-                }
-            )
+            if is_access_denied_error(e):
+                result["issues"].append(
+                    {
+                        "type": "access_denied",
+                        "message": f"Access to workspace was denied: {str(e)}",
+                        "severity": "high",
+                    }
+                )
+            else:
+                result["issues"].append(
+                    {
+                        "type": "health_check_error",
+                        "message": f"Health check failed: {str(e)}",
+                        "severity": "high",
+                    }
+                )
+
+        return result
+
+    def access_denied_result(self, workspace: SentinelWorkspace) -> Dict[str, Any]:
+        """
+        Build the result for a workspace known to deny access, without any calls
+
+        Args:
+            workspace: SentinelWorkspace with a cached access denial
+
+        Returns:
+            Health check result dictionary with ERROR status
+        """
+        result = self._new_result(workspace)
+        result["status"] = HealthStatus.ERROR
+        result["issues"].append(
+            {
+                "type": "access_denied",
+                "message": "Access to workspace was denied (cached result, check skipped)",
+                "severity": "high",
+            }
+        )
+        return result
+
+    def circuit_open_result(self, workspace: SentinelWorkspace, message: str) -> Dict[str, Any]:
+        """
+        Build the result for a workspace whose tenant circuit is open, without any calls
+
+        Args:
+            workspace: SentinelWorkspace in a tenant with an open circuit
+            message: Explanation including when the tenant is retried
+
+        Returns:
+            Health check result dictionary with ERROR status
+        """
+        result = self._new_result(workspace)
+        result["status"] = HealthStatus.ERROR
+        result["issues"].append(
+            {
+                "type": "circuit_open",
+                "message": message,
+                "severity": "high",
+            }
+        )
+        return result
+
+    def timed_out_result(self, workspace: SentinelWorkspace, timeout: float) -> Dict[str, Any]:
+        """
+        Build the result for a workspace whose check exceeded its deadline
+
+        Args:
+            workspace: SentinelWorkspace that timed out
+            timeout: Deadline of the check, in seconds
 
+        Returns:
+            Health check result dictionary with ERROR status
+        """
+        result = self._new_result(workspace)
+        result["status"] = HealthStatus.ERROR
+        result["issues"].append(
+            {
+                "type": "timeout",
+                "message": f"Health check timed out after {timeout}s",
+                "severity": "high",
+            }
+        )
         return result
 
+    def _new_result(self, workspace: SentinelWorkspace) -> Dict[str, Any]:
+        """Create an empty health check result for a workspace"""
+        return {
+            "workspace_id": workspace.workspace_id,
+            "workspace_name": workspace.workspace_name,
+            "tenant_name": workspace.tenant_name,
+            "subscription_id": workspace.subscription_id,
+            "resource_group": workspace.resource_group,
+            "timestamp": datetime.utcnow().isoformat(),
+            "status": HealthStatus.UNKNOWN,
+            "issues": [],
+            "metrics": {},
+        }
+
     async def _check_data_connectors(
         self, sentinel_client: SecurityInsights, workspace: SentinelWorkspace
     ) -> Dict[str, Any]:
         """Check data connectors status"""
         try:
-            connectors = list(
-                sentinel_client.data_connectors.list(
-                    resource_group_name=workspace.resource_group,
-                    workspace_name=workspace.workspace_name,
-                )
+            async def fetch_connectors():
+                return [
+                    connector
+                    async for connector in sentinel_client.data_connectors.list(
+                        resource_group_name=workspace.resource_group,
+                        workspace_name=workspace.workspace_name,
+                    )
+                ]
+
+            connectors = await self.single_flight.do(
+                workspace_read_key("data_connectors.list", workspace), fetch_connectors
             )
 
             total_count = len(connectors)
@@ -152,6 +253,9 @@ class SentinelHealthChecker:
             }
 
         except Exception as e:
+            # A denied workspace fails the whole check
+            if is_access_denied_error(e):
+                raise
             logger.error(
                 "Failed to check data connectors",
                 workspace_name=workspace.workspace_name,
@@ -168,13 +272,24 @@ class SentinelHealthChecker:
     ) -> Dict[str, Any]:
         """Check analytics rules status"""
         try:
-            # Get alert rules
-            rules = list(
-                sentinel_client.alert_rules.list(
-                    resource_group_name=workspace.resource_group,
-                    workspace_name=workspace.workspace_name,
-                )
+            async def fetch_rules():
+                return [
+                    rule
+                    async for rule in sentinel_client.alert_rules.list(
+                        resource_group_name=workspace.resource_group,
+                        workspace_name=workspace.workspace_name,
+                    )
+                ]
+
+            # Get alert rules from the rule catalog, re-listing (and sharing a
+            # listing already in flight) only once its TTL has expired
+            entries = await self.rule_catalog.get_or_load(
+                workspace,
+                lambda: self.single_flight.do(
+                    workspace_read_key("alert_rules.list", workspace), fetch_rules
+                ),
             )
+            rules = [entry.rule for entry in entries]
 
             total_count = len(rules)
             enabled_count = sum(
@@ -198,6 +313,9 @@ class SentinelHealthChecker:
             }
 
         except Exception as e:
+            # A denied workspace fails the whole check
+            if is_access_denied_error(e):
+                raise
             logger.error(
                 "Failed to check analytics rules",
                 workspace_name=workspace.workspace_name,
@@ -216,8 +334,6 @@ class SentinelHealthChecker:
     ) -> Dict[str, Any]:
         """Check data ingestion over last 24 hours"""
         try:
-            logs_client = LogsQueryClient(self.credential)
-
             # KQL query to check ingestion
             query = """
             Usage
@@ -226,11 +342,12 @@ class SentinelHealthChecker:
             """
 
             # Query the workspace
-            response = logs_client.query_workspace(
-                workspace_id=workspace.workspace_id.split("/")[-1],  # Extract ID
-                query=query,
-                timespan=timedelta(days=1),
-            )
+            async with LogsQueryClient(self.credential) as logs_client:
+                response = await logs_client.query_workspace(
+                    workspace_id=workspace.workspace_id.split("/")[-1],  # Extract ID
+                    query=query,
+                    timespan=timedelta(days=1),
+                )
 
             if response.status == LogsQueryStatus.SUCCESS:
                 table = response.tables[0]
@@ -257,6 +374,9 @@ class SentinelHealthChecker:
                 }
 
         except Exception as e:
+            # A denied workspace fails the whole check
+            if is_access_denied_error(e):
+                raise
             logger.error(
                 "Failed to check data ingestion",
                 workspace_name=workspace.workspace_name,
@@ -313,7 +433,7 @@ async def check_sentinel_health(
         check_depth: Check depth ("quick" or "detailed")
 
     Returns:
-        Health check results for all workspaces
+        Health check results for all workspaces, plus runtime statistics
     """
     logger.info(
         "Starting multi-workspace health check",
@@ -322,26 +442,66 @@ async def check_sentinel_health(
     )
 
     health_checker = SentinelHealthChecker(authenticator)
+    tenant_guard = get_tenant_guard()
+
+    timeout = get_settings().query_timeout_seconds
 
-    # Get workspaces
-    workspaces = await lighthouse_manager.get_sentinel_workspaces()
+    async def check(workspace: SentinelWorkspace) -> Dict[str, Any]:
+        # Skip workspaces already known to deny access
+        if lighthouse_manager.is_access_denied(workspace):
+            return health_checker.access_denied_result(workspace)
 
-    # Filter by tenant if specified
-    if tenant_scope and tenant_scope != "all":
-        workspaces = [
-            ws
-            for ws in workspaces
-            if ws.tenant_name
-            and tenant_scope.lower() in ws.tenant_name.lower()
-        ]
+        key = guard_key(workspace)
 
-    logger.info("Workspaces to check", count=len(workspaces))
+        # Skip tenants that keep failing, without waiting for a worker
+        if tenant_guard.is_open(key):
+            return health_checker.circuit_open_result(
+                workspace, tenant_guard.open_circuit_message(key)
+            )
+
+        async with tenant_guard.bulkhead(key):
+            if not tenant_guard.allow(key):
+                return health_checker.circuit_open_result(
+                    workspace, tenant_guard.open_circuit_message(key)
+                )
+            try:
+                result = await asyncio.wait_for(
+                    health_checker.check_workspace_health(workspace, check_depth),
+                    timeout=timeout,
+                )
+            except asyncio.TimeoutError:
+                result = health_checker.timed_out_result(workspace, timeout)
+
+        issue_types = {issue["type"] for issue in result.get("issues", [])}
+        if "access_denied" in issue_types:
+            # Skip the workspace on later calls, as validate_workspace_access does
+            lighthouse_manager.record_workspace_access(workspace, False)
+        # Only failed calls count against the tenant; metric-level errors
+        # (e.g. a failed ingestion query) mean the tenant itself answered
+        if issue_types & CALL_FAILURE_ISSUES:
+            tenant_guard.record_failure(key)
+        else:
+            tenant_guard.record_success(key)
+        return result
 
-    # Check health for each workspace
-    results = []
-    for workspace in workspaces:
-        result = await health_checker.check_workspace_health(workspace, check_depth)
-        results.append(result)
+    # Start checking each workspace as soon as it is discovered, so enumeration
+    # overlaps with the health checks; the tenant guard bounds concurrency
+    workspaces = []
+    checks = []
+    try:
+        async for workspace in lighthouse_manager.iter_sentinel_workspaces(
+            tenant_filter=tenant_scope if tenant_scope and tenant_scope != "all" else None
+        ):
+            workspaces.append(workspace)
+            checks.append(asyncio.create_task(check(workspace)))
+
+        # Results keep discovery order
+        results = list(await asyncio.gather(*checks))
+    finally:
+        for pending in checks:
+            pending.cancel()
+
+    logger.info("Workspaces checked", count=len(workspaces))
 
     # Calculate summary
     summary = {
@@ -357,7 +517,33 @@ async def check_sentinel_health(
         },
     }
 
-    return {"summary": summary, "workspaces": results}
+    return {
+        "summary": summary,
+        "workspaces": results,
+        "runtime": collect_runtime_stats(lighthouse_manager),
+    }
+
+
+def collect_runtime_stats(lighthouse_manager: LighthouseManager) -> Dict[str, Any]:
+    """
+    Collect the counters of the server's shared Azure plumbing
+
+    Args:
+        lighthouse_manager: LighthouseManager holding the client registry and executor
+
+    Returns:
+        Connection pool, blocking executor, ARM read rate, single-flight,
+        rule catalog, rule search index and tenant circuit statistics
+    """
+    return {
+        "client_pool": lighthouse_manager.client_registry.get_stats(),
+        "blocking_executor": lighthouse_manager.executor.get_stats(),
+        "arm_read_rates": get_rate_limiter().get_rates(),
+        "single_flight": get_single_flight().get_stats(),
+        "rule_catalog": get_rule_catalog().get_stats(),
+        "rule_search_index": get_search_index().get_stats(),
+        "tenant_circuits": get_tenant_guard().get_states(),
+    }
 
 
 def _calculate_summary_status(results: List[Dict[str, Any]]) -> str:
@@ -8,3 +8,163 @@ from pathlib import Path
 # Add src directory to Python path
 src_path = Path(__file__).parent.parent
 sys.path.insert(0, str(src_path))
+
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+from unittest.mock import Mock, patch
+
+import pytest
+
+from utils.circuit_breaker import TenantGuard
+from utils.config import Settings
+from utils.lighthouse import SentinelWorkspace
+
+
+def make_workspace(
+    name: str = "ws-a",
+    tenant_name: str = "Tenant One",
+    tenant_id: Optional[str] = None,
+    subscription_id: str = "sub-1",
+) -> SentinelWorkspace:
+    """Create a SentinelWorkspace for tests (tenant ID derived from the name by default)"""
+    return SentinelWorkspace(
+        workspace_id=(
+            f"/subscriptions/{subscription_id}/resourceGroups/rg"
+            f"/providers/Microsoft.OperationalInsights/workspaces/{name}"
+        ),
+        workspace_name=name,
+        resource_group="rg",
+        subscription_id=subscription_id,
+        tenant_id=tenant_id or tenant_name.lower().replace(" ", "-"),
+        tenant_name=tenant_name,
+    )
+
+
+def make_lighthouse(workspaces: List[SentinelWorkspace]) -> Mock:
+    """Create a LighthouseManager stand-in streaming the given workspaces"""
+    lighthouse = Mock()
+
+    async def iter_workspaces(workspace_filter=None, tenant_filter=None):
+        for workspace in workspaces:
+            yield workspace
+
+    lighthouse.iter_sentinel_workspaces = iter_workspaces
+    lighthouse.is_access_denied = Mock(return_value=False)
+    return lighthouse
+
+
+@pytest.fixture
+def fan_out():
+    """Patch the tenant guard and timeout used by the analytics rules fan-out"""
+    guard = TenantGuard(max_concurrency=4, max_concurrency_per_tenant=4)
+    module = "mcp_server.tools.exploration.analytics_rules"
+    with patch(f"{module}.get_tenant_guard", return_value=guard), patch(
+        f"{module}.get_settings", return_value=Settings(QUERY_TIMEOUT_SECONDS=1)
+    ):
+        yield guard
+
+
+class FakeResourceGraphClient:
+    """
+    Local stand-in for azure.mgmt.resourcegraph.ResourceGraphClient
+
+    Serves pre-canned result rows page by page, honouring the request's
+    ``top`` and ``skip_token`` options the way Resource Graph does.
+    """
+
+    def __init__(self, rows: List[Dict[str, Any]]):
+        self.rows = rows
+        self.requests: List[Any] = []
+
+    def resources(self, request: Any) -> SimpleNamespace:
+        self.requests.append(request)
+        subscriptions = request.subscriptions
+        rows = [
+            row
+            for row in self.rows
+            if not subscriptions or row["subscriptionId"] in subscriptions
+        ]
+
+        offset = int(request.options.skip_token or 0)
+        page_size = request.options.top or len(rows)
+        page = rows[offset : offset + page_size]
+        next_offset = offset + len(page)
+
+        return SimpleNamespace(
+            data=page,
+            count=len(page),
+            total_records=len(rows),
+            skip_token=str(next_offset) if next_offset < len(rows) else None,
+        )
+
+
+def make_resource_graph_row(
+    name: str, subscription_id: str = "sub-1", tenant_id: str = "tenant-1"
+) -> Dict[str, Any]:
+    """Build a Resource Graph row as returned by SENTINEL_WORKSPACES_QUERY"""
+    return {
+        "id": (
+            f"/subscriptions/{subscription_id}/resourceGroups/rg-{name}"
+            f"/providers/Microsoft.OperationalInsights/workspaces/{name}"
+        ),
+        "name": name,
+        "resourceGroup": f"rg-{name}",
+        "subscriptionId": subscription_id,
+        "tenantId": tenant_id,
+        "location": "westeurope",
+        "sku": "PerGB2018",
+        "subscriptionName": f"Subscription {subscription_id}",
+    }
+
+
+@pytest.fixture
+def fake_resource_graph():
+    """Resource Graph stand-in preloaded with workspaces across two subscriptions"""
+    rows = [make_resource_graph_row(f"ws-{i:02d}", "sub-1") for i in range(5)]
+    rows += [make_resource_graph_row(f"ws-{i:02d}", "sub-2") for i in range(5, 8)]
+    return FakeResourceGraphClient(rows)
+
+
+@pytest.fixture(autouse=True)
+def isolated_workspace_inventory(tmp_path, monkeypatch):
+    """Keep the persisted workspace inventory out of the user's home directory"""
+    monkeypatch.setenv("WORKSPACE_INVENTORY_PATH", str(tmp_path / "workspace_inventory.db"))
+
+
+@pytest.fixture(autouse=True)
+async def isolated_client_registry():
+    """Give each test its own SecurityInsights client registry and connection pool"""
+    from utils.client_registry import close_client_registry
+
+    yield
+    await close_client_registry()
+
+
+@pytest.fixture(autouse=True)
+def isolated_tenant_guard():
+    """Start each test with closed circuits and fresh bulkheads"""
+    from utils.circuit_breaker import reset_tenant_guard
+
+    reset_tenant_guard()
+    yield
+    reset_tenant_guard()
+
+
+@pytest.fixture(autouse=True)
+def isolated_rule_catalog():
+    """Start each test with an empty analytics rule catalog"""
+    from utils.rule_catalog import reset_rule_catalog
+
+    reset_rule_catalog()
+    yield
+    reset_rule_catalog()
+
+
+@pytest.fixture(autouse=True)
+def isolated_search_index():
+    """Start each test with an empty rule search index"""
+    from utils.search_index import reset_search_index
+
+    reset_search_index()
+    yield
+    reset_search_index()
@@ -0,0 +1,381 @@
+"""
+Unit tests for analytics rules module
+"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+from azure.core.exceptions import HttpResponseError
+from mcp_server.tools.exploration.analytics_rules import (
+    AnalyticsRulesExplorer,
+    get_analytics_rule_details_batch,
+    list_analytics_rules,
+)
+from utils.lighthouse import SentinelWorkspace
+from tests.conftest import make_lighthouse, make_workspace
+
+
+class TestListAnalyticsRules:
+    """Test the multi-workspace rule listing"""
+
+    @pytest.mark.asyncio
+    async def test_workspaces_listed_concurrently(self, fan_out):
+        """Test that workspaces are listed at the same time, not one after another"""
+        workspaces = [make_workspace(f"ws-{i}") for i in range(4)]
+        in_flight = []
+        all_started = asyncio.Event()
+
+        async def list_rules(self, workspace, enabled_only=False):
+            in_flight.append(workspace.workspace_name)
+            if len(in_flight) == 4:
+                all_started.set()
+            await all_started.wait()
+            return [{"rule_id": workspace.workspace_name}]
+
+        with patch.object(AnalyticsRulesExplorer, "list_rules", list_rules):
+            result = await list_analytics_rules(Mock(), make_lighthouse(workspaces))
+
+        # Sequential listings would wait on the event until the deadline
+        assert result["total_rules"] == 4
+        assert all(ws["duration_ms"] >= 0 for ws in result["workspaces"])
+
+    @pytest.mark.asyncio
+    async def test_order_is_deterministic(self, fan_out):
+        """Test that results are sorted by tenant and workspace, not completion"""
+        workspaces = [
+            make_workspace("zeta", "Tenant B"),
+            make_workspace("beta", "Tenant A"),
+            make_workspace("alpha", "Tenant B"),
+        ]
+
+        delays = {"zeta": 0.0, "beta": 0.03, "alpha": 0.06}
+
+        async def list_rules(self, workspace, enabled_only=False):
+            await asyncio.sleep(delays[workspace.workspace_name])
+            return []
+
+        with patch.object(AnalyticsRulesExplorer, "list_rules", list_rules):
+            result = await list_analytics_rules(Mock(), make_lighthouse(workspaces))
+
+        assert [ws["workspace_name"] for ws in result["workspaces"]] == ["beta", "alpha", "zeta"]
+
+    @pytest.mark.asyncio
+    async def test_deadline_and_errors_isolated(self, fan_out):
+        """Test that a slow or failing workspace only affects its own entry"""
+        workspaces = [make_workspace("ok"), make_workspace("slow"), make_workspace("broken")]
+
+        async def list_rules(self, workspace, enabled_only=False):
+            if workspace.workspace_name == "slow":
+                await asyncio.sleep(5)
+            if workspace.workspace_name == "broken":
+                raise RuntimeError("InternalServerError")
+            return [{"rule_id": "r1"}]
+
+        with patch.object(AnalyticsRulesExplorer, "list_rules", list_rules):
+            result = await list_analytics_rules(Mock(), make_lighthouse(workspaces))
+
+        by_name = {ws["workspace_name"]: ws for ws in result["workspaces"]}
+        assert by_name["ok"]["rules_count"] == 1
+        assert by_name["slow"]["error"] == "Timed out after 1s"
+        assert by_name["broken"]["error"] == "InternalServerError"
+        assert result["total_rules"] == 1
+
+
+class TestListingPagination:
+    """Test cursor pagination over listing snapshots"""
+
+    @pytest.fixture
+    def workspaces(self):
+        return [make_workspace("ws-a"), make_workspace("ws-b"), make_workspace("ws-c")]
+
+    @staticmethod
+    def rules_for(workspace, enabled_only=False):
+        counts = {"ws-a": 3, "ws-b": 0, "ws-c": 2}
+        return [
+            {"rule_id": f"{workspace.workspace_name}-{i}"}
+            for i in range(counts[workspace.workspace_name])
+        ]
+
+    @pytest.mark.asyncio
+    async def test_pages_cover_listing_once(self, fan_out, workspaces):
+        """Test that pages split rules across workspaces and follow-ups skip Azure"""
+        calls = []
+
+        async def list_rules(self, workspace, enabled_only=False):
+            calls.append(workspace.workspace_name)
+            return TestListingPagination.rules_for(workspace)
+
+        lighthouse = make_lighthouse(workspaces)
+        with patch.object(AnalyticsRulesExplorer, "list_rules", list_rules):
+            first = await list_analytics_rules(Mock(), lighthouse, page_size=2)
+            second = await list_analytics_rules(Mock(), lighthouse, cursor=first["next_cursor"])
+            third = await list_analytics_rules(Mock(), lighthouse, cursor=second["next_cursor"])
+
+        assert len(calls) == 3
+        assert first["total_rules"] == 5
+        pages = [
+            [(ws["workspace_name"], [r["rule_id"] for r in ws["rules"]]) for ws in page["workspaces"]]
+            for page in (first, second, third)
+        ]
+        assert pages == [
+            [("ws-a", ["ws-a-0", "ws-a-1"])],
+            [("ws-a", ["ws-a-2"]), ("ws-b", [])],
+            [("ws-c", ["ws-c-0", "ws-c-1"])],
+        ]
+        assert third["next_cursor"] is None
+
+    @pytest.mark.asyncio
+    async def test_no_page_size_returns_everything(self, fan_out, workspaces):
+        """Test that pagination is opt-in"""
+
+        async def list_rules(self, workspace, enabled_only=False):
+            return TestListingPagination.rules_for(workspace)
+
+        with patch.object(AnalyticsRulesExplorer, "list_rules", list_rules):
+            result = await list_analytics_rules(Mock(), make_lighthouse(workspaces))
+
+        assert "next_cursor" not in result
+        assert sum(len(ws["rules"]) for ws in result["workspaces"]) == 5
+
+    @pytest.mark.asyncio
+    async def test_unknown_cursor_rejected(self, fan_out):
+        """Test that expired or malformed cursors raise ValueError"""
+        from utils.snapshots import encode_cursor
+
+        with pytest.raises(ValueError, match="expired"):
+            await list_analytics_rules(Mock(), Mock(), cursor=encode_cursor("gone", 0, 10))
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            await list_analytics_rules(Mock(), Mock(), cursor="not-a-cursor")
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            await list_analytics_rules(Mock(), Mock(), cursor=encode_cursor("gone", 0, 0))
+
+    @pytest.mark.asyncio
+    async def test_negative_page_size_rejected(self, fan_out):
+        with pytest.raises(ValueError, match="page_size"):
+            await list_analytics_rules(Mock(), Mock(), page_size=-1)
+
+
+class TestListingProjection:
+    """Test field projection and the columnar layout"""
+
+    @staticmethod
+    async def list_rules(self, workspace, enabled_only=False):
+        return [
+            {
+                "rule_id": f"{workspace.workspace_name}-{i}",
+                "rule_name": f"Rule {i}",
+                "kind": "Fusion" if i else "Scheduled",
+                "enabled": bool(i),
+                "description": "x" * 200,
+                **({} if i else {"severity": "High"}),
+            }
+            for i in range(2)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_fields_projection(self, fan_out):
+        """Test that only requested fields (plus rule_id) are returned"""
+        with patch.object(AnalyticsRulesExplorer, "list_rules", self.list_rules):
+            result = await list_analytics_rules(
+                Mock(), make_lighthouse([make_workspace("ws")]), fields=["enabled", "severity"]
+            )
+
+        assert result["workspaces"][0]["rules"] == [
+            {"rule_id": "ws-0", "enabled": False, "severity": "High"},
+            {"rule_id": "ws-1", "enabled": True},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_columnar_pages(self, fan_out):
+        """Test that columnar rows line up with columns, including on later pages"""
+        lighthouse = make_lighthouse([make_workspace("ws")])
+        with patch.object(AnalyticsRulesExplorer, "list_rules", self.list_rules):
+            first = await list_analytics_rules(
+                Mock(), lighthouse, page_size=1, fields=["severity"], columnar=True
+            )
+            second = await list_analytics_rules(
+                Mock(), lighthouse, cursor=first["next_cursor"], fields=["severity"], columnar=True
+            )
+
+        assert first["columns"] == ["rule_id", "severity"]
+        assert "rules" not in first["workspaces"][0]
+        assert first["workspaces"][0]["rows"] == [["ws-0", "High"]]
+        assert second["workspaces"][0]["rows"] == [["ws-1", None]]
+
+    @pytest.mark.asyncio
+    async def test_columnar_workspace_fields_once(self, fan_out):
+        """Test that columnar rows leave the workspace name and ID to the workspace entry"""
+        workspace = make_workspace("ws")
+        with patch.object(AnalyticsRulesExplorer, "list_rules", self.list_rules):
+            result = await list_analytics_rules(
+                Mock(),
+                make_lighthouse([workspace]),
+                page_size=1,
+                fields=["rule_name", "workspace_name", "workspace_id"],
+                columnar=True,
+            )
+
+        assert result["columns"] == ["rule_id", "rule_name"]
+        entry = result["workspaces"][0]
+        assert (entry["workspace_name"], entry["workspace_id"]) == ("ws", workspace.workspace_id)
+        assert entry["rows"] == [["ws-0", "Rule 0"]]
+
+    @pytest.mark.asyncio
+    async def test_unknown_field_rejected(self, fan_out):
+        """Test that a misspelt field fails before querying Azure"""
+        lighthouse = make_lighthouse([make_workspace("ws")])
+
+        with pytest.raises(ValueError, match="Unknown rule field"):
+            await list_analytics_rules(Mock(), lighthouse, fields=["name"])
+
+
+class TestRuleDetailsBatch:
+    """Test batch rule details"""
+
+    @pytest.fixture
+    def lighthouse(self):
+        workspaces = {"ws-a": make_workspace("ws-a"), "ws-b": make_workspace("ws-b", "Tenant Two")}
+        lighthouse = Mock()
+        lighthouse.resolve_workspace = AsyncMock(
+            side_effect=lambda name, **kwargs: workspaces.get(name)
+        )
+        lighthouse.is_access_denied = Mock(return_value=False)
+        return lighthouse
+
+    @pytest.mark.asyncio
+    async def test_grouped_by_workspace_with_item_errors(self, fan_out, lighthouse):
+        """Test that each workspace is resolved and listed once, and errors stay per item"""
+        catalogs = []
+
+        async def get_catalog(self, workspace):
+            catalogs.append(workspace.workspace_name)
+            return []
+
+        async def get_rule_details(self, workspace, rule_id):
+            if rule_id == "missing":
+                raise RuntimeError("Rule not found")
+            return {"rule_id": rule_id, "workspace_name": workspace.workspace_name}
+
+        items = [
+            {"workspace": "ws-a", "rule_id": "r1"},
+            {"workspace": "ws-b", "rule_id": "r2"},
+            {"workspace": "ws-a", "rule_id": "missing"},
+            {"workspace": "nowhere", "rule_id": "r3"},
+            {"workspace": "ws-a", "rule_id": "r4"},
+        ]
+        with patch.object(AnalyticsRulesExplorer, "get_catalog", get_catalog), patch.object(
+            AnalyticsRulesExplorer, "get_rule_details", get_rule_details
+        ):
+            result = await get_analytics_rule_details_batch(Mock(), lighthouse, items)
+
+        assert lighthouse.resolve_workspace.await_count == 3
+        assert catalogs == ["ws-a"]
+        assert (result["succeeded"], result["failed"]) == (3, 2)
+        assert [r.get("rule", {}).get("rule_id") for r in result["results"]] == [
+            "r1", "r2", None, None, "r4"
+        ]
+        assert result["results"][2]["error"] == "Rule not found"
+        assert "not found" in result["results"][3]["error"]
+
+    @pytest.mark.asyncio
+    async def test_grouped_by_resolved_workspace(self, fan_out):
+        """Test that a name and a resource ID of one workspace share a single listing"""
+        workspace = make_workspace("ws-a")
+        lighthouse = Mock(is_access_denied=Mock(return_value=False))
+        lighthouse.resolve_workspace = AsyncMock(return_value=workspace)
+        catalogs = []
+
+        async def get_catalog(self, workspace):
+            catalogs.append(workspace.workspace_name)
+            return []
+
+        async def get_rule_details(self, workspace, rule_id):
+            return {"rule_id": rule_id}
+
+        items = [
+            {"workspace": "ws-a", "rule_id": "r1"},
+            {"workspace": workspace.workspace_id, "rule_id": "r2"},
+        ]
+        with patch.object(AnalyticsRulesExplorer, "get_catalog", get_catalog), patch.object(
+            AnalyticsRulesExplorer, "get_rule_details", get_rule_details
+        ):
+            result = await get_analytics_rule_details_batch(Mock(), lighthouse, items)
+
+        assert lighthouse.resolve_workspace.await_count == 2
+        assert catalogs == ["ws-a"]
+        assert [r["rule"]["rule_id"] for r in result["results"]] == ["r1", "r2"]
+
+    @pytest.mark.asyncio
+    async def test_workspaces_fetched_concurrently(self, fan_out, lighthouse):
+        """Test that workspaces are fetched at the same time, not one after another"""
+        in_flight = []
+        both_started = asyncio.Event()
+
+        async def get_rule_details(self, workspace, rule_id):
+            in_flight.append(rule_id)
+            if len(in_flight) == 2:
+                both_started.set()
+            await both_started.wait()
+            return {"rule_id": rule_id}
+
+        items = [{"workspace": "ws-a", "rule_id": "r1"}, {"workspace": "ws-b", "rule_id": "r2"}]
+        with patch.object(AnalyticsRulesExplorer, "get_rule_details", get_rule_details):
+            result = await get_analytics_rule_details_batch(Mock(), lighthouse, items)
+
+        # Sequential fetches would wait on the event until the deadline
+        assert result["succeeded"] == 2
+
+    @pytest.mark.asyncio
+    async def test_unknown_tenants_guarded_per_subscription(self, fan_out):
+        """Test that directly addressed workspaces without a tenant do not share a circuit"""
+        workspaces = {
+            name: SentinelWorkspace(
+                workspace_id=f"/subscriptions/{sub}/resourceGroups/rg/providers/Microsoft.OperationalInsights/workspaces/{name}",
+                workspace_name=name,
+                resource_group="rg",
+                subscription_id=sub,
+                tenant_id="",
+            )
+            for name, sub in (("ws-x", "sub-x"), ("ws-y", "sub-y"))
+        }
+        lighthouse = Mock(is_access_denied=Mock(return_value=False))
+        lighthouse.resolve_workspace = AsyncMock(side_effect=lambda name, **kwargs: workspaces[name])
+        for _ in range(fan_out.failure_threshold):
+            fan_out.record_failure("subscription:sub-x")
+
+        async def get_rule_details(self, workspace, rule_id):
+            return {"rule_id": rule_id}
+
+        items = [{"workspace": "ws-x", "rule_id": "r1"}, {"workspace": "ws-y", "rule_id": "r2"}]
+        with patch.object(AnalyticsRulesExplorer, "get_rule_details", get_rule_details):
+            result = await get_analytics_rule_details_batch(Mock(), lighthouse, items)
+
+        assert "circuit open" in result["results"][0]["error"]
+        assert result["results"][1]["rule"] == {"rule_id": "r2"}
+
+    @pytest.mark.asyncio
+    async def test_access_denied_recorded(self, fan_out, lighthouse):
+        """Test that a denial is cached for the workspace and reported for all its items"""
+
+        async def get_rule_details(self, workspace, rule_id):
+            raise HttpResponseError(response=Mock(status_code=403, reason="Forbidden"))
+
+        async def get_catalog(self, workspace):
+            return []
+
+        items = [{"workspace": "ws-a", "rule_id": "r1"}, {"workspace": "ws-a", "rule_id": "r2"}]
+        with patch.object(AnalyticsRulesExplorer, "get_rule_details", get_rule_details), patch.object(
+            AnalyticsRulesExplorer, "get_catalog", get_catalog
+        ):
+            result = await get_analytics_rule_details_batch(Mock(), lighthouse, items)
+
+        assert result["failed"] == 2
+        (workspace, accessible), _ = lighthouse.record_workspace_access.call_args
+        assert (workspace.workspace_name, accessible) == ("ws-a", False)
+
+    @pytest.mark.asyncio
+    async def test_malformed_batch_rejected(self, fan_out, lighthouse):
+        with pytest.raises(ValueError, match="rule_id"):
+            await get_analytics_rule_details_batch(Mock(), lighthouse, [{"workspace": "ws-a"}])
+        with pytest.raises(ValueError, match="No rules"):
+            await get_analytics_rule_details_batch(Mock(), lighthouse, [])
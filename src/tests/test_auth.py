@@ -47,6 +47,17 @@ class TestAzureAuthenticator:
         credential = auth.get_credential()
         assert credential is not None
 
+    @patch.dict("os.environ", {}, clear=True)
+    def test_identity_key(self):
+        """Test that the identity key follows the authentication priority"""
+        service_principal = AzureAuthenticator(
+            tenant_id="test-tenant", client_id="test-client", client_secret="test-secret"
+        )
+
+        assert service_principal.get_identity_key() == "service_principal:test-tenant:test-client"
+        assert AzureAuthenticator(use_managed_identity=True).get_identity_key() == "managed_identity"
+        assert AzureAuthenticator(tenant_id="t").get_identity_key() == "azure_cli:t"
+
     def test_get_credential_caching(self):
         """Test that credential is cached"""
         auth = AzureAuthenticator(
@@ -60,6 +71,20 @@ class TestAzureAuthenticator:
 
         assert cred1 is cred2  # Same object
 
+    def test_get_async_credential_caching(self):
+        """Test that the async credential is cached"""
+        auth = AzureAuthenticator(
+            tenant_id="test-tenant",
+            client_id="test-client",
+            client_secret="test-secret",
+        )
+
+        cred1 = auth.get_async_credential()
+        cred2 = auth.get_async_credential()
+
+        assert cred1 is cred2
+        assert hasattr(cred1, "get_token")
+
     def test_factory_function(self):
         """Test get_authenticator factory function"""
         auth = get_authenticator(
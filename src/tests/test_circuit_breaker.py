@@ -0,0 +1,208 @@
+"""
+Unit tests for tenant circuit breakers and bulkheads
+"""
+
+import asyncio
+import time
+import pytest
+from unittest.mock import Mock, AsyncMock, patch
+from mcp_server.tools.exploration.analytics_rules import (
+    AnalyticsRulesExplorer,
+    list_analytics_rules,
+)
+from mcp_server.tools.management.health_check import (
+    SentinelHealthChecker,
+    HealthStatus,
+    check_sentinel_health,
+)
+from utils.circuit_breaker import CircuitBreaker, CircuitState, TenantGuard
+from tests.conftest import make_lighthouse, make_workspace
+
+
+class TestCircuitBreaker:
+    """Test breaker state transitions"""
+
+    def test_opens_after_consecutive_failures(self):
+        """Test that the circuit opens at the failure threshold"""
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+
+        breaker.record_failure()
+        assert breaker.allow_request()
+        breaker.record_failure()
+
+        assert breaker.state == CircuitState.OPEN
+        assert not breaker.allow_request()
+
+    def test_success_resets_failures(self):
+        """Test that failures must be consecutive"""
+        breaker = CircuitBreaker(failure_threshold=2)
+
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+
+        assert breaker.state == CircuitState.CLOSED
+
+    def test_half_open_allows_single_trial(self):
+        """Test that one trial is let through after the reset timeout"""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+        breaker.record_failure()
+        time.sleep(0.06)
+
+        assert breaker.state == CircuitState.HALF_OPEN
+        assert breaker.allow_request()
+        assert not breaker.allow_request()
+
+        breaker.record_success()
+        assert breaker.state == CircuitState.CLOSED
+
+    def test_failed_trial_reopens(self):
+        """Test that a failed half-open trial re-opens the circuit"""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+        breaker.record_failure()
+        time.sleep(0.06)
+        breaker.allow_request()
+
+        breaker.record_failure()
+
+        assert breaker.state == CircuitState.OPEN
+
+
+class TestTenantGuard:
+    """Test bulkheads"""
+
+    @pytest.mark.asyncio
+    async def test_slow_tenant_limited_to_its_share(self):
+        """Test that one tenant cannot take every worker"""
+        guard = TenantGuard(max_concurrency=3, max_concurrency_per_tenant=1)
+        running = {"slow": 0, "fast": 0}
+        peak = {"slow": 0, "fast": 0}
+        release_slow = asyncio.Event()
+
+        async def work(tenant_id):
+            async with guard.bulkhead(tenant_id):
+                running[tenant_id] += 1
+                peak[tenant_id] = max(peak[tenant_id], running[tenant_id])
+                if tenant_id == "slow":
+                    await release_slow.wait()
+                else:
+                    await asyncio.sleep(0)
+                running[tenant_id] -= 1
+
+        slow = [asyncio.ensure_future(work("slow")) for _ in range(3)]
+        # The fast tenant finishes while the slow one still holds its share
+        await asyncio.wait_for(asyncio.gather(*(work("fast") for _ in range(3))), 5)
+        assert not any(task.done() for task in slow)
+
+        release_slow.set()
+        await asyncio.gather(*slow)
+
+        assert peak == {"slow": 1, "fast": 1}
+
+
+class TestFanOutCircuits:
+    """Test that tools skip tenants with an open circuit"""
+
+    @pytest.mark.asyncio
+    async def test_health_check_skips_open_tenant(self):
+        """Test that a failing tenant stops being checked once its circuit opens"""
+        guard = TenantGuard(failure_threshold=2, max_concurrency=4, max_concurrency_per_tenant=1)
+        workspaces = [make_workspace(f"broken-{i}", tenant_id="broken") for i in range(4)]
+        workspaces.append(make_workspace("healthy", tenant_id="ok"))
+
+        async def check(workspace, check_depth):
+            if workspace.tenant_id == "broken":
+                return {
+                    "workspace_name": workspace.workspace_name,
+                    "status": HealthStatus.ERROR,
+                    "issues": [{"type": "health_check_error"}],
+                }
+            return {
+                "workspace_name": workspace.workspace_name,
+                "status": HealthStatus.HEALTHY,
+                "issues": [],
+            }
+
+        with patch(
+            "mcp_server.tools.management.health_check.get_tenant_guard", return_value=guard
+        ), patch.object(
+            SentinelHealthChecker, "check_workspace_health", AsyncMock(side_effect=check)
+        ) as checked:
+            result = await check_sentinel_health(Mock(), make_lighthouse(workspaces))
+
+        names = [r["workspace_name"] for r in result["workspaces"]]
+        assert names == [ws.workspace_name for ws in workspaces]
+        assert checked.await_count == 3
+        assert [r["issues"][0]["type"] for r in result["workspaces"][2:4]] == [
+            "circuit_open",
+            "circuit_open",
+        ]
+        assert result["workspaces"][4]["status"] == HealthStatus.HEALTHY
+        assert guard.get_states()["broken"]["state"] == "open"
+
+    @pytest.mark.asyncio
+    async def test_metric_errors_keep_circuit_closed(self):
+        """Test that metric-level errors from a reachable tenant do not open its circuit"""
+        guard = TenantGuard(failure_threshold=1)
+        workspaces = [make_workspace(f"ws-{i}", tenant_id="reachable") for i in range(3)]
+        ingestion_failed = {
+            "status": HealthStatus.ERROR,
+            "metrics": {"data_ingestion": {"status": "error", "error": "Ingestion query failed"}},
+            "issues": [],
+        }
+
+        with patch(
+            "mcp_server.tools.management.health_check.get_tenant_guard", return_value=guard
+        ), patch.object(
+            SentinelHealthChecker,
+            "check_workspace_health",
+            AsyncMock(return_value=ingestion_failed),
+        ) as checked:
+            await check_sentinel_health(Mock(), make_lighthouse(workspaces), check_depth="detailed")
+
+        assert checked.await_count == 3
+        assert guard.get_states()["reachable"]["state"] == "closed"
+
+    @pytest.mark.asyncio
+    async def test_timed_out_check_counts_as_failure(self):
+        """Test that a health check exceeding its deadline is recorded against the tenant"""
+        guard = TenantGuard(failure_threshold=1)
+
+        async def hang(workspace, check_depth):
+            await asyncio.sleep(1)
+
+        with patch(
+            "mcp_server.tools.management.health_check.get_tenant_guard", return_value=guard
+        ), patch(
+            "mcp_server.tools.management.health_check.get_settings",
+            return_value=Mock(query_timeout_seconds=0.01),
+        ), patch.object(
+            SentinelHealthChecker, "check_workspace_health", AsyncMock(side_effect=hang)
+        ):
+            result = await check_sentinel_health(
+                Mock(), make_lighthouse([make_workspace("slow", tenant_id="slow")])
+            )
+
+        assert result["workspaces"][0]["issues"][0]["type"] == "timeout"
+        assert guard.get_states()["slow"]["state"] == "open"
+
+    @pytest.mark.asyncio
+    async def test_rule_listing_skips_open_tenant(self):
+        """Test that rule listing reports open-circuit workspaces without calls"""
+        guard = TenantGuard(failure_threshold=1)
+        guard.record_failure("broken")
+        workspaces = [
+            make_workspace("broken-ws", tenant_id="broken"),
+            make_workspace("ok-ws", tenant_id="ok"),
+        ]
+
+        with patch(
+            "mcp_server.tools.exploration.analytics_rules.get_tenant_guard", return_value=guard
+        ), patch.object(
+            AnalyticsRulesExplorer, "list_rules", AsyncMock(return_value=[{"rule_id": "r1"}])
+        ) as listed:
+            result = await list_analytics_rules(Mock(), make_lighthouse(workspaces))
+
+        assert listed.await_count == 1
+        assert "circuit open" in result["workspaces"][0]["error"]
+        assert result["workspaces"][1]["rules_count"] == 1
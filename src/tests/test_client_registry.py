@@ -0,0 +1,53 @@
+"""
+Unit tests for the SecurityInsights client registry
+"""
+
+import pytest
+from unittest.mock import Mock
+from utils.config import Settings
+from utils.client_registry import (
+    SecurityInsightsClientRegistry,
+    get_client_registry,
+    close_client_registry,
+)
+
+
+class TestSecurityInsightsClientRegistry:
+    """Test per-subscription client reuse"""
+
+    @pytest.mark.asyncio
+    async def test_clients_reused_per_subscription(self):
+        """Test that a subscription gets one client and hits are counted"""
+        registry = SecurityInsightsClientRegistry(Mock(), pool_size=4)
+
+        first = registry.get_client("sub-1")
+        again = registry.get_client("SUB-1")
+        other = registry.get_client("sub-2")
+
+        assert first is again
+        assert first is not other
+        assert registry.get_stats() == {"clients": 2, "hits": 1, "misses": 2, "pool_size": 4}
+        await registry.close()
+
+    @pytest.mark.asyncio
+    async def test_clients_share_one_connection_pool(self):
+        """Test that all clients use the same transport, sized to the pool"""
+        registry = SecurityInsightsClientRegistry(Mock(), pool_size=4)
+
+        registry.get_client("sub-1")
+        registry.get_client("sub-2")
+
+        assert registry._session.connector.limit == 4
+        await registry.close()
+        assert registry.get_stats()["clients"] == 0
+
+    @pytest.mark.asyncio
+    async def test_global_registry_sized_from_settings(self):
+        """Test that the global registry is shared and sized to max_concurrent_queries"""
+        registry = get_client_registry(Mock(), Settings(MAX_CONCURRENT_QUERIES=7))
+
+        assert get_client_registry(Mock()) is registry
+        assert registry.pool_size == 7
+
+        await close_client_registry()
+        assert get_client_registry(Mock(), Settings()) is not registry
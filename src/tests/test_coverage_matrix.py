@@ -0,0 +1,99 @@
+"""
+Unit tests for the ATT&CK coverage matrix
+"""
+
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+import numpy as np
+import pytest
+
+from mcp_server.tools.exploration.analytics_rules import AnalyticsRulesExplorer
+from mcp_server.tools.exploration.attack_coverage import get_attack_coverage
+from utils.coverage_matrix import CoverageMatrix
+from utils.rule_catalog import CachedRule
+from tests.conftest import make_lighthouse, make_workspace
+
+
+def make_entry(techniques, tactics=("CredentialAccess",), enabled=True) -> CachedRule:
+    """Create a catalog entry for a rule stand-in"""
+    rule = SimpleNamespace(
+        name="rule", enabled=enabled, techniques=list(techniques), tactics=list(tactics)
+    )
+    return CachedRule(rule, None, None, 0.0)
+
+
+@pytest.fixture
+def matrix():
+    """Three workspaces in two tenants"""
+    return CoverageMatrix(
+        [
+            (
+                make_workspace("a1", "Tenant A"),
+                [make_entry(["T1110", "T1078"]), make_entry(["T1059"], enabled=False)],
+            ),
+            (make_workspace("a2", "Tenant A"), [make_entry(["t1003"], tactics=["Execution"])]),
+            (make_workspace("b1", "Tenant B"), [make_entry(["T1110"]), make_entry(["T1110"])]),
+        ]
+    )
+
+
+class TestCoverageMatrix:
+    """Test matrix construction and vectorized views"""
+
+    def test_counts(self, matrix):
+        """Test that rules are counted per workspace and technique"""
+        assert matrix.techniques == ["T1003", "T1059", "T1078", "T1110"]
+        np.testing.assert_array_equal(
+            matrix.enabled, [[0, 0, 1, 1], [1, 0, 0, 0], [0, 0, 0, 2]]
+        )
+        np.testing.assert_array_equal(matrix.disabled_only[0], [False, True, False, False])
+
+    def test_workspace_summary(self, matrix):
+        summary = {ws["workspace_name"]: ws for ws in matrix.workspace_summary()}
+
+        assert summary["a1"]["techniques_covered"] == 2
+        assert summary["a1"]["techniques_disabled_only"] == 1
+        assert summary["b1"]["fleet_coverage_pct"] == round(100 / 3, 1)
+
+    def test_tenant_gaps(self, matrix):
+        """Test that a tenant's gaps are fleet-covered techniques none of its workspaces cover"""
+        gaps = {tenant["tenant_name"]: tenant["gaps"] for tenant in matrix.tenant_gaps()}
+
+        assert gaps == {"Tenant A": [], "Tenant B": ["T1003", "T1078"]}
+
+    def test_heatmap(self, matrix):
+        heatmap = {row["technique"]: row for row in matrix.heatmap()}
+
+        assert heatmap["T1110"]["workspaces_covered"] == 2
+        assert heatmap["T1110"]["enabled_rules"] == 3
+        assert heatmap["T1059"]["disabled_rules"] == 1
+        assert heatmap["T1059"]["coverage_pct"] == 0.0
+
+    def test_empty_fleet(self):
+        matrix = CoverageMatrix([])
+
+        assert matrix.workspace_summary() == []
+        assert matrix.heatmap() == []
+        assert matrix.tenant_gaps() == []
+
+
+class TestGetAttackCoverage:
+    """Test the cross-workspace tool"""
+
+    @pytest.mark.asyncio
+    async def test_failed_workspace_excluded_from_matrix(self, fan_out):
+        """Test that a failed workspace is reported as an error, not as a gap"""
+
+        async def get_catalog(self, workspace):
+            if workspace.workspace_name == "bad":
+                raise RuntimeError("boom")
+            return [make_entry(["T1110"])]
+
+        workspaces = [make_workspace("good"), make_workspace("bad", "Tenant Two")]
+        with patch.object(AnalyticsRulesExplorer, "get_catalog", get_catalog):
+            result = await get_attack_coverage(Mock(), make_lighthouse(workspaces))
+
+        assert [ws["workspace_name"] for ws in result["workspaces"]] == ["good"]
+        assert [tenant["tenant_name"] for tenant in result["tenants"]] == ["Tenant One"]
+        assert result["errors"][0]["workspace_name"] == "bad"
+        assert result["heatmap"][0]["coverage_pct"] == 100.0
@@ -0,0 +1,86 @@
+"""
+Unit tests for the blocking call executor
+"""
+
+import asyncio
+import threading
+import time
+import pytest
+from utils.executor import BlockingCallExecutor
+
+
+@pytest.fixture
+def executor():
+    """Two-worker executor, shut down after the test"""
+    executor = BlockingCallExecutor(max_workers=2)
+    yield executor
+    executor.shutdown()
+
+
+class TestBlockingCallExecutor:
+    """Test bounded offloading of blocking calls"""
+
+    @pytest.mark.asyncio
+    async def test_concurrency_bounded_by_pool(self, executor):
+        """Test that calls beyond max_workers wait in the queue"""
+
+        def work(value):
+            time.sleep(0.2)
+            return value * 2
+
+        started = time.monotonic()
+        results = await asyncio.gather(*(executor.run(work, i) for i in range(4)))
+        elapsed = time.monotonic() - started
+
+        assert results == [0, 2, 4, 6]
+        assert elapsed >= 0.4
+        stats = executor.get_stats()
+        assert stats["max_queue_depth"] >= 2
+        assert stats["queue_depth"] == 0
+        assert stats["completed"] == 4
+
+    @pytest.mark.asyncio
+    async def test_errors_propagate(self, executor):
+        """Test that exceptions from the callable reach the caller"""
+
+        def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            await executor.run(fail)
+        assert executor.get_stats()["failed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_timeout_drops_queued_call(self, executor):
+        """Test that a timed-out call which never started leaves the queue"""
+        release = threading.Event()
+        calls = []
+
+        blockers = [asyncio.ensure_future(executor.run(release.wait, 5)) for _ in range(2)]
+        await asyncio.sleep(0.05)
+
+        try:
+            with pytest.raises(asyncio.TimeoutError):
+                await executor.run(calls.append, "queued", timeout=0.1)
+        finally:
+            release.set()
+            await asyncio.gather(*blockers)
+
+        stats = executor.get_stats()
+        assert calls == []
+        assert stats["timed_out"] == 1
+        assert stats["queue_depth"] == 0
+
+    @pytest.mark.asyncio
+    async def test_cancellation_counted(self, executor):
+        """Test that cancelling the awaiting task is recorded"""
+        release = threading.Event()
+        task = asyncio.ensure_future(executor.run(release.wait, 5))
+        await asyncio.sleep(0.05)
+
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        release.set()
+
+        assert executor.get_stats()["cancelled"] == 1
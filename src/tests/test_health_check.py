@@ -5,9 +5,11 @@ Unit tests for health check module
 import pytest
 from unittest.mock import Mock, AsyncMock, patch
 from datetime import datetime
+from azure.core.exceptions import HttpResponseError
 from mcp_server.tools.management.health_check import (
     SentinelHealthChecker,
     HealthStatus,
+    check_sentinel_health,
     _calculate_summary_status,
 )
 from utils.lighthouse import SentinelWorkspace
@@ -156,3 +158,80 @@ class TestSummaryCalculation:
 
         status = _calculate_summary_status(results)
         assert status == "unknown"
+
+
+class TestCheckSentinelHealth:
+    """Test multi-workspace health check"""
+
+    @pytest.mark.asyncio
+    async def test_consumes_workspace_stream(self, mock_authenticator, mock_workspace):
+        """Test that workspaces are checked as they are streamed"""
+        lighthouse = Mock()
+        scopes = []
+
+        async def iter_workspaces(tenant_filter=None):
+            scopes.append(tenant_filter)
+            yield mock_workspace
+
+        lighthouse.iter_sentinel_workspaces = iter_workspaces
+        lighthouse.is_access_denied = Mock(return_value=False)
+
+        with patch.object(
+            SentinelHealthChecker,
+            "check_workspace_health",
+            AsyncMock(return_value={"status": HealthStatus.HEALTHY}),
+        ):
+            result = await check_sentinel_health(
+                mock_authenticator, lighthouse, tenant_scope="Test"
+            )
+
+        assert scopes == ["Test"]
+        assert result["summary"]["workspaces_checked"] == 1
+        assert result["summary"]["tenants_checked"] == 1
+        assert result["summary"]["overall_status"] == "healthy"
+        assert set(result["runtime"]) == {
+            "client_pool", "blocking_executor", "arm_read_rates", "single_flight", "rule_catalog",
+            "rule_search_index", "tenant_circuits",
+        }
+
+    @pytest.mark.asyncio
+    async def test_known_denied_workspace_skipped(self, mock_authenticator, mock_workspace):
+        """Test that cached access denials are reported without checking"""
+        lighthouse = Mock()
+
+        async def iter_workspaces(tenant_filter=None):
+            yield mock_workspace
+
+        lighthouse.iter_sentinel_workspaces = iter_workspaces
+        lighthouse.is_access_denied = Mock(return_value=True)
+
+        with patch.object(
+            SentinelHealthChecker, "check_workspace_health", AsyncMock()
+        ) as check:
+            result = await check_sentinel_health(mock_authenticator, lighthouse)
+
+        check.assert_not_awaited()
+        workspace_result = result["workspaces"][0]
+        assert workspace_result["status"] == HealthStatus.ERROR
+        assert workspace_result["issues"][0]["type"] == "access_denied"
+
+    @pytest.mark.asyncio
+    async def test_denied_workspace_recorded(self, mock_authenticator, mock_workspace):
+        """Test that a workspace denying access is recorded for later calls"""
+        lighthouse = Mock()
+
+        async def iter_workspaces(tenant_filter=None):
+            yield mock_workspace
+
+        lighthouse.iter_sentinel_workspaces = iter_workspaces
+        lighthouse.is_access_denied = Mock(return_value=False)
+        denied = HttpResponseError(message="Forbidden")
+        denied.status_code = 403
+
+        with patch.object(
+            SentinelHealthChecker, "_check_data_connectors", AsyncMock(side_effect=denied)
+        ), patch.object(SentinelHealthChecker, "_check_analytics_rules", AsyncMock()):
+            result = await check_sentinel_health(mock_authenticator, lighthouse)
+
+        lighthouse.record_workspace_access.assert_called_once_with(mock_workspace, False)
+        assert result["workspaces"][0]["issues"][0]["type"] == "access_denied"
@@ -0,0 +1,780 @@
+"""
+Unit tests for Lighthouse workspace enumeration module
+"""
+
+import asyncio
+import time
+import pytest
+from types import SimpleNamespace
+from unittest.mock import Mock, MagicMock, AsyncMock, patch
+from azure.core.exceptions import HttpResponseError
+from utils.config import Settings
+from utils.lighthouse import LighthouseManager, SentinelWorkspace
+from utils.resource_graph import ResourceGraphWorkspaceEnumerator
+from utils.inventory_store import WorkspaceInventoryStore
+from utils.tenant_directory import TenantDirectory
+from tests.conftest import make_workspace
+
+
+class StubEnumeration:
+    """Stands in for LighthouseManager._stream_workspaces"""
+
+    def __init__(self, result):
+        """
+        Args:
+            result: List of workspaces, an exception to raise, or an async
+                    callable taking subscription_id and returning a list
+        """
+        self.result = result
+        self.calls = 0
+
+    async def __call__(self, subscription_id=None):
+        self.calls += 1
+        if isinstance(self.result, Exception):
+            raise self.result
+        result = self.result
+        if callable(result):
+            result = await result(subscription_id)
+        for workspace in result:
+            yield workspace
+
+
+class AsyncPager:
+    """Async iterable over a fixed list, like an aio SDK pager"""
+
+    def __init__(self, items):
+        self.items = list(items)
+
+    async def __aiter__(self):
+        for item in self.items:
+            yield item
+
+
+def async_client() -> MagicMock:
+    """Create a mock aio SDK client usable as an async context manager"""
+    client = MagicMock()
+    client.__aenter__.return_value = client
+    return client
+
+
+def make_tenant(tenant_id: str, display_name: str) -> SimpleNamespace:
+    """Create a tenants API entry for tests"""
+    return SimpleNamespace(tenant_id=tenant_id, display_name=display_name, default_domain=None)
+
+
+@pytest.fixture(autouse=True)
+def subscription_client():
+    """Stand-in SubscriptionClient so the tenant directory never calls Azure"""
+    client = Mock()
+    client.tenants.list = Mock(
+        side_effect=lambda: AsyncPager(client.tenants.list.return_value)
+    )
+    client.tenants.list.return_value = [make_tenant("tenant-1", "Contoso Ltd")]
+    with patch("azure.mgmt.resource.subscriptions.aio.SubscriptionClient", return_value=client):
+        yield client
+
+
+@pytest.fixture
+def mock_authenticator():
+    """Create a mock authenticator"""
+    auth = Mock()
+    auth.get_credential = Mock(return_value=Mock())
+    auth.get_async_credential = Mock(return_value=Mock())
+    auth.get_identity_key = Mock(return_value="azure_cli:")
+    return auth
+
+
+@pytest.fixture
+def settings():
+    """Settings with the workspace cache enabled"""
+    return Settings(ENABLE_WORKSPACE_CACHE=True, WORKSPACE_CACHE_TTL=300)
+
+
+class TestWorkspaceCache:
+    """Test the stale-while-revalidate workspace cache"""
+
+    @pytest.mark.asyncio
+    async def test_cold_cache_enumerates_once(self, mock_authenticator, settings):
+        """Test that concurrent cold callers share a single enumeration"""
+        manager = LighthouseManager(mock_authenticator, settings)
+        manager._stream_workspaces = StubEnumeration([make_workspace("ws-a")])
+
+        results = await asyncio.gather(
+            manager.get_sentinel_workspaces(),
+            manager.get_sentinel_workspaces(),
+        )
+
+        assert manager._stream_workspaces.calls == 1
+        assert [ws.workspace_name for ws in results[0]] == ["ws-a"]
+        assert [ws.workspace_name for ws in results[1]] == ["ws-a"]
+
+    @pytest.mark.asyncio
+    async def test_fresh_cache_skips_enumeration(self, mock_authenticator, settings):
+        """Test that a fresh cache is served without enumerating"""
+        manager = LighthouseManager(mock_authenticator, settings)
+        manager._stream_workspaces = StubEnumeration([make_workspace("ws-a")])
+
+        await manager.get_sentinel_workspaces()
+        await manager.get_sentinel_workspaces()
+
+        assert manager._stream_workspaces.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_stale_cache_served_while_refreshing(self, mock_authenticator, settings):
+        """Test that an expired cache is returned immediately and refreshed once"""
+        manager = LighthouseManager(mock_authenticator, settings)
+        manager._workspace_cache = [make_workspace("old")]
+        manager._cache_timestamp = time.time() - 3600
+
+        refresh_started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def slow_enumeration(subscription_id=None):
+            refresh_started.set()
+            await release.wait()
+            return [make_workspace("new")]
+
+        manager._stream_workspaces = StubEnumeration(slow_enumeration)
+
+        first = await manager.get_sentinel_workspaces()
+        second = await manager.get_sentinel_workspaces()
+        await refresh_started.wait()
+
+        assert [ws.workspace_name for ws in first] == ["old"]
+        assert [ws.workspace_name for ws in second] == ["old"]
+        assert manager._stream_workspaces.calls == 1
+
+        release.set()
+        await manager._refresh_task
+
+        refreshed = await manager.get_sentinel_workspaces()
+        assert [ws.workspace_name for ws in refreshed] == ["new"]
+
+    @pytest.mark.asyncio
+    async def test_failed_background_refresh_keeps_stale_cache(
+        self, mock_authenticator, settings
+    ):
+        """Test that a failing refresh does not drop the stale cache"""
+        manager = LighthouseManager(mock_authenticator, settings)
+        manager._workspace_cache = [make_workspace("old")]
+        manager._cache_timestamp = time.time() - 3600
+        manager._stream_workspaces = StubEnumeration(RuntimeError("boom"))
+
+        result = await manager.get_sentinel_workspaces()
+        with pytest.raises(RuntimeError):
+            await manager._refresh_task
+
+        assert [ws.workspace_name for ws in result] == ["old"]
+        assert [ws.workspace_name for ws in manager._workspace_cache] == ["old"]
+
+    @pytest.mark.asyncio
+    async def test_subscription_filter_uses_cache(self, mock_authenticator, settings):
+        """Test that a subscription filter is applied to the cached list"""
+        manager = LighthouseManager(mock_authenticator, settings)
+        manager._stream_workspaces = StubEnumeration(
+            [make_workspace("ws-a"), make_workspace("ws-b", subscription_id="sub-2")]
+        )
+
+        await manager.get_sentinel_workspaces()
+        result = await manager.get_sentinel_workspaces(subscription_id="sub-2")
+
+        assert [ws.workspace_name for ws in result] == ["ws-b"]
+        assert manager._stream_workspaces.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_cache_disabled(self, mock_authenticator):
+        """Test that every call enumerates when the cache is disabled"""
+        settings = Settings(ENABLE_WORKSPACE_CACHE=False)
+        manager = LighthouseManager(mock_authenticator, settings)
+        manager._stream_workspaces = StubEnumeration([make_workspace("ws-a")])
+
+        await manager.get_sentinel_workspaces()
+        await manager.get_sentinel_workspaces()
+
+        assert manager._stream_workspaces.calls == 2
+
+
+class TestResourceGraphBackend:
+    """Test Resource Graph workspace enumeration"""
+
+    @pytest.mark.asyncio
+    async def test_pages_are_followed(self, fake_resource_graph):
+        """Test that every page of results is collected"""
+        enumerator = ResourceGraphWorkspaceEnumerator(
+            Mock(), client=fake_resource_graph, page_size=3
+        )
+
+        workspaces = await enumerator.get_sentinel_workspaces()
+
+        assert len(workspaces) == 8
+        assert len(fake_resource_graph.requests) == 3
+        assert all(isinstance(ws, SentinelWorkspace) for ws in workspaces)
+
+    @pytest.mark.asyncio
+    async def test_row_mapping(self, fake_resource_graph):
+        """Test that result rows map onto SentinelWorkspace fields"""
+        enumerator = ResourceGraphWorkspaceEnumerator(Mock(), client=fake_resource_graph)
+
+        workspace = (await enumerator.get_sentinel_workspaces())[0]
+
+        assert workspace.workspace_name == "ws-00"
+        assert workspace.resource_group == "rg-ws-00"
+        assert workspace.subscription_id == "sub-1"
+        assert workspace.tenant_id == "tenant-1"
+        assert workspace.tenant_name == "Subscription sub-1"
+        assert workspace.sku == "PerGB2018"
+
+    @pytest.mark.asyncio
+    async def test_manager_uses_resource_graph_backend(
+        self, mock_authenticator, fake_resource_graph
+    ):
+        """Test that the config switch routes enumeration to Resource Graph"""
+        settings = Settings(WORKSPACE_DISCOVERY_BACKEND="resource_graph")
+        manager = LighthouseManager(mock_authenticator, settings)
+        manager._resource_graph = ResourceGraphWorkspaceEnumerator(
+            Mock(), client=fake_resource_graph
+        )
+
+        workspaces = await manager.get_sentinel_workspaces(subscription_id="sub-2")
+
+        assert [ws.workspace_name for ws in workspaces] == ["ws-05", "ws-06", "ws-07"]
+        assert fake_resource_graph.requests[0].subscriptions == ["sub-2"]
+        assert workspaces[0].tenant_name == "Contoso Ltd"
+
+
+class TestParallelSubscriptionScan:
+    """Test bounded-concurrency subscription scanning"""
+
+    @pytest.fixture
+    def manager(self, mock_authenticator):
+        settings = Settings(MAX_CONCURRENT_QUERIES=4, QUERY_TIMEOUT_SECONDS=1)
+        manager = LighthouseManager(mock_authenticator, settings)
+        manager.get_all_subscriptions = AsyncMock(
+            return_value=[
+                {"subscription_id": f"sub-{i}", "tenant_id": "tenant-1"}
+                for i in range(4)
+            ]
+        )
+        return manager
+
+    @pytest.mark.asyncio
+    async def test_subscriptions_scanned_concurrently(self, manager):
+        """Test that subscriptions are scanned at the same time, not one after another"""
+        in_flight = []
+        all_started = asyncio.Event()
+
+        async def scan(sub):
+            in_flight.append(sub["subscription_id"])
+            if len(in_flight) == 4:
+                all_started.set()
+            # Sequential scans would wait here until the test deadline
+            await asyncio.wait_for(all_started.wait(), 5)
+            sub_id = sub["subscription_id"]
+            return [make_workspace(f"ws-{sub_id}", subscription_id=sub_id)]
+
+        manager._scan_subscription = scan
+
+        workspaces = [ws async for ws in manager._stream_workspaces_arm()]
+
+        assert len(workspaces) == 4
+
+    @pytest.mark.asyncio
+    async def test_failed_and_slow_subscriptions_are_isolated(self, manager):
+        """Test that errors and timeouts only drop their own subscription"""
+        release = asyncio.Event()
+
+        async def scan(sub):
+            sub_id = sub["subscription_id"]
+            if sub_id == "sub-1":
+                raise RuntimeError("access denied")
+            if sub_id == "sub-2":
+                await release.wait()
+                return [make_workspace("too-late", subscription_id=sub_id)]
+            return [make_workspace(f"ws-{sub_id}", subscription_id=sub_id)]
+
+        manager._scan_subscription = scan
+
+        workspaces = [ws async for ws in manager._stream_workspaces_arm()]
+
+        assert sorted(ws.workspace_name for ws in workspaces) == ["ws-sub-0", "ws-sub-3"]
+
+
+class TestWorkspaceInventoryStore:
+    """Test the persisted workspace inventory"""
+
+    def test_round_trip(self, tmp_path):
+        """Test that saved workspaces load back unchanged"""
+        store = WorkspaceInventoryStore(str(tmp_path / "inventory.db"))
+        workspaces = [make_workspace("ws-a"), make_workspace("ws-b", subscription_id="sub-2")]
+
+        store.save(workspaces, 1700000000.5)
+        loaded, generated_at = store.load()
+
+        assert sorted(loaded, key=lambda ws: ws.workspace_name) == workspaces
+        assert generated_at == 1700000000.5
+
+    def test_other_identity_ignored(self, tmp_path):
+        """Test that an inventory saved under another identity is not loaded"""
+        path = str(tmp_path / "inventory.db")
+        WorkspaceInventoryStore(path, identity="service_principal:t-1:c-1").save(
+            [make_workspace("ws-a")], 1700000000.5
+        )
+
+        assert WorkspaceInventoryStore(path, identity="service_principal:t-2:c-1").load() is None
+        assert WorkspaceInventoryStore(path, identity="service_principal:t-1:c-1").load()
+
+    def test_missing_store(self, tmp_path):
+        """Test that a missing database yields no inventory"""
+        store = WorkspaceInventoryStore(str(tmp_path / "missing.db"))
+
+        assert store.load() is None
+
+    @pytest.mark.asyncio
+    async def test_warm_restart_serves_persisted_inventory(self, mock_authenticator):
+        """Test that a new manager serves the previous run's inventory instantly"""
+        settings = Settings()
+        first = LighthouseManager(mock_authenticator, settings)
+        first._stream_workspaces = StubEnumeration([make_workspace("ws-a")])
+        await first.get_sentinel_workspaces()
+
+        release = asyncio.Event()
+
+        async def slow_enumeration(subscription_id=None):
+            await release.wait()
+            return [make_workspace("ws-a"), make_workspace("ws-b")]
+
+        second = LighthouseManager(mock_authenticator, settings)
+        second._stream_workspaces = StubEnumeration(slow_enumeration)
+        await second.warm_up()
+
+        workspaces = await second.get_sentinel_workspaces()
+        assert [ws.workspace_name for ws in workspaces] == ["ws-a"]
+
+        release.set()
+        await second._refresh_task
+
+        refreshed = await second.get_sentinel_workspaces()
+        assert [ws.workspace_name for ws in refreshed] == ["ws-a", "ws-b"]
+
+
+class TestIndexedLookup:
+    """Test index-backed workspace lookups on the manager"""
+
+    @pytest.mark.asyncio
+    async def test_lookups_reuse_cached_index(self, mock_authenticator, settings):
+        """Test that lookups resolve from the cache without re-enumerating"""
+        manager = LighthouseManager(mock_authenticator, settings)
+        manager._stream_workspaces = StubEnumeration(
+            [make_workspace("prod-ws"), make_workspace("dev-ws", subscription_id="sub-2")]
+        )
+
+        workspace = await manager.get_workspace_by_name("PROD-WS")
+        matches = await manager.find_workspaces(workspace_filter="*-ws")
+        index = await manager.get_workspace_index()
+
+        assert workspace.subscription_id == "sub-1"
+        assert len(matches) == 2
+        assert index is manager._workspace_index
+        assert manager._stream_workspaces.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_resource_id_resolves_without_enumeration(self, mock_authenticator, settings):
+        """Test that a resource ID or full address never enumerates workspaces"""
+        manager = LighthouseManager(mock_authenticator, settings)
+        manager._stream_workspaces = StubEnumeration([make_workspace("prod-ws")])
+        resource_id = make_workspace("prod-ws").workspace_id
+
+        by_id = await manager.resolve_workspace(resource_id)
+        by_triple = await manager.resolve_workspace(
+            "prod-ws", subscription_id="sub-1", resource_group="rg"
+        )
+
+        assert manager._stream_workspaces.calls == 0
+        assert by_id == by_triple
+        assert (by_id.subscription_id, by_id.resource_group) == ("sub-1", "rg")
+        with pytest.raises(ValueError, match="resource ID"):
+            await manager.resolve_workspace("/subscriptions/sub-1/resourceGroups/rg")
+
+    @pytest.mark.asyncio
+    async def test_resource_id_prefers_cached_inventory(self, mock_authenticator, settings):
+        """Test that a known workspace keeps its tenant from the inventory"""
+        manager = LighthouseManager(mock_authenticator, settings)
+        manager._stream_workspaces = StubEnumeration([make_workspace("prod-ws")])
+        await manager.get_sentinel_workspaces()
+
+        workspace = await manager.resolve_workspace(
+            make_workspace("prod-ws").workspace_id.upper()
+        )
+
+        assert workspace.tenant_name == "Tenant One"
+        assert manager._stream_workspaces.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_subscription_narrows_cold_lookup(self, mock_authenticator, settings):
+        """Test that a name plus subscription scans only that subscription"""
+        scanned = []
+
+        async def enumerate_subscription(subscription_id):
+            scanned.append(subscription_id)
+            return [make_workspace("prod-ws", subscription_id=subscription_id)]
+
+        manager = LighthouseManager(mock_authenticator, settings)
+        manager._stream_workspaces = StubEnumeration(enumerate_subscription)
+
+        workspace = await manager.resolve_workspace("PROD-WS", subscription_id="sub-2")
+
+        assert workspace.subscription_id == "sub-2"
+        assert scanned == ["sub-2"]
+
+
+class TestWorkspaceStreaming:
+    """Test iter_sentinel_workspaces streaming"""
+
+    @pytest.mark.asyncio
+    async def test_cold_cache_streams_before_enumeration_finishes(
+        self, mock_authenticator, settings
+    ):
+        """Test that workspaces are yielded while enumeration is still running"""
+        manager = LighthouseManager(mock_authenticator, settings)
+        release = asyncio.Event()
+
+        async def stream(subscription_id=None):
+            yield make_workspace("first")
+            await release.wait()
+            yield make_workspace("second")
+
+        manager._stream_workspaces = stream
+
+        stream_iter = manager.iter_sentinel_workspaces()
+        first = await asyncio.wait_for(stream_iter.__anext__(), timeout=1)
+        assert first.workspace_name == "first"
+        assert manager._workspace_cache is None
+
+        release.set()
+        rest = [ws async for ws in stream_iter]
+
+        assert [ws.workspace_name for ws in rest] == ["second"]
+        assert [ws.workspace_name for ws in manager._workspace_cache] == ["first", "second"]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_streams_share_one_enumeration(
+        self, mock_authenticator, settings
+    ):
+        """Test that a late subscriber replays workspaces discovered so far"""
+        manager = LighthouseManager(mock_authenticator, settings)
+        manager._stream_workspaces = StubEnumeration(
+            [make_workspace("ws-a"), make_workspace("ws-b")]
+        )
+
+        async def collect(**filters):
+            return [ws.workspace_name async for ws in manager.iter_sentinel_workspaces(**filters)]
+
+        everything, filtered = await asyncio.gather(
+            collect(), collect(workspace_filter="*-b")
+        )
+
+        assert everything == ["ws-a", "ws-b"]
+        assert filtered == ["ws-b"]
+        assert manager._stream_workspaces.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_warm_cache_streams_from_index(self, mock_authenticator, settings):
+        """Test that a warm cache is streamed without enumerating"""
+        manager = LighthouseManager(mock_authenticator, settings)
+        manager._stream_workspaces = StubEnumeration([make_workspace("ws-a")])
+        await manager.get_sentinel_workspaces()
+
+        streamed = [ws async for ws in manager.iter_sentinel_workspaces()]
+
+        assert [ws.workspace_name for ws in streamed] == ["ws-a"]
+        assert manager._stream_workspaces.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_enumeration_error_surfaces(self, mock_authenticator, settings):
+        """Test that a failed cold enumeration raises in the consumer"""
+        manager = LighthouseManager(mock_authenticator, settings)
+        manager._stream_workspaces = StubEnumeration(RuntimeError("boom"))
+
+        with pytest.raises(RuntimeError):
+            [ws async for ws in manager.iter_sentinel_workspaces()]
+
+
+def make_resource(name: str, resource_type: str, resource_group: str = "rg") -> SimpleNamespace:
+    """Create an ARM generic resource for tests"""
+    return SimpleNamespace(
+        id=f"/subscriptions/sub-1/resourceGroups/{resource_group}/providers/{resource_type}/{name}",
+        name=name,
+        location="westeurope",
+    )
+
+
+class TestSentinelOnboardingDetection:
+    """Test bulk Sentinel onboarding detection"""
+
+    WORKSPACE_TYPE = "Microsoft.OperationalInsights/workspaces"
+    SOLUTION_TYPE = "Microsoft.OperationsManagement/solutions"
+
+    @pytest.fixture
+    def resource_client(self):
+        client = async_client()
+        la_workspaces = [
+            make_resource("sentinel-ws", self.WORKSPACE_TYPE),
+            make_resource("plain-ws", self.WORKSPACE_TYPE),
+        ]
+        solutions = [
+            make_resource("SecurityInsights(sentinel-ws)", self.SOLUTION_TYPE),
+            make_resource("Updates(plain-ws)", self.SOLUTION_TYPE),
+        ]
+
+        def list_resources(filter):
+            return AsyncPager(la_workspaces if self.WORKSPACE_TYPE in filter else solutions)
+
+        client.resources.list = Mock(side_effect=list_resources)
+        client.resources.get_by_id = AsyncMock(side_effect=self.solution_details)
+        return client
+
+    def solution_details(self, resource_id, api_version):
+        """Read a solution, pointing SecurityInsights(<name>) at workspace <name> in rg"""
+        name = resource_id.rsplit("/", 1)[-1]
+        workspace_name = name[len("SecurityInsights("):-1]
+        workspace = make_resource(workspace_name, self.WORKSPACE_TYPE)
+        return SimpleNamespace(id=resource_id, properties={"workspaceResourceId": workspace.id})
+
+    @pytest.mark.asyncio
+    async def test_only_onboarded_workspaces_returned(
+        self, mock_authenticator, settings, resource_client
+    ):
+        """Test that workspaces without the SecurityInsights solution are skipped"""
+        manager = LighthouseManager(mock_authenticator, settings)
+
+        with patch("utils.lighthouse.ResourceManagementClient", return_value=resource_client):
+            workspaces = await manager._scan_subscription({"subscription_id": "sub-1"})
+
+        assert [ws.workspace_name for ws in workspaces] == ["sentinel-ws"]
+        assert manager.is_sentinel_enabled(make_resource("plain-ws", self.WORKSPACE_TYPE).id) is False
+        assert manager.is_sentinel_enabled(make_resource("sentinel-ws", self.WORKSPACE_TYPE).id) is True
+
+    @pytest.mark.asyncio
+    async def test_solution_in_other_resource_group(
+        self, mock_authenticator, settings, resource_client
+    ):
+        """Test that a solution is matched by its workspace, not its resource group"""
+        manager = LighthouseManager(mock_authenticator, settings)
+        la_workspaces = resource_client.resources.list(filter=self.WORKSPACE_TYPE).items
+        solutions = [
+            make_resource("SecurityInsights(sentinel-ws)", self.SOLUTION_TYPE, "solutions-rg"),
+        ]
+        resource_client.resources.list = Mock(
+            side_effect=lambda filter: AsyncPager(
+                la_workspaces if self.WORKSPACE_TYPE in filter else solutions
+            )
+        )
+
+        with patch("utils.lighthouse.ResourceManagementClient", return_value=resource_client):
+            workspaces = await manager._scan_subscription({"subscription_id": "sub-1"})
+
+        assert [ws.workspace_name for ws in workspaces] == ["sentinel-ws"]
+        resource_client.resources.get_by_id.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_cached_states_skip_detection(
+        self, mock_authenticator, settings, resource_client
+    ):
+        """Test that a rescan reuses cached onboarding states"""
+        manager = LighthouseManager(mock_authenticator, settings)
+
+        with patch("utils.lighthouse.ResourceManagementClient", return_value=resource_client):
+            await manager._scan_subscription({"subscription_id": "sub-1"})
+            await manager._scan_subscription({"subscription_id": "sub-1"})
+
+        solution_calls = [
+            call for call in resource_client.resources.list.call_args_list
+            if self.SOLUTION_TYPE in call.kwargs["filter"]
+        ]
+        assert len(solution_calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_onboarding_states(
+        self, mock_authenticator, settings, resource_client
+    ):
+        """Test per-workspace probing when solutions cannot be listed"""
+        manager = LighthouseManager(mock_authenticator, settings)
+        la_workspaces = resource_client.resources.list(filter=self.WORKSPACE_TYPE).items
+
+        def list_resources(filter):
+            if self.SOLUTION_TYPE in filter:
+                raise RuntimeError("AuthorizationFailed")
+            return AsyncPager(la_workspaces)
+
+        resource_client.resources.list = Mock(side_effect=list_resources)
+        sentinel_client = Mock()
+        sentinel_client.sentinel_onboarding_states.list = AsyncMock(
+            side_effect=lambda resource_group_name, workspace_name: SimpleNamespace(
+                value=["default"] if workspace_name == "sentinel-ws" else []
+            )
+        )
+
+        manager.client_registry = Mock(get_client=Mock(return_value=sentinel_client))
+
+        with patch("utils.lighthouse.ResourceManagementClient", return_value=resource_client):
+            workspaces = await manager._scan_subscription({"subscription_id": "sub-1"})
+
+        assert [ws.workspace_name for ws in workspaces] == ["sentinel-ws"]
+
+
+class TestTenantDirectory:
+    """Test tenant directory resolution"""
+
+    @pytest.fixture
+    def directory(self):
+        client = Mock()
+        client.tenants.list = Mock(
+            return_value=AsyncPager(
+                [
+                    make_tenant("TENANT-A", "Contoso Ltd"),
+                    make_tenant("tenant-b", "Contoso EU"),
+                    make_tenant("tenant-c", "Fabrikam"),
+                ]
+            )
+        )
+        return TenantDirectory(Mock(), ttl_seconds=300, client=client)
+
+    @pytest.mark.asyncio
+    async def test_resolve_exact(self, directory):
+        """Test that exact IDs and names resolve to a single tenant"""
+        assert await directory.resolve_filter("tenant-a") == {"tenant-a"}
+        assert await directory.resolve_filter("contoso ltd") == {"tenant-a"}
+
+    @pytest.mark.asyncio
+    async def test_resolve_pattern(self, directory):
+        """Test that non-exact filters fall back to name patterns"""
+        assert await directory.resolve_filter("contoso") == {"tenant-a", "tenant-b"}
+        assert await directory.resolve_filter("Fab*") == {"tenant-c"}
+        assert await directory.resolve_filter("unknown") is None
+
+    @pytest.mark.asyncio
+    async def test_loaded_once_within_ttl(self, directory):
+        """Test that the tenants API is called once per TTL"""
+        await directory.get_tenant_names()
+        await directory.resolve_filter("Fabrikam")
+
+        assert directory._client.tenants.list.call_count == 1
+        assert (await directory.get_tenant_names())["tenant-c"] == "Fabrikam"
+
+    @pytest.mark.asyncio
+    async def test_created_client_is_throttled_and_closed(self, subscription_client):
+        """Test that a lazily created client gets the ARM throttling policy and is closed"""
+        subscription_client.close = AsyncMock()
+        directory = TenantDirectory(Mock())
+
+        with patch(
+            "azure.mgmt.resource.subscriptions.aio.SubscriptionClient",
+            return_value=subscription_client,
+        ) as client_class:
+            await directory.get_tenant_names()
+        await directory.close()
+
+        assert "per_retry_policies" in client_class.call_args.kwargs
+        subscription_client.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_load_backs_off(self):
+        """Test that a failed load is not retried on every call"""
+        client = Mock()
+        client.tenants.list = Mock(side_effect=RuntimeError("forbidden"))
+        directory = TenantDirectory(Mock(), client=client)
+
+        assert await directory.get_tenant_names() == {}
+        assert await directory.resolve_filter("anything") is None
+        assert client.tenants.list.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_tenant_filter_is_exact(self, mock_authenticator, settings, subscription_client):
+        """Test that an exact tenant name does not match similarly named tenants"""
+        subscription_client.tenants.list.return_value = [
+            make_tenant("tenant-1", "Contoso"),
+            make_tenant("tenant-2", "Contoso EU"),
+        ]
+        manager = LighthouseManager(mock_authenticator, settings)
+        manager._stream_workspaces = StubEnumeration(
+            [
+                SentinelWorkspace("/ws/a", "ws-a", "rg", "sub-1", "tenant-1", "Contoso"),
+                SentinelWorkspace("/ws/b", "ws-b", "rg", "sub-2", "tenant-2", "Contoso EU"),
+            ]
+        )
+
+        exact = await manager.find_workspaces(tenant_filter="contoso")
+        pattern = await manager.find_workspaces(tenant_filter="contoso*")
+
+        assert [ws.workspace_name for ws in exact] == ["ws-a"]
+        assert sorted(ws.workspace_name for ws in pattern) == ["ws-a", "ws-b"]
+
+
+class TestWorkspaceAccessValidation:
+    """Test access validation sweep and its cache"""
+
+    @staticmethod
+    def denied_error():
+        error = HttpResponseError(message="Forbidden")
+        error.status_code = 403
+        return error
+
+    @pytest.mark.asyncio
+    async def test_sweep_runs_concurrently(self, mock_authenticator):
+        """Test that probes overlap, bounded by max_concurrent_queries"""
+        manager = LighthouseManager(mock_authenticator, Settings(MAX_CONCURRENT_QUERIES=4))
+        workspaces = [make_workspace(f"ws-{i}") for i in range(4)]
+
+        in_flight = []
+        all_started = asyncio.Event()
+
+        async def probe(workspace):
+            in_flight.append(workspace.workspace_name)
+            if len(in_flight) == 4:
+                all_started.set()
+            # Sequential probes would wait here until the test deadline
+            await asyncio.wait_for(all_started.wait(), 5)
+            if workspace.workspace_name == "ws-1":
+                raise self.denied_error()
+
+        manager._probe_workspace_access = probe
+
+        access = await manager.validate_workspaces_access(workspaces)
+
+        assert [access[ws.workspace_id] for ws in workspaces] == [True, False, True, True]
+        assert manager.is_access_denied(workspaces[1])
+        assert not manager.is_access_denied(workspaces[0])
+
+    @pytest.mark.asyncio
+    async def test_cached_results_skip_probe(self, mock_authenticator, settings):
+        """Test that cached denials and grants are not probed again"""
+        manager = LighthouseManager(mock_authenticator, settings)
+        workspace = make_workspace("ws-a")
+        manager._probe_workspace_access = AsyncMock(side_effect=self.denied_error())
+
+        assert await manager.validate_workspace_access(workspace) is False
+        assert await manager.validate_workspace_access(workspace) is False
+        assert manager._probe_workspace_access.call_count == 1
+
+        manager._probe_workspace_access = AsyncMock()
+        assert await manager.validate_workspace_access(workspace, use_cache=False) is True
+        assert manager.get_workspace_access(workspace) is True
+
+    @pytest.mark.asyncio
+    async def test_transient_failures_not_cached(self, mock_authenticator, settings):
+        """Test that non-authorization errors are not negatively cached"""
+        manager = LighthouseManager(mock_authenticator, settings)
+        workspace = make_workspace("ws-a")
+        manager._probe_workspace_access = AsyncMock(side_effect=RuntimeError("timeout"))
+
+        assert await manager.validate_workspace_access(workspace) is False
+        assert manager.get_workspace_access(workspace) is None
+
+    def test_denial_expires(self, mock_authenticator):
+        """Test that denials expire after ACCESS_DENIED_CACHE_TTL"""
+        manager = LighthouseManager(mock_authenticator, Settings(ACCESS_DENIED_CACHE_TTL=0))
+        workspace = make_workspace("ws-a")
+
+        manager.record_workspace_access(workspace, False)
+
+        assert not manager.is_access_denied(workspace)
@@ -0,0 +1,172 @@
+"""
+Unit tests for the adaptive ARM rate limiter
+"""
+
+import asyncio
+import time
+import pytest
+from types import SimpleNamespace
+from utils.rate_limiter import (
+    AdaptiveRateLimiter,
+    ArmThrottlingPolicy,
+    TokenBucket,
+    parse_retry_after,
+    subscription_from_url,
+)
+
+SUB_URL = (
+    "https://management.azure.com/subscriptions/SUB-1/resourceGroups/rg"
+    "/providers/Microsoft.OperationalInsights/workspaces/ws/providers"
+    "/Microsoft.SecurityInsights/alertRules?api-version=2022-01-01"
+)
+
+
+class FakeNextPolicy:
+    """Terminal policy returning canned responses"""
+
+    def __init__(self, status_code=200, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.sent = 0
+
+    async def send(self, request):
+        self.sent += 1
+        return SimpleNamespace(
+            http_response=SimpleNamespace(status_code=self.status_code, headers=self.headers)
+        )
+
+
+class TestHeaderParsing:
+    """Test URL and header helpers"""
+
+    def test_subscription_from_url(self):
+        """Test that the subscription ID is extracted and lowercased"""
+        assert subscription_from_url(SUB_URL) == "sub-1"
+        assert subscription_from_url("https://management.azure.com/tenants?api-version=1") is None
+
+    def test_parse_retry_after(self):
+        """Test seconds, HTTP dates and invalid values"""
+        assert parse_retry_after("7") == 7.0
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after(None) is None
+
+
+class TestAdaptiveRateLimiter:
+    """Test per-tenant rate adaptation"""
+
+    def test_low_quota_reduces_rate(self):
+        """Test that remaining reads below the watermark slow the tenant down"""
+        limiter = AdaptiveRateLimiter(max_rate=20, low_watermark=100)
+
+        limiter.observe("sub-1", 200, {"x-ms-ratelimit-remaining-subscription-reads": "50"})
+
+        assert limiter.get_rates() == {"sub-1": 15.0}
+
+    def test_plentiful_quota_recovers_rate(self):
+        """Test that the rate climbs back up to max_rate"""
+        limiter = AdaptiveRateLimiter(max_rate=20, low_watermark=100)
+        limiter.observe("sub-1", 200, {"x-ms-ratelimit-remaining-subscription-reads": "10"})
+
+        for _ in range(10):
+            limiter.observe("sub-1", 200, {"x-ms-ratelimit-remaining-subscription-reads": "11000"})
+
+        assert limiter.get_rates()["sub-1"] == 20.0
+
+    def test_lowest_remaining_header_wins(self):
+        """Test that tenant-level quota is honoured alongside subscription quota"""
+        limiter = AdaptiveRateLimiter(max_rate=20, low_watermark=100)
+
+        limiter.observe(
+            "sub-1",
+            200,
+            {
+                "x-ms-ratelimit-remaining-subscription-reads": "11000",
+                "x-ms-ratelimit-remaining-tenant-reads": "20",
+            },
+        )
+
+        assert limiter.get_rates()["sub-1"] == 15.0
+
+    def test_throttled_response_pauses_and_halves(self):
+        """Test that a 429 halves the rate and pauses for Retry-After"""
+        limiter = AdaptiveRateLimiter(max_rate=20)
+
+        limiter.observe("sub-1", 429, {"Retry-After": "3"})
+
+        bucket = limiter._buckets["sub-1"]
+        assert bucket.rate == 10.0
+        assert bucket.paused_until - time.monotonic() > 2.5
+
+    def test_subscriptions_share_tenant_bucket(self):
+        """Test that registered subscriptions are paced by their tenant"""
+        limiter = AdaptiveRateLimiter(max_rate=20, low_watermark=100)
+        limiter.register_subscription("SUB-1", "Tenant-A")
+        limiter.register_subscription("sub-2", "tenant-a")
+
+        limiter.observe("sub-1", 200, {"x-ms-ratelimit-remaining-subscription-reads": "5"})
+        limiter.observe("sub-2", 200, {"x-ms-ratelimit-remaining-subscription-reads": "5"})
+        limiter.observe("sub-3", 200, {"x-ms-ratelimit-remaining-subscription-reads": "5000"})
+
+        assert limiter.get_rates() == {"tenant-a": 11.25, "sub-3": 20.0}
+
+
+class TestTokenBucket:
+    """Test token bucket pacing"""
+
+    @pytest.mark.asyncio
+    async def test_rate_limits_after_burst(self):
+        """Test that requests beyond the burst are paced at the refill rate"""
+        bucket = TokenBucket(rate=10)
+
+        started = time.monotonic()
+        for _ in range(13):
+            await bucket.acquire()
+        elapsed = time.monotonic() - started
+
+        assert elapsed >= 0.25
+
+    @pytest.mark.asyncio
+    async def test_pause_blocks_acquire(self):
+        """Test that a pause holds back all requests"""
+        bucket = TokenBucket(rate=100)
+        bucket.pause(0.2)
+
+        started = time.monotonic()
+        await bucket.acquire()
+
+        assert time.monotonic() - started >= 0.19
+
+
+class TestArmThrottlingPolicy:
+    """Test the pipeline policy"""
+
+    @pytest.mark.asyncio
+    async def test_policy_feeds_response_headers_back(self):
+        """Test that each response adjusts the bucket of its subscription"""
+        limiter = AdaptiveRateLimiter(max_rate=20, low_watermark=100)
+        policy = ArmThrottlingPolicy(limiter)
+        policy.next = FakeNextPolicy(headers={"x-ms-ratelimit-remaining-subscription-reads": "1"})
+        request = SimpleNamespace(http_request=SimpleNamespace(url=SUB_URL), context={})
+
+        await policy.send(request)
+
+        assert policy.next.sent == 1
+        assert limiter.get_rates() == {"sub-1": 15.0}
+
+    @pytest.mark.asyncio
+    async def test_throttled_retry_not_paused_twice(self):
+        """Test that only the retry policy waits before retrying a throttled request"""
+        limiter = AdaptiveRateLimiter(max_rate=20)
+        policy = ArmThrottlingPolicy(limiter)
+        policy.next = FakeNextPolicy(status_code=429, headers={"Retry-After": "60"})
+        request = SimpleNamespace(http_request=SimpleNamespace(url=SUB_URL), context={})
+
+        await policy.send(request)
+        policy.next.status_code = 200
+        # The bucket is paused for a minute; the retry must not wait for it
+        await asyncio.wait_for(policy.send(request), 1)
+
+        assert policy.next.sent == 2
+        assert request.context == {}
+        assert limiter._buckets["sub-1"].paused_until - time.monotonic() > 50
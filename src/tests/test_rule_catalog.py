@@ -0,0 +1,140 @@
+"""
+Unit tests for the analytics rule catalog
+"""
+
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+import pytest
+
+from mcp_server.tools.exploration.analytics_rules import AnalyticsRulesExplorer
+from utils.lighthouse import SentinelWorkspace
+from utils.rule_catalog import RuleCatalog
+
+
+WORKSPACE = SentinelWorkspace(
+    workspace_id="/subscriptions/sub-1/resourceGroups/rg/providers/Microsoft.OperationalInsights/workspaces/ws",
+    workspace_name="ws",
+    resource_group="rg",
+    subscription_id="sub-1",
+    tenant_id="tenant-1",
+)
+
+
+def make_rule(name: str, etag: str = "v1", enabled: bool = True) -> SimpleNamespace:
+    """Create an alert rule stand-in"""
+    return SimpleNamespace(
+        name=name, display_name=name.title(), kind="Scheduled", enabled=enabled,
+        etag=etag, last_modified_utc=None,
+    )
+
+
+class TestRuleCatalog:
+    """Test catalog caching and revalidation"""
+
+    @pytest.mark.asyncio
+    async def test_listing_served_from_cache_within_ttl(self):
+        """Test that a fresh catalog does not list the workspace again"""
+        catalog = RuleCatalog(ttl_seconds=60)
+        fetch = AsyncMock(return_value=[make_rule("a"), make_rule("b")])
+
+        await catalog.get_or_load(WORKSPACE, fetch)
+        entries = await catalog.get_or_load(WORKSPACE, fetch)
+
+        assert fetch.await_count == 1
+        assert [entry.rule.name for entry in entries] == ["a", "b"]
+        assert catalog.get_stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_revalidation_keeps_unchanged_entries(self):
+        """Test that only rules with a new etag are replaced after the TTL"""
+        catalog = RuleCatalog(ttl_seconds=0)
+        first = await catalog.get_or_load(
+            WORKSPACE, AsyncMock(return_value=[make_rule("a"), make_rule("b")])
+        )
+        first[0].derived["summary"] = {"rule_id": "a"}
+        first[1].derived["summary"] = {"rule_id": "b"}
+
+        second = await catalog.get_or_load(
+            WORKSPACE, AsyncMock(return_value=[make_rule("a"), make_rule("b", etag="v2")])
+        )
+
+        assert second[0] is first[0]
+        assert second[0].derived == {"summary": {"rule_id": "a"}}
+        assert second[1] is not first[1]
+        assert second[1].derived == {}
+        stats = catalog.get_stats()
+        assert (stats["unchanged"], stats["changed"]) == (1, 3)
+
+    @pytest.mark.asyncio
+    async def test_deleted_rules_dropped(self):
+        """Test that rules missing from a new listing leave the catalog"""
+        catalog = RuleCatalog(ttl_seconds=0)
+        await catalog.get_or_load(WORKSPACE, AsyncMock(return_value=[make_rule("a"), make_rule("b")]))
+        await catalog.get_or_load(WORKSPACE, AsyncMock(return_value=[make_rule("a")]))
+
+        catalog.ttl_seconds = 60
+        assert catalog.get_rule(WORKSPACE, "b") is None
+        assert catalog.get_rule(WORKSPACE, "A").rule.name == "a"
+
+    def test_single_rule_expires(self):
+        """Test that a rule stored from a get is only served within the TTL"""
+        catalog = RuleCatalog(ttl_seconds=0)
+        catalog.put_rule(WORKSPACE, make_rule("a"))
+        time.sleep(0.01)
+
+        assert catalog.get_rule(WORKSPACE, "a") is None
+
+
+class TestExplorerCatalog:
+    """Test that the explorer reads through the catalog"""
+
+    @pytest.fixture
+    def explorer(self):
+        authenticator = Mock()
+        registry = Mock()
+        client = registry.get_client.return_value
+        client.alert_rules.get = AsyncMock(return_value=make_rule("a"))
+        explorer = AnalyticsRulesExplorer(authenticator, client_registry=registry)
+        explorer.rule_catalog = RuleCatalog(ttl_seconds=60)
+        return explorer, client
+
+    @pytest.mark.asyncio
+    async def test_details_served_from_listing(self, explorer):
+        """Test that rule details after a listing need no extra request"""
+        explorer, client = explorer
+        listed = []
+
+        def list_rules(**kwargs):
+            listed.append(kwargs)
+
+            async def pager():
+                for rule in (make_rule("a"), make_rule("b", enabled=False)):
+                    yield rule
+
+            return pager()
+
+        client.alert_rules.list = list_rules
+
+        enabled = await explorer.list_rules(WORKSPACE, enabled_only=True)
+        everything = await explorer.list_rules(WORKSPACE)
+        details = await explorer.get_rule_details(WORKSPACE, "b")
+
+        assert len(listed) == 1
+        assert [rule["rule_id"] for rule in enabled] == ["a"]
+        assert [rule["rule_id"] for rule in everything] == ["a", "b"]
+        assert details["rule_id"] == "b"
+        client.alert_rules.get.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_details_fetched_once(self, explorer):
+        """Test that a rule read with get is cached for later calls"""
+        explorer, client = explorer
+
+        first = await explorer.get_rule_details(WORKSPACE, "a")
+        second = await explorer.get_rule_details(WORKSPACE, "a")
+
+        assert client.alert_rules.get.await_count == 1
+        # The extracted view is reused, not copied or extracted again
+        assert second is first
+        assert second["rule_name"] == "A"
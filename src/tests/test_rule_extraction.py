@@ -0,0 +1,132 @@
+"""
+Unit tests for rule extraction
+"""
+
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from azure.mgmt.securityinsight import models
+
+from utils.rule_extraction import extract_rule_details, extract_rule_summary
+from tests.conftest import make_workspace
+
+WORKSPACE = make_workspace("ws-a")
+
+
+def make_scheduled_rule(**kwargs) -> models.ScheduledAlertRule:
+    """Create a Scheduled rule model as deserialized from ARM"""
+    rule = models.ScheduledAlertRule(
+        query="SigninLogs | take 1",
+        query_frequency=timedelta(hours=1),
+        query_period=timedelta(days=1),
+        severity="High",
+        trigger_operator="GreaterThan",
+        trigger_threshold=0,
+        suppression_duration=timedelta(hours=5),
+        suppression_enabled=False,
+        **kwargs,
+    )
+    rule.name = "rule-1"
+    rule.display_name = "Rule one"
+    rule.enabled = True
+    rule.last_modified_utc = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    return rule
+
+
+class TestExtractRuleDetails:
+    """Test rule projection"""
+
+    def test_scheduled_rule(self):
+        rule = make_scheduled_rule(
+            tactics=["InitialAccess"],
+            incident_configuration=models.IncidentConfiguration(
+                create_incident=True,
+                grouping_configuration=models.GroupingConfiguration(
+                    enabled=True,
+                    reopen_closed_incident=False,
+                    lookback_duration=timedelta(hours=5),
+                    matching_method="Selected",
+                    group_by_entities=["Account"],
+                ),
+            ),
+            entity_mappings=[
+                models.EntityMapping(
+                    entity_type="Account",
+                    field_mappings=[models.FieldMapping(identifier="Name", column_name="User")],
+                )
+            ],
+            alert_details_override=models.AlertDetailsOverride(
+                alert_display_name_format="Sign-in by {{User}}"
+            ),
+            custom_details={"Count": "count_"},
+        )
+
+        details = extract_rule_details(rule, WORKSPACE)
+
+        assert list(details) == [
+            "rule_id", "rule_name", "kind", "enabled", "workspace_name", "workspace_id",
+            "severity", "tactics", "techniques", "description", "last_modified",
+            "configuration", "incident_configuration", "alert_details_override",
+            "entity_mappings", "custom_details",
+        ]
+        assert details["techniques"] == []
+        assert details["last_modified"] == "2024-01-01T00:00:00+00:00"
+        assert details["configuration"]["query_period"] == "1 day, 0:00:00"
+        assert details["incident_configuration"] == {
+            "create_incident": True,
+            "grouping": {
+                "enabled": True,
+                "reopen_closed_incidents": False,
+                "lookback_duration": "5:00:00",
+                "matching_method": "Selected",
+                "group_by_entities": ["Account"],
+                "group_by_alert_details": None,
+            },
+        }
+        assert details["alert_details_override"] == {
+            "display_name_format": "Sign-in by {{User}}",
+            "description_format": None,
+            "severity_column": None,
+            "tactics_column": None,
+        }
+        assert details["entity_mappings"] == [
+            {"entity_type": "Account", "field_mappings": [{"identifier": "Name", "column_name": "User"}]}
+        ]
+        assert details["custom_details"] == {"Count": "count_"}
+
+    def test_unset_sections(self):
+        """Test that unset sections keep their previous defaults"""
+        details = extract_rule_details(make_scheduled_rule(), WORKSPACE)
+
+        assert details["incident_configuration"] == {"create_incident": False}
+        assert details["alert_details_override"] == {}
+        assert "entity_mappings" not in details
+        assert "custom_details" not in details
+
+    def test_kind_without_sections(self):
+        """Test that only the attributes the rule kind has are output"""
+        rule = models.FusionAlertRule(alert_rule_template_name="template-1")
+        rule.name = "fusion"
+
+        details = extract_rule_details(rule, WORKSPACE)
+
+        assert details["configuration"] == {"template_name": "template-1"}
+        assert details["rule_name"] is None
+        assert "incident_configuration" not in details
+        assert "alert_details_override" not in details
+
+    def test_plain_objects_by_attribute_shape(self):
+        """Test that plain objects are projected by the attributes they have"""
+        bare = SimpleNamespace(name="a")
+        full = SimpleNamespace(name="b", display_name="B", kind="Scheduled", severity="Low", query="x")
+
+        assert extract_rule_summary(bare, WORKSPACE) == {
+            "rule_id": "a",
+            "rule_name": "a",
+            "kind": "Unknown",
+            "enabled": False,
+            "workspace_name": "ws-a",
+            "workspace_id": WORKSPACE.workspace_id,
+        }
+        assert extract_rule_summary(full, WORKSPACE)["severity"] == "Low"
+        assert extract_rule_details(full, WORKSPACE)["configuration"] == {"query": "x"}
+
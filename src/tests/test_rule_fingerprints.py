@@ -0,0 +1,147 @@
+"""
+Unit tests for the rule fingerprint index
+"""
+
+from datetime import timedelta
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+import pytest
+
+from mcp_server.tools.exploration.analytics_rules import AnalyticsRulesExplorer
+from mcp_server.tools.exploration.rule_fingerprints import (
+    RuleFingerprintIndex,
+    compare_rule_deployments,
+    fingerprint_rule,
+    normalize_query,
+)
+from utils.rule_catalog import CachedRule
+from tests.conftest import make_lighthouse, make_workspace
+
+QUERY = "SigninLogs\n| where ResultType == '50126'  // failed logons\n| summarize count() by UserPrincipalName"
+
+
+def make_rule(
+    name: str,
+    query: str = QUERY,
+    threshold: int = 5,
+    display_name: str = "Brute force",
+    kind: str = "Scheduled",
+) -> SimpleNamespace:
+    """Create a Scheduled alert rule stand-in"""
+    return SimpleNamespace(
+        name=name,
+        display_name=display_name,
+        kind=kind,
+        enabled=True,
+        query=query,
+        query_frequency=timedelta(hours=1),
+        query_period=timedelta(hours=1),
+        trigger_operator="GreaterThan",
+        trigger_threshold=threshold,
+        alert_rule_template_name=None,
+    )
+
+
+def entries(*rules) -> list:
+    """Wrap rules in catalog entries"""
+    return [CachedRule(rule, None, None, 0.0) for rule in rules]
+
+
+class TestFingerprint:
+    """Test query normalization and fingerprints"""
+
+    def test_formatting_and_comments_ignored(self):
+        """Test that reformatting a query keeps its fingerprint"""
+        reformatted = "// header\nSigninLogs | where ResultType == '50126'\n|   summarize count() by UserPrincipalName"
+
+        assert fingerprint_rule(make_rule("a")).digest == fingerprint_rule(
+            make_rule("b", query=reformatted)
+        ).digest
+
+    def test_comment_markers_in_strings_kept(self):
+        """Test that // inside a string literal is not treated as a comment"""
+        assert normalize_query("X | where Url == 'https://a'") == "X | where Url == 'https://a'"
+
+    def test_verbatim_strings(self):
+        """Test that verbatim strings end at an unescaped quote, not after a backslash"""
+        assert normalize_query('X | where Path == @"C:\\" // dir\n| take 1') == (
+            'X | where Path == @"C:\\" | take 1'
+        )
+        assert normalize_query("X | where Url == @'it''s //a' // note") == (
+            "X | where Url == @'it''s //a'"
+        )
+
+    def test_threshold_changes_fingerprint(self):
+        assert fingerprint_rule(make_rule("a")).digest != fingerprint_rule(
+            make_rule("a", threshold=10)
+        ).digest
+
+    def test_other_kinds_not_fingerprinted(self):
+        assert fingerprint_rule(make_rule("a", kind="Fusion")) is None
+
+
+class TestRuleFingerprintIndex:
+    """Test deployment comparison"""
+
+    @pytest.fixture
+    def index(self):
+        index = RuleFingerprintIndex()
+        index.add_workspace(make_workspace("ws-a", "Tenant A"), entries(make_rule("r1")))
+        index.add_workspace(make_workspace("ws-b", "Tenant B"), entries(make_rule("r2")))
+        index.add_workspace(
+            make_workspace("ws-c", "Tenant C"), entries(make_rule("r3", threshold=10))
+        )
+        index.add_workspace(
+            make_workspace("ws-d", "Tenant D"), entries(make_rule("r4", display_name="Other"))
+        )
+        return index
+
+    def test_identical_variant_missing(self, index):
+        """Test that deployments are split by fingerprint, with differences named"""
+        result = index.compare("brute force")
+
+        assert [ws["workspace_name"] for ws in result["identical"]] == ["ws-a", "ws-b"]
+        assert [ws["workspace_name"] for ws in result["variants"]] == ["ws-c"]
+        assert result["variants"][0]["differences"] == ["trigger_threshold"]
+        assert [ws["workspace_name"] for ws in result["missing"]] == ["ws-d"]
+
+    def test_reference_workspace_sets_baseline(self, index):
+        """Test that the reference workspace's version is the baseline"""
+        result = index.compare("r1", reference_workspace="ws-c")
+
+        assert [ws["workspace_name"] for ws in result["identical"]] == ["ws-c"]
+        assert len(result["variants"]) == 2
+
+    def test_reference_workspace_with_fingerprint_rejected(self, index):
+        digest = index.compare("r1")["fingerprint"]
+
+        with pytest.raises(ValueError, match="own baseline"):
+            index.compare(digest, reference_workspace="ws-c")
+
+    def test_unknown_rule_rejected(self, index):
+        with pytest.raises(ValueError, match="No Scheduled rule"):
+            index.compare("nothing like it")
+
+
+class TestCompareRuleDeployments:
+    """Test the cross-workspace tool"""
+
+    @pytest.mark.asyncio
+    async def test_failed_workspaces_reported_separately(self, fan_out):
+        """Test that a failing workspace is an error, not a missing deployment"""
+        workspaces = [make_workspace("ws-a"), make_workspace("ws-b")]
+
+        async def get_catalog(self, workspace):
+            if workspace.workspace_name == "ws-b":
+                raise RuntimeError("boom")
+            return entries(make_rule("r1"))
+
+        with patch.object(AnalyticsRulesExplorer, "get_catalog", get_catalog):
+            result = await compare_rule_deployments(
+                Mock(), make_lighthouse(workspaces), rule="Brute force"
+            )
+
+        assert [ws["workspace_name"] for ws in result["identical"]] == ["ws-a"]
+        assert result["missing"] == []
+        assert result["errors"][0]["workspace_name"] == "ws-b"
+        assert result["scheduled_rules_indexed"] == 1
@@ -0,0 +1,169 @@
+"""
+Unit tests for the rule search index
+"""
+
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+import pytest
+
+from mcp_server.tools.exploration.analytics_rules import AnalyticsRulesExplorer
+from mcp_server.tools.exploration.rule_search import search_analytics_rules
+from utils.rule_catalog import CachedRule
+from utils.search_index import RuleSearchIndex, referenced_tables
+from tests.conftest import make_lighthouse, make_workspace
+
+
+def make_entry(name: str, query: str = "", description: str = "", display_name: str = "") -> CachedRule:
+    """Create a catalog entry for a rule stand-in"""
+    rule = SimpleNamespace(
+        name=name,
+        display_name=display_name or name,
+        kind="Scheduled",
+        enabled=True,
+        description=description,
+        query=query,
+    )
+    return CachedRule(rule, None, None, 0.0)
+
+
+class TestReferencedTables:
+    """Test table extraction from KQL"""
+
+    def test_statement_union_and_join(self):
+        query = (
+            "let threshold = 5;\n"
+            "union isfuzzy=true SigninLogs, AADNonInteractiveUserSignInLogs\n"
+            "| join kind=inner (AuditLogs | where X) on UserId\n"
+            "| summarize count() by Account, Computer\n"
+            "| where count_ > threshold"
+        )
+
+        assert referenced_tables(query) == {
+            "SigninLogs",
+            "AADNonInteractiveUserSignInLogs",
+            "AuditLogs",
+        }
+
+    def test_let_bound_names_excluded(self):
+        query = "let Admins = IdentityInfo | where IsAdmin;\nAdmins | join (SecurityAlert) on A"
+
+        assert referenced_tables(query) == {"IdentityInfo", "SecurityAlert"}
+
+    def test_column_assignments_are_not_tables(self):
+        """Test that extend/project/summarize assignments do not count as let bindings"""
+        query = (
+            "SigninLogs\n"
+            "| extend Account = UserPrincipalName\n"
+            "| project-rename Host = Computer\n"
+            "| project Time = TimeGenerated\n"
+            "| summarize Total = Count"
+        )
+
+        assert referenced_tables(query) == {"SigninLogs"}
+
+    def test_function_arguments_are_not_tables(self):
+        query = (
+            "AuditLogs | extend p = tostring(TargetResources)"
+            " | mv-expand todynamic(AdditionalDetails)"
+            " | where isnotempty(UserPrincipalName)"
+            " | where Caller in (Watchlist | project Name)"
+        )
+
+        assert referenced_tables(query) == {"AuditLogs", "Watchlist"}
+
+    def test_multi_line_column_lists_are_not_tables(self):
+        query = "// Sign-ins\nSigninLogs\n| project\n    TimeGenerated,\n    IPAddress"
+
+        assert referenced_tables(query) == {"SigninLogs"}
+
+
+class TestRuleSearchIndex:
+    """Test indexing and search"""
+
+    @pytest.fixture
+    def index(self):
+        index = RuleSearchIndex()
+        index.update_workspace(
+            make_workspace("ws-a"),
+            [
+                make_entry("r1", "SigninLogs | where ResultType == 50126", display_name="Password spray"),
+                make_entry("r2", "SecurityEvent | where CommandLine has 'mimikatz'"),
+                make_entry("r3", "AuditLogs | take 1", description="Sign-in logs are not used"),
+            ],
+        )
+        return index
+
+    def test_all_words_must_match(self, index):
+        """Test AND semantics across words and fields"""
+        total, matches = index.search("SecurityEvent mimikatz")
+
+        assert total == 1
+        assert matches[0]["rule_id"] == "r2"
+        assert matches[0]["matched_fields"] == ["tables", "query"]
+
+    def test_field_restriction(self, index):
+        """Test that a field restriction excludes matches in other fields"""
+        assert [m["rule_id"] for m in index.search("signinlogs", fields=["tables"])[1]] == ["r1"]
+        assert index.search("spray", fields=["query"]) == (0, [])
+
+    def test_unchanged_entries_not_reindexed(self, index):
+        """Test that only changed and new entries are indexed on update"""
+        workspace = make_workspace("ws-a")
+        entries = [document.entry for document in index._documents.values()]
+        kept = [entry for entry in entries if entry.rule.name != "r2"]
+        changed = make_entry("r3", "AzureActivity | take 1")
+
+        indexed = index.update_workspace(
+            workspace, [entry for entry in kept if entry.rule.name != "r3"] + [changed]
+        )
+
+        assert indexed == 1
+        assert index.search("mimikatz") == (0, [])
+        assert index.search("auditlogs") == (0, [])
+        assert index.search("azureactivity")[0] == 1
+        assert len(index) == 2
+
+    def test_unknown_field_rejected(self, index):
+        with pytest.raises(ValueError, match="Unknown search field"):
+            index.search("x", fields=["kql"])
+
+    def test_limit_below_one_rejected(self, index):
+        with pytest.raises(ValueError, match="limit"):
+            index.search("signinlogs", limit=-1)
+
+    def test_retain_workspaces_drops_others(self, index):
+        index.update_workspace(make_workspace("ws-b"), [make_entry("b1", "SigninLogs | take 1")])
+
+        dropped = index.retain_workspaces({make_workspace("ws-b").workspace_id.lower()})
+
+        assert dropped == 1
+        assert len(index) == 1
+        assert index.search("signinlogs")[0] == 1
+        assert index.get_stats()["workspaces"] == 1
+
+
+class TestSearchAnalyticsRules:
+    """Test the cross-workspace search tool"""
+
+    @pytest.mark.asyncio
+    async def test_search_is_limited_to_matching_workspaces(self, fan_out):
+        """Test that workspaces outside the current filter are not returned"""
+        catalogs = {
+            "ws-a": [make_entry("a1", "SigninLogs | take 1")],
+            "ws-b": [make_entry("b1", "SigninLogs | take 1")],
+        }
+
+        async def get_catalog(self, workspace):
+            return catalogs[workspace.workspace_name]
+
+        with patch.object(AnalyticsRulesExplorer, "get_catalog", get_catalog):
+            await search_analytics_rules(
+                Mock(), make_lighthouse([make_workspace("ws-a"), make_workspace("ws-b")]), "take"
+            )
+            result = await search_analytics_rules(
+                Mock(), make_lighthouse([make_workspace("ws-b")]), "signinlogs"
+            )
+
+        assert result["total_matches"] == 1
+        assert result["matches"][0]["workspace_name"] == "ws-b"
+        assert result["rules_searched"] == 1
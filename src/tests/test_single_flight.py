@@ -0,0 +1,118 @@
+"""
+Unit tests for single-flight request coalescing
+"""
+
+import asyncio
+import pytest
+from unittest.mock import Mock
+from mcp_server.tools.exploration.analytics_rules import AnalyticsRulesExplorer
+from mcp_server.tools.management.health_check import SentinelHealthChecker
+from utils.single_flight import SingleFlight, workspace_read_key
+from tests.conftest import make_workspace
+
+
+class TestSingleFlight:
+    """Test coalescing of concurrent identical reads"""
+
+    @pytest.mark.asyncio
+    async def test_identical_calls_share_one_request(self):
+        """Test that concurrent callers with the same key run the call once"""
+        group = SingleFlight()
+        calls = []
+
+        async def read():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return ["rule"]
+
+        key = workspace_read_key("alert_rules.list", make_workspace())
+        results = await asyncio.gather(*(group.do(key, read) for _ in range(3)))
+
+        assert len(calls) == 1
+        assert results == [["rule"]] * 3
+        assert group.get_stats() == {"calls": 1, "coalesced": 2, "in_flight": 0}
+
+    @pytest.mark.asyncio
+    async def test_different_keys_not_shared(self):
+        """Test that different operations or params are separate requests"""
+        group = SingleFlight()
+        workspace = make_workspace()
+
+        async def read():
+            await asyncio.sleep(0.01)
+            return object()
+
+        first, second = await asyncio.gather(
+            group.do(workspace_read_key("alert_rules.get", workspace, rule_id="a"), read),
+            group.do(workspace_read_key("alert_rules.get", workspace, rule_id="b"), read),
+        )
+
+        assert first is not second
+        assert group.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_errors_shared_and_not_retained(self):
+        """Test that a failure reaches every caller and the next call retries"""
+        group = SingleFlight()
+        key = ("op",)
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("throttled")
+
+        results = await asyncio.gather(group.do(key, fail), group.do(key, fail), return_exceptions=True)
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+        async def succeed():
+            return "ok"
+
+        assert await group.do(key, succeed) == "ok"
+        assert group.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_abort_others(self):
+        """Test that cancelling one waiter leaves the shared read running"""
+        group = SingleFlight()
+
+        async def read():
+            await asyncio.sleep(0.05)
+            return "done"
+
+        first = asyncio.ensure_future(group.do(("op",), read))
+        second = asyncio.ensure_future(group.do(("op",), read))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert await second == "done"
+
+
+class TestToolCoalescing:
+    """Test that tools share in-flight rule listings"""
+
+    @pytest.mark.asyncio
+    async def test_health_check_and_rule_listing_share_listing(self):
+        """Test that back-to-back tools issue a single alert_rules.list"""
+        listings = []
+
+        async def list_rules(resource_group_name, workspace_name):
+            listings.append(workspace_name)
+            await asyncio.sleep(0.05)
+            yield Mock(enabled=True)
+
+        sentinel_client = Mock()
+        sentinel_client.alert_rules.list = list_rules
+        registry = Mock(get_client=Mock(return_value=sentinel_client))
+
+        checker = SentinelHealthChecker(Mock(), client_registry=registry)
+        explorer = AnalyticsRulesExplorer(Mock(), client_registry=registry)
+        explorer._extract_rule_summary = Mock(return_value={})
+        workspace = make_workspace()
+
+        health, rules = await asyncio.gather(
+            checker._check_analytics_rules(sentinel_client, workspace),
+            explorer.list_rules(workspace),
+        )
+
+        assert listings == ["ws-a"]
+        assert health["enabled"] == 1
+        assert len(rules) == 1
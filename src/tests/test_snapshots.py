@@ -0,0 +1,34 @@
+"""
+Unit tests for result snapshots and page cursors
+"""
+
+import time
+from utils.snapshots import SnapshotStore, decode_cursor, encode_cursor
+
+
+class TestSnapshotStore:
+    """Test snapshot storage"""
+
+    def test_cursor_round_trip(self):
+        """Test that cursors decode to what was encoded"""
+        assert decode_cursor(encode_cursor("abc", 40, 20)) == ("abc", 40, 20)
+
+    def test_snapshots_expire(self):
+        """Test that snapshots are dropped after the TTL"""
+        store = SnapshotStore(ttl_seconds=0)
+        snapshot_id = store.put({"rules": []})
+        time.sleep(0.01)
+
+        assert store.get(snapshot_id) is None
+
+    def test_least_recently_used_evicted(self):
+        """Test that the store keeps at most max_snapshots"""
+        store = SnapshotStore(max_snapshots=2)
+        first = store.put(1)
+        second = store.put(2)
+        store.get(first)
+        third = store.put(3)
+
+        assert store.get(second) is None
+        assert store.get(first) == 1
+        assert store.get(third) == 3
@@ -0,0 +1,102 @@
+"""
+Unit tests for workspace index module
+"""
+
+import pytest
+from utils.workspace_index import (
+    WorkspaceIndex,
+    parse_workspace_resource_id,
+    pattern_matches,
+    workspace_resource_id,
+)
+from tests.conftest import make_workspace
+
+
+@pytest.fixture
+def index():
+    """Index over workspaces in two tenants"""
+    return WorkspaceIndex(
+        [
+            make_workspace("prod-sentinel", "Contoso Ltd", "tenant-a", "sub-1"),
+            make_workspace("dev-sentinel", "Contoso Ltd", "tenant-a", "sub-1"),
+            make_workspace("prod-sentinel", "Fabrikam", "tenant-b", "sub-2"),
+            make_workspace("soc-main", "Fabrikam", "tenant-b", "sub-3"),
+        ]
+    )
+
+
+class TestPatternMatches:
+    """Test filter pattern matching"""
+
+    def test_substring(self):
+        assert pattern_matches("sentinel", "Prod-Sentinel")
+        assert not pattern_matches("soc", "prod-sentinel")
+
+    def test_glob(self):
+        assert pattern_matches("prod-*", "prod-sentinel")
+        assert not pattern_matches("*-main", "prod-sentinel")
+
+    def test_empty_value(self):
+        assert not pattern_matches("prod", None)
+
+
+class TestWorkspaceResourceId:
+    """Test workspace resource ID helpers"""
+
+    def test_round_trip(self):
+        resource_id = workspace_resource_id("sub-1", "rg", "soc-main")
+        assert parse_workspace_resource_id(resource_id) == ("sub-1", "rg", "soc-main")
+
+    def test_rejects_other_resources(self):
+        with pytest.raises(ValueError):
+            parse_workspace_resource_id(
+                "/subscriptions/sub-1/resourceGroups/rg/providers/Microsoft.Compute/virtualMachines/vm"
+            )
+
+
+class TestWorkspaceIndex:
+    """Test WorkspaceIndex lookups"""
+
+    def test_get_by_name(self, index):
+        """Test case-insensitive exact name lookup"""
+        assert index.get_by_name("SOC-MAIN").subscription_id == "sub-3"
+        assert index.get_by_name("missing") is None
+
+    def test_get_by_name_with_subscription(self, index):
+        """Test that a subscription disambiguates duplicate names"""
+        assert index.get_by_name("prod-sentinel", "sub-2").tenant_name == "Fabrikam"
+
+    def test_get_by_resource_id(self, index):
+        """Test case-insensitive resource ID lookup"""
+        resource_id = index.workspaces[3].workspace_id.upper()
+        assert index.get_by_resource_id(resource_id).workspace_name == "soc-main"
+
+    def test_match_filters(self, index):
+        """Test combined workspace and tenant filters"""
+        assert len(index.match()) == 4
+        assert len(index.match(workspace_filter="prod")) == 2
+        assert len(index.match(tenant_filter="contoso")) == 2
+        assert len(index.match(tenant_filter="tenant-b")) == 2
+
+        matches = index.match(workspace_filter="prod-*", tenant_filter="Fab*")
+        assert [ws.subscription_id for ws in matches] == ["sub-2"]
+
+    def test_match_results_are_copies(self, index):
+        """Test that callers cannot mutate memoized results"""
+        index.match(workspace_filter="prod").clear()
+
+        assert len(index.match(workspace_filter="prod")) == 2
+
+    def test_match_cache_is_bounded(self):
+        """Test that memoized filter results are evicted least recently used first"""
+        index = WorkspaceIndex(
+            [make_workspace("soc-main", "Contoso Ltd", "tenant-a", "sub-1")], max_cached_matches=2
+        )
+
+        index.match(workspace_filter="soc")
+        index.match(workspace_filter="main")
+        index.match(workspace_filter="soc")
+        index.match(workspace_filter="other")
+
+        assert len(index._match_cache) == 2
+        assert [key[0] for key in index._match_cache] == ["soc", "other"]
@@ -17,7 +17,14 @@ from azure.identity import (
     ManagedIdentityCredential,
     ChainedTokenCredential,
 )
+from azure.identity.aio import (
+    ClientSecretCredential as AsyncClientSecretCredential,
+    AzureCliCredential as AsyncAzureCliCredential,
+    ManagedIdentityCredential as AsyncManagedIdentityCredential,
+    ChainedTokenCredential as AsyncChainedTokenCredential,
+)
 from azure.core.credentials import TokenCredential
+from azure.core.credentials_async import AsyncTokenCredential
 
 logger = structlog.get_logger(__name__)
 
@@ -49,6 +56,7 @@ class AzureAuthenticator:
         ).lower() == "true"
 
         self._credential: Optional[TokenCredential] = None
+        self._async_credential: Optional[AsyncTokenCredential] = None
         logger.info("Azure Authenticator initialized")
 
     def get_credential(self) -> TokenCredential:
@@ -104,6 +112,65 @@ class AzureAuthenticator:
 
         return self._credential
 
+    def get_identity_key(self) -> str:
+        """
+        Get a key naming the identity the credentials authenticate as
+
+        Follows the same authentication priority as get_credential(). The
+        Azure CLI identity is whoever is logged in, so it is keyed by the
+        configured tenant only.
+
+        Returns:
+            Identity key (contains no secrets)
+        """
+        if self.tenant_id and self.client_id and self.client_secret:
+            return f"service_principal:{self.tenant_id}:{self.client_id}"
+        if self.use_managed_identity:
+            return "managed_identity"
+        return f"azure_cli:{self.tenant_id or ''}"
+
+    def get_async_credential(self) -> AsyncTokenCredential:
+        """
+        Get async Azure credentials for the ``.aio`` SDK clients
+
+        Uses the same authentication priority as get_credential().
+
+        Returns:
+            AsyncTokenCredential: Async Azure credential object
+        """
+        if self._async_credential:
+            return self._async_credential
+
+        credentials = []
+
+        if self.tenant_id and self.client_id and self.client_secret:
+            credentials.append(
+                AsyncClientSecretCredential(
+                    tenant_id=self.tenant_id,
+                    client_id=self.client_id,
+                    client_secret=self.client_secret,
+                )
+            )
+
+        if self.use_managed_identity:
+            credentials.append(AsyncManagedIdentityCredential())
+
+        credentials.append(AsyncAzureCliCredential())
+
+        if len(credentials) > 1:
+            self._async_credential = AsyncChainedTokenCredential(*credentials)
+        else:
+            self._async_credential = credentials[0]
+
+        logger.info("Async credential initialized", methods=len(credentials))
+        return self._async_credential
+
+    async def close(self) -> None:
+        """Close the async credential and its HTTP sessions"""
+        if self._async_credential is not None:
+            await self._async_credential.close()
+            self._async_credential = None
+
     def validate_authentication(self) -> bool:
         """
         Validate that authentication is working
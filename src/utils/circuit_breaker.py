@@ -0,0 +1,248 @@
+"""
+Tenant Circuit Breaker Module
+
+Per-tenant circuit breakers and bulkheads for multi-workspace fan-outs. A
+tenant that keeps failing (expired delegation, removed role) is skipped
+instantly until its breaker half-opens, and each tenant may only occupy its
+share of the concurrent workers so one slow tenant cannot stall the rest.
+"""
+
+from contextlib import asynccontextmanager
+from enum import Enum
+from typing import Any, AsyncIterator, Dict, Optional
+import asyncio
+import time
+import structlog
+
+from .config import Settings, get_settings
+from .lighthouse import SentinelWorkspace
+
+logger = structlog.get_logger(__name__)
+
+
+class CircuitState(str, Enum):
+    """Circuit breaker states"""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker with timed half-open trials"""
+
+    def __init__(self, failure_threshold: int = 3, reset_timeout: float = 60.0):
+        """
+        Initialize circuit breaker
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Seconds an open circuit waits before allowing a trial
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self._opened_at: Optional[float] = None
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state; an open circuit becomes half-open once reset_timeout passes"""
+        if self._opened_at is None:
+            return CircuitState.CLOSED
+        if time.monotonic() - self._opened_at >= self.reset_timeout:
+            return CircuitState.HALF_OPEN
+        return CircuitState.OPEN
+
+    def retry_in(self) -> float:
+        """Seconds until the next trial request is allowed (0 if allowed now)"""
+        if self._opened_at is None:
+            return 0.0
+        return max(0.0, self._opened_at + self.reset_timeout - time.monotonic())
+
+    def allow_request(self) -> bool:
+        """
+        Check whether a request may proceed
+
+        In the half-open state one trial request is let through; the timer is
+        re-armed so further requests are rejected until the trial reports back
+        (or another reset_timeout passes).
+
+        Returns:
+            True if the request may be sent
+        """
+        state = self.state
+        if state == CircuitState.CLOSED:
+            return True
+        if state == CircuitState.HALF_OPEN:
+            self._opened_at = time.monotonic()
+            return True
+        return False
+
+    def record_success(self) -> None:
+        """Close the circuit and reset the failure count"""
+        self.failures = 0
+        self._opened_at = None
+
+    def record_failure(self) -> None:
+        """Count a failure, opening the circuit at the threshold"""
+        self.failures += 1
+        if self._opened_at is not None or self.failures >= self.failure_threshold:
+            self._opened_at = time.monotonic()
+
+
+class TenantGuard:
+    """Per-tenant circuit breakers plus tenant and global bulkheads"""
+
+    def __init__(
+        self,
+        failure_threshold: int = 3,
+        reset_timeout: float = 60.0,
+        max_concurrency: int = 5,
+        max_concurrency_per_tenant: int = 2,
+    ):
+        """
+        Initialize tenant guard
+
+        Args:
+            failure_threshold: Consecutive failures that open a tenant's circuit
+            reset_timeout: Seconds before an open circuit allows a trial
+            max_concurrency: Total concurrent workspace operations
+            max_concurrency_per_tenant: Concurrent operations allowed per tenant
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.max_concurrency = max_concurrency
+        self.max_concurrency_per_tenant = max(1, min(max_concurrency_per_tenant, max_concurrency))
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._tenant_slots: Dict[str, asyncio.Semaphore] = {}
+        self._slots = asyncio.Semaphore(max_concurrency)
+
+    def get_breaker(self, tenant_id: str) -> CircuitBreaker:
+        """Get or create the circuit breaker of a tenant"""
+        key = tenant_id.lower()
+        breaker = self._breakers.get(key)
+        if breaker is None:
+            breaker = self._breakers[key] = CircuitBreaker(
+                self.failure_threshold, self.reset_timeout
+            )
+        return breaker
+
+    def is_open(self, tenant_id: str) -> bool:
+        """Check whether a tenant's circuit is open, without claiming a trial"""
+        return self.get_breaker(tenant_id).state == CircuitState.OPEN
+
+    def allow(self, tenant_id: str) -> bool:
+        """Check whether a tenant's circuit lets a request through"""
+        return self.get_breaker(tenant_id).allow_request()
+
+    def record_success(self, tenant_id: str) -> None:
+        """Record a successful workspace operation for a tenant"""
+        self.get_breaker(tenant_id).record_success()
+
+    def record_failure(self, tenant_id: str) -> None:
+        """Record a failed workspace operation for a tenant"""
+        breaker = self.get_breaker(tenant_id)
+        was_open = breaker.state != CircuitState.CLOSED
+        breaker.record_failure()
+        if not was_open and breaker.state == CircuitState.OPEN:
+            logger.warning(
+                "Tenant circuit opened",
+                tenant_id=tenant_id,
+                failures=breaker.failures,
+                reset_seconds=self.reset_timeout,
+            )
+
+    def open_circuit_message(self, tenant_id: str) -> str:
+        """Describe why a tenant's workspaces are being skipped"""
+        breaker = self.get_breaker(tenant_id)
+        return (
+            f"Tenant circuit open after {breaker.failures} consecutive failures, "
+            f"workspace skipped (retry in {breaker.retry_in():.0f}s)"
+        )
+
+    @asynccontextmanager
+    async def bulkhead(self, tenant_id: str) -> AsyncIterator[None]:
+        """
+        Hold a tenant slot and a global slot for the duration of an operation
+
+        The tenant slot is taken first, so a tenant waiting on its own limit
+        does not hold global workers other tenants could use.
+
+        Args:
+            tenant_id: Tenant of the workspace being processed
+        """
+        key = tenant_id.lower()
+        tenant_slots = self._tenant_slots.get(key)
+        if tenant_slots is None:
+            tenant_slots = self._tenant_slots[key] = asyncio.Semaphore(
+                self.max_concurrency_per_tenant
+            )
+        async with tenant_slots:
+            async with self._slots:
+                yield
+
+    def get_states(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the circuit state of every tenant seen so far
+
+        Returns:
+            Mapping of tenant ID to state, consecutive failures and retry delay
+        """
+        return {
+            tenant_id: {
+                "state": breaker.state.value,
+                "failures": breaker.failures,
+                "retry_in_seconds": round(breaker.retry_in(), 1),
+            }
+            for tenant_id, breaker in self._breakers.items()
+        }
+
+
+def guard_key(workspace: SentinelWorkspace) -> str:
+    """
+    Key of the circuit breaker and bulkhead a workspace runs under
+
+    Workspaces addressed directly by resource ID may not have a resolved
+    tenant; they are isolated per subscription instead of sharing one guard.
+
+    Args:
+        workspace: SentinelWorkspace
+
+    Returns:
+        Tenant ID, or "subscription:<id>" when the tenant is unknown
+    """
+    if workspace.tenant_id:
+        return workspace.tenant_id
+    return f"subscription:{workspace.subscription_id.lower()}"
+
+
+# Global tenant guard instance
+_tenant_guard: Optional[TenantGuard] = None
+
+
+def get_tenant_guard(settings: Optional[Settings] = None) -> TenantGuard:
+    """
+    Get or create the global tenant guard
+
+    Args:
+        settings: Optional Settings instance (defaults to global settings)
+
+    Returns:
+        TenantGuard instance
+    """
+    global _tenant_guard
+    if _tenant_guard is None:
+        settings = settings or get_settings()
+        _tenant_guard = TenantGuard(
+            failure_threshold=settings.circuit_breaker_failure_threshold,
+            reset_timeout=settings.circuit_breaker_reset_seconds,
+            max_concurrency=settings.max_concurrent_queries,
+            max_concurrency_per_tenant=settings.tenant_max_concurrent_queries,
+        )
+    return _tenant_guard
+
+
+def reset_tenant_guard() -> None:
+    """Discard the global tenant guard (breaker states and bulkheads)"""
+    global _tenant_guard
+    _tenant_guard = None
@@ -0,0 +1,151 @@
+"""
+Client Registry Module
+
+Process-wide registry of async SecurityInsights clients, one per subscription,
+all sharing a single keep-alive HTTP connection pool so workspaces in the same
+subscription (and across subscriptions) reuse TLS connections.
+"""
+
+from typing import Any, Dict, Optional
+import structlog
+import aiohttp
+from azure.core.credentials_async import AsyncTokenCredential
+from azure.core.pipeline.transport import AioHttpTransport
+from azure.mgmt.securityinsight.aio import SecurityInsights
+
+from .config import Settings, get_settings
+from .rate_limiter import AdaptiveRateLimiter, arm_client_kwargs, get_rate_limiter
+
+logger = structlog.get_logger(__name__)
+
+
+class SecurityInsightsClientRegistry:
+    """Caches SecurityInsights clients by subscription over a shared transport"""
+
+    def __init__(
+        self,
+        credential: AsyncTokenCredential,
+        pool_size: int = 10,
+        rate_limiter: Optional[AdaptiveRateLimiter] = None,
+    ):
+        """
+        Initialize client registry
+
+        Args:
+            credential: Async Azure credential shared by all clients
+            pool_size: Maximum open connections in the shared pool
+            rate_limiter: Optional ARM rate limiter installed on every client
+        """
+        self.credential = credential
+        self.pool_size = pool_size
+        self.rate_limiter = rate_limiter
+        self._clients: Dict[str, SecurityInsights] = {}
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._transport: Optional[AioHttpTransport] = None
+        self.hits = 0
+        self.misses = 0
+
+    def _get_transport(self) -> AioHttpTransport:
+        """Create the shared keep-alive transport on first use"""
+        if self._transport is None:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.pool_size),
+                cookie_jar=aiohttp.DummyCookieJar(),
+                auto_decompress=False,
+                trust_env=True,
+            )
+            # The registry owns the session; clients must not close it
+            self._transport = AioHttpTransport(session=self._session, session_owner=False)
+        return self._transport
+
+    def get_client(self, subscription_id: str) -> SecurityInsights:
+        """
+        Get the SecurityInsights client for a subscription
+
+        Clients are long-lived and owned by the registry: use them directly,
+        not as ``async with`` context managers.
+
+        Args:
+            subscription_id: Azure subscription ID
+
+        Returns:
+            Shared async SecurityInsights client
+        """
+        key = subscription_id.lower()
+        client = self._clients.get(key)
+        if client is not None:
+            self.hits += 1
+            return client
+
+        self.misses += 1
+        client_kwargs = arm_client_kwargs(self.rate_limiter) if self.rate_limiter else {}
+        client = SecurityInsights(
+            self.credential, subscription_id, transport=self._get_transport(), **client_kwargs
+        )
+        self._clients[key] = client
+        logger.debug("SecurityInsights client created", subscription_id=subscription_id)
+        return client
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get registry pool statistics
+
+        Returns:
+            Dictionary with client count, hits, misses and pool size
+        """
+        return {
+            "clients": len(self._clients),
+            "hits": self.hits,
+            "misses": self.misses,
+            "pool_size": self.pool_size,
+        }
+
+    async def close(self) -> None:
+        """Close all clients and the shared connection pool"""
+        for client in self._clients.values():
+            await client.close()
+        self._clients.clear()
+        if self._session is not None:
+            await self._session.close()
+        self._session = None
+        self._transport = None
+
+
+# Global registry instance
+_client_registry: Optional[SecurityInsightsClientRegistry] = None
+
+
+def get_client_registry(
+    credential: AsyncTokenCredential,
+    settings: Optional[Settings] = None,
+) -> SecurityInsightsClientRegistry:
+    """
+    Get or create the global client registry
+
+    The connection pool is sized to ``max_concurrent_queries`` so that every
+    concurrent query can hold a keep-alive connection.
+
+    Args:
+        credential: Async Azure credential (used when the registry is created)
+        settings: Optional Settings instance (defaults to global settings)
+
+    Returns:
+        SecurityInsightsClientRegistry instance
+    """
+    global _client_registry
+    if _client_registry is None:
+        settings = settings or get_settings()
+        _client_registry = SecurityInsightsClientRegistry(
+            credential,
+            pool_size=settings.max_concurrent_queries,
+            rate_limiter=get_rate_limiter(settings),
+        )
+    return _client_registry
+
+
+async def close_client_registry() -> None:
+    """Close and discard the global client registry"""
+    global _client_registry
+    if _client_registry is not None:
+        await _client_registry.close()
+        _client_registry = None
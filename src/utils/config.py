@@ -9,7 +9,7 @@ Handles loading and validation of configuration from:
 
 import os
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Literal
 from pydantic import BaseModel, Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 import structlog
@@ -40,6 +40,10 @@ class CacheConfig(BaseModel):
 
     enable_workspace_cache: bool = Field(True, description="Enable caching for workspace lists")
     workspace_cache_ttl: int = Field(300, description="Workspace cache TTL in seconds")
+    workspace_inventory_path: str = Field(
+        "~/.sentinel-mcp/workspace_inventory.db",
+        description="SQLite file persisting the workspace inventory (empty disables)",
+    )
 
 
 class LoggingConfig(BaseModel):
@@ -90,10 +94,42 @@ class Settings(BaseSettings):
     max_concurrent_queries: int = Field(default=5, validation_alias="MAX_CONCURRENT_QUERIES")
     query_timeout_seconds: int = Field(default=30, validation_alias="QUERY_TIMEOUT_SECONDS")
     kql_result_limit: int = Field(default=1000, validation_alias="KQL_RESULT_LIMIT")
+    arm_read_rate_limit: float = Field(default=20.0, validation_alias="ARM_READ_RATE_LIMIT")
+    arm_ratelimit_low_watermark: int = Field(
+        default=100, validation_alias="ARM_RATELIMIT_LOW_WATERMARK"
+    )
+    tenant_max_concurrent_queries: int = Field(
+        default=2, validation_alias="TENANT_MAX_CONCURRENT_QUERIES"
+    )
+    circuit_breaker_failure_threshold: int = Field(
+        default=3, validation_alias="CIRCUIT_BREAKER_FAILURE_THRESHOLD"
+    )
+    circuit_breaker_reset_seconds: int = Field(
+        default=60, validation_alias="CIRCUIT_BREAKER_RESET_SECONDS"
+    )
 
     # Cache
     enable_workspace_cache: bool = Field(default=True, validation_alias="ENABLE_WORKSPACE_CACHE")
     workspace_cache_ttl: int = Field(default=300, validation_alias="WORKSPACE_CACHE_TTL")
+    workspace_inventory_path: str = Field(
+        default="~/.sentinel-mcp/workspace_inventory.db",
+        validation_alias="WORKSPACE_INVENTORY_PATH",
+    )
+
+    sentinel_onboarding_cache_ttl: int = Field(
+        default=3600, validation_alias="SENTINEL_ONBOARDING_CACHE_TTL"
+    )
+
+    tenant_cache_ttl: int = Field(default=3600, validation_alias="TENANT_CACHE_TTL")
+    access_cache_ttl: int = Field(default=900, validation_alias="ACCESS_CACHE_TTL")
+    access_denied_cache_ttl: int = Field(default=300, validation_alias="ACCESS_DENIED_CACHE_TTL")
+    listing_snapshot_ttl: int = Field(default=300, validation_alias="LISTING_SNAPSHOT_TTL")
+    rule_catalog_ttl: int = Field(default=300, validation_alias="RULE_CATALOG_TTL")
+
+    # Workspace discovery ("arm" or "resource_graph")
+    workspace_discovery_backend: Literal["arm", "resource_graph"] = Field(
+        default="arm", validation_alias="WORKSPACE_DISCOVERY_BACKEND"
+    )
 
     def get_azure_config(self) -> AzureConfig:
         """Get Azure configuration"""
@@ -118,6 +154,7 @@ class Settings(BaseSettings):
         return CacheConfig(
             enable_workspace_cache=self.enable_workspace_cache,
             workspace_cache_ttl=self.workspace_cache_ttl,
+            workspace_inventory_path=self.workspace_inventory_path,
         )
 
     def get_logging_config(self) -> LoggingConfig:
@@ -0,0 +1,204 @@
+"""
+ATT&CK Coverage Matrix Module
+
+Dense workspace x technique (and workspace x tactic) rule-count matrices
+built from the rule catalog. Coverage, enabled/disabled masks, per-tenant
+gaps and fleet-wide heatmaps are computed with vectorized NumPy operations
+over the whole fleet at once.
+"""
+
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+import numpy as np
+
+from .lighthouse import SentinelWorkspace
+from .rule_catalog import CachedRule
+
+
+def attack_labels(entry: CachedRule) -> Tuple[Tuple[str, ...], Tuple[str, ...], bool]:
+    """
+    Get the tactics, techniques and enabled state of a catalog entry
+
+    Computed once per rule version and kept on the entry.
+
+    Args:
+        entry: Rule catalog entry
+
+    Returns:
+        Tuple of tactics, technique IDs (upper case) and whether the rule is enabled
+    """
+    labels = entry.derived.get("attack")
+    if labels is None:
+        rule = entry.rule
+        tactics = tuple(
+            sorted({str(getattr(t, "value", t)) for t in getattr(rule, "tactics", None) or []})
+        )
+        techniques = tuple(
+            sorted({str(t).strip().upper() for t in getattr(rule, "techniques", None) or []})
+        )
+        labels = entry.derived["attack"] = (tactics, techniques)
+    return labels[0], labels[1], bool(getattr(entry.rule, "enabled", False))
+
+
+class CoverageMatrix:
+    """Rule counts per workspace and ATT&CK technique/tactic"""
+
+    def __init__(self, catalogs: Iterable[Tuple[SentinelWorkspace, Sequence[CachedRule]]]):
+        """
+        Build the matrices
+
+        Args:
+            catalogs: Pairs of workspace and its rule catalog entries
+        """
+        self.workspaces: List[SentinelWorkspace] = []
+        technique_cells: Tuple[List[int], List[str], List[bool]] = ([], [], [])
+        tactic_cells: Tuple[List[int], List[str], List[bool]] = ([], [], [])
+
+        # Flatten every (workspace, label, enabled) triple; the matrices are
+        # then filled in one scatter-add per label kind
+        for row, (workspace, entries) in enumerate(catalogs):
+            self.workspaces.append(workspace)
+            for entry in entries:
+                tactics, techniques, enabled = attack_labels(entry)
+                for cells, labels in ((technique_cells, techniques), (tactic_cells, tactics)):
+                    cells[0].extend([row] * len(labels))
+                    cells[1].extend(labels)
+                    cells[2].extend([enabled] * len(labels))
+
+        self.techniques, self.enabled, self.disabled = self._build(technique_cells)
+        self.tactics, self.tactic_enabled, self.tactic_disabled = self._build(tactic_cells)
+
+        tenant_ids = [workspace.tenant_id.lower() for workspace in self.workspaces]
+        self.tenants: List[str] = sorted(set(tenant_ids))
+        tenant_rows = np.searchsorted(self.tenants, tenant_ids) if tenant_ids else np.zeros(0, int)
+        # tenants x workspaces membership mask
+        self.membership = np.zeros((len(self.tenants), len(self.workspaces)), dtype=bool)
+        self.membership[tenant_rows, np.arange(len(self.workspaces))] = True
+
+    def _build(
+        self, cells: Tuple[List[int], List[str], List[bool]]
+    ) -> Tuple[List[str], np.ndarray, np.ndarray]:
+        """Scatter (row, label, enabled) cells into enabled and disabled count matrices"""
+        rows, labels, enabled = cells
+        columns, column_index = np.unique(np.asarray(labels, dtype=str), return_inverse=True)
+        shape = (len(self.workspaces), len(columns))
+        enabled_counts = np.zeros(shape, dtype=np.int32)
+        disabled_counts = np.zeros(shape, dtype=np.int32)
+        if labels:
+            rows_array = np.asarray(rows)
+            enabled_mask = np.asarray(enabled, dtype=bool)
+            np.add.at(enabled_counts, (rows_array[enabled_mask], column_index[enabled_mask]), 1)
+            np.add.at(disabled_counts, (rows_array[~enabled_mask], column_index[~enabled_mask]), 1)
+        return columns.tolist(), enabled_counts, disabled_counts
+
+    @property
+    def covered(self) -> np.ndarray:
+        """Workspace x technique mask of techniques with at least one enabled rule"""
+        return self.enabled > 0
+
+    @property
+    def disabled_only(self) -> np.ndarray:
+        """Workspace x technique mask of techniques whose rules are all disabled"""
+        return (self.disabled > 0) & (self.enabled == 0)
+
+    @property
+    def tenant_covered(self) -> np.ndarray:
+        """Tenant x technique mask of techniques covered in any of the tenant's workspaces"""
+        return (self.membership.astype(np.int32) @ self.covered.astype(np.int32)) > 0
+
+    def fleet_covered(self) -> np.ndarray:
+        """Technique mask of techniques covered in at least one workspace"""
+        return self.covered.any(axis=0)
+
+    def workspace_summary(self) -> List[Dict[str, Any]]:
+        """
+        Get coverage per workspace
+
+        Returns:
+            One entry per workspace with covered and disabled-only technique
+            counts, and coverage relative to the techniques covered fleet-wide
+        """
+        fleet_total = int(self.fleet_covered().sum())
+        covered_counts = self.covered.sum(axis=1)
+        disabled_counts = self.disabled_only.sum(axis=1)
+        tactic_counts = (self.tactic_enabled > 0).sum(axis=1)
+        return [
+            {
+                "workspace_name": workspace.workspace_name,
+                "workspace_id": workspace.workspace_id,
+                "tenant_name": workspace.tenant_name,
+                "techniques_covered": int(covered_counts[row]),
+                "techniques_disabled_only": int(disabled_counts[row]),
+                "tactics_covered": int(tactic_counts[row]),
+                "fleet_coverage_pct": _percent(covered_counts[row], fleet_total),
+            }
+            for row, workspace in enumerate(self.workspaces)
+        ]
+
+    def tenant_gaps(self) -> List[Dict[str, Any]]:
+        """
+        Get the techniques each tenant lacks that other tenants cover
+
+        Returns:
+            One entry per tenant with its covered technique count and gaps
+        """
+        techniques = np.asarray(self.techniques, dtype=object)
+        gaps = self.fleet_covered()[np.newaxis, :] & ~self.tenant_covered
+        names = {
+            workspace.tenant_id.lower(): workspace.tenant_name for workspace in self.workspaces
+        }
+        covered_counts = self.tenant_covered.sum(axis=1)
+        return [
+            {
+                "tenant_id": tenant_id,
+                "tenant_name": names.get(tenant_id),
+                "workspaces": int(self.membership[row].sum()),
+                "techniques_covered": int(covered_counts[row]),
+                "gaps": techniques[gaps[row]].tolist(),
+            }
+            for row, tenant_id in enumerate(self.tenants)
+        ]
+
+    def heatmap(self) -> List[Dict[str, Any]]:
+        """
+        Get fleet-wide coverage per technique
+
+        Returns:
+            One entry per technique with the number and share of workspaces
+            covering it, and its enabled and disabled rule counts
+        """
+        workspace_counts = self.covered.sum(axis=0)
+        enabled_rules = self.enabled.sum(axis=0)
+        disabled_rules = self.disabled.sum(axis=0)
+        return [
+            {
+                "technique": technique,
+                "workspaces_covered": int(workspace_counts[column]),
+                "coverage_pct": _percent(workspace_counts[column], len(self.workspaces)),
+                "enabled_rules": int(enabled_rules[column]),
+                "disabled_rules": int(disabled_rules[column]),
+            }
+            for column, technique in enumerate(self.techniques)
+        ]
+
+    def tactic_heatmap(self) -> List[Dict[str, Any]]:
+        """
+        Get fleet-wide coverage per tactic
+
+        Returns:
+            One entry per tactic with the number and share of workspaces that
+            have an enabled rule for it
+        """
+        workspace_counts = (self.tactic_enabled > 0).sum(axis=0)
+        return [
+            {
+                "tactic": tactic,
+                "workspaces_covered": int(workspace_counts[column]),
+                "coverage_pct": _percent(workspace_counts[column], len(self.workspaces)),
+            }
+            for column, tactic in enumerate(self.tactics)
+        ]
+
+
+def _percent(part: Any, total: int) -> float:
+    """Percentage rounded to one decimal (0 when total is 0)"""
+    return round(100.0 * float(part) / total, 1) if total else 0.0
@@ -0,0 +1,171 @@
+"""
+Blocking Call Executor Module
+
+Bounded thread pool for the remaining synchronous Azure SDK and storage calls,
+so they run off the event loop without unbounded thread growth.
+"""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, TypeVar
+import asyncio
+import functools
+import threading
+import structlog
+
+from .config import Settings, get_settings
+
+logger = structlog.get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class BlockingCallExecutor:
+    """Runs blocking callables in a bounded ThreadPoolExecutor"""
+
+    def __init__(self, max_workers: int = 10):
+        """
+        Initialize blocking call executor
+
+        Args:
+            max_workers: Maximum number of worker threads
+        """
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="sentinel-blocking"
+        )
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._running = 0
+        self._max_queue_depth = 0
+        self._completed = 0
+        self._failed = 0
+        self._timed_out = 0
+        self._cancelled = 0
+
+    async def run(
+        self,
+        func: Callable[..., T],
+        *args: Any,
+        timeout: Optional[float] = None,
+        **kwargs: Any,
+    ) -> T:
+        """
+        Run a blocking callable on the pool and await its result
+
+        On timeout or cancellation a call that has not started yet is removed
+        from the queue. A call that is already running cannot be interrupted;
+        it finishes in the background and its result is discarded.
+
+        Args:
+            func: Blocking callable
+            *args: Positional arguments for func
+            timeout: Optional timeout in seconds, including queue time
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            Result of func
+
+        Raises:
+            asyncio.TimeoutError: If the call did not finish within timeout
+        """
+        with self._lock:
+            self._queued += 1
+            self._max_queue_depth = max(self._max_queue_depth, self._queued)
+
+        future = self._executor.submit(self._invoke, functools.partial(func, *args, **kwargs))
+        future.add_done_callback(self._on_done)
+
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout=timeout)
+        except asyncio.TimeoutError:
+            with self._lock:
+                self._timed_out += 1
+            logger.warning(
+                "Blocking call timed out",
+                call=getattr(func, "__qualname__", repr(func)),
+                timeout_seconds=timeout,
+            )
+            raise
+        except asyncio.CancelledError:
+            with self._lock:
+                self._cancelled += 1
+            raise
+
+    def _invoke(self, call: Callable[[], T]) -> T:
+        """Run a call on a worker thread, tracking queue and running counts"""
+        with self._lock:
+            self._queued -= 1
+            self._running += 1
+        try:
+            result = call()
+        except BaseException:
+            with self._lock:
+                self._failed += 1
+            raise
+        else:
+            with self._lock:
+                self._completed += 1
+            return result
+        finally:
+            with self._lock:
+                self._running -= 1
+
+    def _on_done(self, future: Future) -> None:
+        """Release the queue slot of calls cancelled before they started"""
+        if future.cancelled():
+            with self._lock:
+                self._queued -= 1
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get executor statistics
+
+        Returns:
+            Dictionary with pool size, current queue depth and call counters
+        """
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "queue_depth": self._queued,
+                "max_queue_depth": self._max_queue_depth,
+                "running": self._running,
+                "completed": self._completed,
+                "failed": self._failed,
+                "timed_out": self._timed_out,
+                "cancelled": self._cancelled,
+            }
+
+    def shutdown(self) -> None:
+        """Stop the pool, dropping calls that have not started"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+# Global executor instance
+_blocking_executor: Optional[BlockingCallExecutor] = None
+
+
+def get_blocking_executor(settings: Optional[Settings] = None) -> BlockingCallExecutor:
+    """
+    Get or create the global blocking call executor
+
+    The pool is sized to ``max_concurrent_queries``.
+
+    Args:
+        settings: Optional Settings instance (defaults to global settings)
+
+    Returns:
+        BlockingCallExecutor instance
+    """
+    global _blocking_executor
+    if _blocking_executor is None:
+        settings = settings or get_settings()
+        _blocking_executor = BlockingCallExecutor(settings.max_concurrent_queries)
+    return _blocking_executor
+
+
+def shutdown_blocking_executor() -> None:
+    """Shut down and discard the global blocking call executor"""
+    global _blocking_executor
+    if _blocking_executor is not None:
+        _blocking_executor.shutdown()
+        _blocking_executor = None
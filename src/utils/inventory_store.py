@@ -0,0 +1,127 @@
+"""
+Workspace Inventory Store Module
+
+Persists the Sentinel workspace inventory to a local SQLite database so a
+restarted server can serve workspaces immediately and revalidate in the
+background instead of paying the full Lighthouse enumeration cost.
+"""
+
+import sqlite3
+from contextlib import closing
+from dataclasses import astuple, fields
+from pathlib import Path
+from typing import List, Optional, Tuple
+import structlog
+
+from .lighthouse import SentinelWorkspace
+
+logger = structlog.get_logger(__name__)
+
+SCHEMA_VERSION = 1
+
+_WORKSPACE_COLUMNS = [f.name for f in fields(SentinelWorkspace)]
+
+
+class WorkspaceInventoryStore:
+    """SQLite-backed store for the Sentinel workspace inventory"""
+
+    def __init__(self, path: str, identity: str = ""):
+        """
+        Initialize inventory store
+
+        Args:
+            path: Path of the SQLite database file ("~" is expanded)
+            identity: Key of the identity the inventory is enumerated as;
+                      an inventory saved under another identity is ignored
+        """
+        self.path = Path(path).expanduser()
+        self.identity = identity
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database, creating the schema if needed"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.path)
+        columns = ", ".join(
+            f"{name} TEXT PRIMARY KEY" if name == "workspace_id" else f"{name} TEXT"
+            for name in _WORKSPACE_COLUMNS
+        )
+        connection.executescript(
+            f"""
+            CREATE TABLE IF NOT EXISTS inventory_meta (
+                key TEXT PRIMARY KEY,
+                value TEXT
+            );
+            CREATE TABLE IF NOT EXISTS workspaces ({columns});
+            """
+        )
+        return connection
+
+    def load(self) -> Optional[Tuple[List[SentinelWorkspace], float]]:
+        """
+        Load the persisted inventory
+
+        Returns:
+            Tuple of (workspaces, generated_at epoch seconds), or None if no
+            usable inventory has been stored yet
+        """
+        if not self.path.exists():
+            return None
+
+        try:
+            with closing(self._connect()) as connection, connection:
+                meta = dict(connection.execute("SELECT key, value FROM inventory_meta"))
+                if int(meta.get("schema_version", 0)) != SCHEMA_VERSION:
+                    logger.info("Ignoring inventory with unknown schema", path=str(self.path))
+                    return None
+                if meta.get("identity", "") != self.identity:
+                    logger.info("Ignoring inventory of another identity", path=str(self.path))
+                    return None
+                if "generated_at" not in meta:
+                    return None
+
+                rows = connection.execute(
+                    f"SELECT {', '.join(_WORKSPACE_COLUMNS)} FROM workspaces"
+                ).fetchall()
+        except (sqlite3.Error, ValueError) as e:
+            logger.warning("Failed to load workspace inventory", path=str(self.path), error=str(e))
+            return None
+
+        workspaces = [SentinelWorkspace(*row) for row in rows]
+        generated_at = float(meta["generated_at"])
+        logger.info(
+            "Loaded workspace inventory",
+            path=str(self.path),
+            count=len(workspaces),
+            generated_at=generated_at,
+        )
+        return workspaces, generated_at
+
+    def save(self, workspaces: List[SentinelWorkspace], generated_at: float) -> None:
+        """
+        Replace the persisted inventory
+
+        Args:
+            workspaces: Workspaces to persist
+            generated_at: Epoch seconds at which the inventory was enumerated
+        """
+        placeholders = ", ".join("?" for _ in _WORKSPACE_COLUMNS)
+        try:
+            with closing(self._connect()) as connection, connection:
+                connection.execute("DELETE FROM workspaces")
+                connection.executemany(
+                    f"INSERT OR REPLACE INTO workspaces VALUES ({placeholders})",
+                    [astuple(ws) for ws in workspaces],
+                )
+                connection.executemany(
+                    "INSERT OR REPLACE INTO inventory_meta VALUES (?, ?)",
+                    [
+                        ("schema_version", str(SCHEMA_VERSION)),
+                        ("identity", self.identity),
+                        ("generated_at", repr(generated_at)),
+                    ],
+                )
+        except sqlite3.Error as e:
+            logger.warning("Failed to persist workspace inventory", path=str(self.path), error=str(e))
+            return
+
+        logger.info("Persisted workspace inventory", path=str(self.path), count=len(workspaces))
@@ -5,19 +5,26 @@ Handles enumeration of Microsoft Sentinel workspaces across multiple tenants
 using Azure Lighthouse delegation.
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, AsyncIterator, Set, Tuple
 import asyncio
+import time
 from dataclasses import dataclass
 import structlog
-from azure.mgmt.resource import ResourceManagementClient
-from azure.mgmt.securityinsight import SecurityInsights
-from azure.core.credentials import TokenCredential
-from azure.core.exceptions import AzureError
+from azure.mgmt.resource.resources.aio import ResourceManagementClient
+from azure.core.exceptions import ClientAuthenticationError
 
 from .auth import AzureAuthenticator
+from .client_registry import get_client_registry
+from .config import Settings, get_settings
+from .executor import get_blocking_executor
+from .rate_limiter import arm_client_kwargs, get_rate_limiter
 
 logger = structlog.get_logger(__name__)
 
+# API version of Microsoft.OperationsManagement/solutions, used to read a
+# solution's properties (workspaceResourceId)
+SOLUTIONS_API_VERSION = "2015-11-01-preview"
+
 
 @dataclass
 class SentinelWorkspace:
@@ -36,17 +43,53 @@ class SentinelWorkspace:
 class LighthouseManager:
     """Manages Azure Lighthouse delegated access and workspace enumeration"""
 
-    def __init__(self, authenticator: AzureAuthenticator):
+    def __init__(
+        self,
+        authenticator: AzureAuthenticator,
+        settings: Optional[Settings] = None,
+    ):
         """
         Initialize Lighthouse Manager
 
         Args:
             authenticator: AzureAuthenticator instance
+            settings: Optional Settings instance (defaults to global settings)
         """
         self.authenticator = authenticator
         self.credential = authenticator.get_credential()
+        self.async_credential = authenticator.get_async_credential()
+        self.settings = settings or get_settings()
+        self.client_registry = get_client_registry(self.async_credential, self.settings)
+        self.executor = get_blocking_executor(self.settings)
+        self.rate_limiter = get_rate_limiter(self.settings)
         self._workspace_cache: Optional[List[SentinelWorkspace]] = None
         self._cache_timestamp: Optional[float] = None
+        self._workspace_index = None
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._refresh_discovered: Optional[List[SentinelWorkspace]] = None
+        self._refresh_listeners: List[asyncio.Queue] = []
+        self._resource_graph = None
+        self._onboarding_cache: Dict[str, Tuple[bool, float]] = {}
+        self._access_cache: Dict[str, Tuple[bool, float]] = {}
+
+        from .tenant_directory import TenantDirectory
+
+        self.tenant_directory = TenantDirectory(
+            self.async_credential,
+            self.settings.tenant_cache_ttl,
+            rate_limiter=self.rate_limiter,
+        )
+
+        # Optional on-disk inventory for warm restarts
+        self._inventory_store = None
+        self._inventory_loaded = False
+        if self.settings.enable_workspace_cache and self.settings.workspace_inventory_path:
+            from .inventory_store import WorkspaceInventoryStore
+
+            self._inventory_store = WorkspaceInventoryStore(
+                self.settings.workspace_inventory_path,
+                identity=authenticator.get_identity_key(),
+            )
 
     async def get_all_subscriptions(self) -> List[Dict[str, Any]]:
         """
@@ -56,12 +99,18 @@ class LighthouseManager:
             List of subscription dictionaries
         """
         try:
-            from azure.mgmt.resource.subscriptions import SubscriptionClient
+            from azure.mgmt.resource.subscriptions.aio import SubscriptionClient
 
-            sub_client = SubscriptionClient(self.credential)
             subscriptions = []
 
-            for subscription in sub_client.subscriptions.list():
+            async with SubscriptionClient(
+                self.async_credential, **arm_client_kwargs(self.rate_limiter)
+            ) as sub_client:
+                subscription_pages = [
+                    subscription async for subscription in sub_client.subscriptions.list()
+                ]
+
+            for subscription in subscription_pages:
                 subscriptions.append(
                     {
                         "subscription_id": subscription.subscription_id,
@@ -70,6 +119,10 @@ class LighthouseManager:
                         "state": subscription.state,
                     }
                 )
+                # Pace this subscription's ARM reads with its tenant's budget
+                self.rate_limiter.register_subscription(
+                    subscription.subscription_id, subscription.tenant_id
+                )
 
             logger.info("Retrieved subscriptions", count=len(subscriptions))
             return subscriptions
@@ -79,85 +132,521 @@ class LighthouseManager:
             raise
 
     async def get_sentinel_workspaces(
-        self, subscription_id: Optional[str] = None
+        self,
+        subscription_id: Optional[str] = None,
+        force_refresh: bool = False,
     ) -> List[SentinelWorkspace]:
         """
         Get all Microsoft Sentinel workspaces
 
+        Served from the workspace cache when enabled. Once the cache is warm,
+        an expired cache is returned immediately while a single background
+        refresh re-enumerates the workspaces (stale-while-revalidate).
+
         Args:
             subscription_id: Optional specific subscription ID to query
+            force_refresh: If True, wait for a fresh enumeration
 
         Returns:
             List of SentinelWorkspace objects
         """
+        if not self.settings.enable_workspace_cache:
+            return await self._enumerate_workspaces(subscription_id)
+
+        await self._load_persisted_inventory()
+
+        if self._workspace_cache is None and subscription_id and not force_refresh:
+            # Cold cache: scanning one subscription is cheaper than warming up
+            return await self._enumerate_workspaces(subscription_id)
+
+        if force_refresh or self._workspace_cache is None:
+            workspaces = await self._refresh_workspace_cache()
+        else:
+            workspaces = self._workspace_cache
+            if not self._is_cache_fresh():
+                self._schedule_background_refresh()
+
+        if subscription_id:
+            return [ws for ws in workspaces if ws.subscription_id == subscription_id]
+        return list(workspaces)
+
+    async def iter_sentinel_workspaces(
+        self,
+        workspace_filter: Optional[str] = None,
+        tenant_filter: Optional[str] = None,
+    ) -> AsyncIterator[SentinelWorkspace]:
+        """
+        Stream Microsoft Sentinel workspaces as they are discovered
+
+        A warm cache is streamed from the index. On a cold cache the caller
+        follows the shared cache refresh and receives each workspace as soon
+        as its subscription has been scanned, so per-workspace work can start
+        while enumeration is still running.
+
+        Args:
+            workspace_filter: Optional workspace name substring or glob pattern
+            tenant_filter: Optional tenant name substring/glob or tenant ID
+
+        Yields:
+            Matching SentinelWorkspace objects
+        """
+        from .workspace_index import workspace_matches
+
+        tenant_ids = await self._resolve_tenant_filter(tenant_filter)
+
+        if not self.settings.enable_workspace_cache:
+            async for workspace in self._stream_workspaces():
+                if workspace_matches(workspace, workspace_filter, tenant_filter, tenant_ids):
+                    yield workspace
+            return
+
+        await self._load_persisted_inventory()
+        if self._workspace_cache is not None:
+            index = await self.get_workspace_index()
+            for workspace in index.match(workspace_filter, tenant_filter, tenant_ids):
+                yield workspace
+            return
+
+        # Cold cache: subscribe to the single in-flight refresh
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._run_cache_refresh())
+        refresh_task = self._refresh_task
+
+        queue: asyncio.Queue = asyncio.Queue()
+        for workspace in self._refresh_discovered or []:
+            queue.put_nowait(workspace)
+        self._refresh_listeners.append(queue)
+
         try:
-            workspaces = []
+            while True:
+                workspace = await queue.get()
+                if workspace is None:
+                    break
+                if workspace_matches(workspace, workspace_filter, tenant_filter, tenant_ids):
+                    yield workspace
+        finally:
+            if queue in self._refresh_listeners:
+                self._refresh_listeners.remove(queue)
+
+        # Surface enumeration failures to the consumer
+        await asyncio.shield(refresh_task)
+
+    async def warm_up(self) -> None:
+        """
+        Seed the workspace cache at startup
+
+        Loads the persisted inventory from a previous run (if any) and
+        revalidates it in the background, so the first tool call does not
+        wait on a full enumeration.
+        """
+        if not self.settings.enable_workspace_cache:
+            return
+
+        await self._load_persisted_inventory()
+        self._schedule_background_refresh()
+
+    async def _load_persisted_inventory(self) -> None:
+        """Seed the cache from the on-disk inventory, once per process"""
+        if self._inventory_loaded or self._inventory_store is None:
+            return
+        self._inventory_loaded = True
+
+        if self._workspace_cache is not None:
+            return
+
+        loaded = await self.executor.run(self._inventory_store.load)
+        if loaded is not None:
+            self._set_workspace_cache(*loaded)
+
+    def _set_workspace_cache(
+        self, workspaces: List[SentinelWorkspace], timestamp: float
+    ) -> None:
+        """Replace the cached workspace list and rebuild its lookup index"""
+        from .workspace_index import WorkspaceIndex
+
+        for workspace in workspaces:
+            self.rate_limiter.register_subscription(workspace.subscription_id, workspace.tenant_id)
+        self._workspace_index = WorkspaceIndex(workspaces)
+        self._workspace_cache = workspaces
+        self._cache_timestamp = timestamp
+
+    def _is_cache_fresh(self) -> bool:
+        """Check whether the cached workspace list is within its TTL"""
+        if self._workspace_cache is None or self._cache_timestamp is None:
+            return False
+        age = time.time() - self._cache_timestamp
+        return age < self.settings.workspace_cache_ttl
+
+    async def _refresh_workspace_cache(self) -> List[SentinelWorkspace]:
+        """
+        Refresh the workspace cache, joining a refresh already in flight
+
+        Returns:
+            Freshly enumerated list of SentinelWorkspace objects
+        """
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._run_cache_refresh())
+        # Shield so a cancelled caller does not abort the shared refresh
+        return await asyncio.shield(self._refresh_task)
+
+    async def _run_cache_refresh(self) -> List[SentinelWorkspace]:
+        """
+        Enumerate all workspaces and store them in the cache
+
+        Each discovered workspace is also pushed to the queues of
+        iter_sentinel_workspaces() callers following this refresh.
+        """
+        started = time.time()
+        workspaces: List[SentinelWorkspace] = []
+        self._refresh_discovered = workspaces
+        try:
+            async for workspace in self._stream_workspaces():
+                workspaces.append(workspace)
+                for queue in self._refresh_listeners:
+                    queue.put_nowait(workspace)
+        finally:
+            for queue in self._refresh_listeners:
+                queue.put_nowait(None)
+            self._refresh_listeners = []
+            self._refresh_discovered = None
+
+        self._set_workspace_cache(workspaces, time.time())
+        logger.info(
+            "Workspace cache refreshed",
+            count=len(workspaces),
+            duration_seconds=round(self._cache_timestamp - started, 2),
+        )
+
+        if self._inventory_store is not None:
+            await self.executor.run(
+                self._inventory_store.save, workspaces, self._cache_timestamp
+            )
+        return workspaces
+
+    def _schedule_background_refresh(self) -> None:
+        """Start a background cache refresh unless one is already running"""
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return
+
+        logger.info(
+            "Refreshing workspace cache in background",
+            ttl_seconds=self.settings.workspace_cache_ttl,
+        )
+        self._refresh_task = asyncio.create_task(self._run_cache_refresh())
+        self._refresh_task.add_done_callback(self._on_background_refresh_done)
+
+    @staticmethod
+    def _on_background_refresh_done(task: asyncio.Task) -> None:
+        """Log background refresh failures; the stale cache stays in place"""
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is not None:
+            logger.error("Background workspace cache refresh failed", error=str(error))
+
+    async def _enumerate_workspaces(
+        self, subscription_id: Optional[str] = None
+    ) -> List[SentinelWorkspace]:
+        """
+        Enumerate Microsoft Sentinel workspaces with the configured backend
+
+        Args:
+            subscription_id: Optional specific subscription ID to query
+
+        Returns:
+            List of SentinelWorkspace objects
+        """
+        return [ws async for ws in self._stream_workspaces(subscription_id)]
+
+    async def _stream_workspaces(
+        self, subscription_id: Optional[str] = None
+    ) -> AsyncIterator[SentinelWorkspace]:
+        """
+        Stream Microsoft Sentinel workspaces from the configured backend
+
+        Args:
+            subscription_id: Optional specific subscription ID to query
+
+        Yields:
+            SentinelWorkspace objects in discovery order
+        """
+        # Customer display names come from the tenant directory; the
+        # subscription name reported by the backend is only a fallback
+        tenant_names = await self.tenant_directory.get_tenant_names()
+
+        if self.settings.workspace_discovery_backend == "resource_graph":
+            enumerator = self._get_resource_graph_enumerator()
+            workspaces = enumerator.iter_sentinel_workspaces(
+                [subscription_id] if subscription_id else None
+            )
+        else:
+            workspaces = self._stream_workspaces_arm(subscription_id)
+
+        async for workspace in workspaces:
+            workspace.tenant_name = tenant_names.get(
+                workspace.tenant_id.lower(), workspace.tenant_name
+            )
+            yield workspace
+
+    def _get_resource_graph_enumerator(self):
+        """Get or create the Resource Graph workspace enumerator"""
+        if self._resource_graph is None:
+            from .resource_graph import ResourceGraphWorkspaceEnumerator
+
+            self._resource_graph = ResourceGraphWorkspaceEnumerator(
+                self.credential,
+                executor=self.executor,
+                timeout=self.settings.query_timeout_seconds,
+            )
+        return self._resource_graph
+
+    async def _stream_workspaces_arm(
+        self, subscription_id: Optional[str] = None
+    ) -> AsyncIterator[SentinelWorkspace]:
+        """
+        Stream Microsoft Sentinel workspaces from Azure Resource Manager
 
+        Subscriptions are scanned concurrently; each subscription's workspaces
+        are yielded as soon as its scan completes.
+
+        Args:
+            subscription_id: Optional specific subscription ID to query
+
+        Yields:
+            SentinelWorkspace objects
+        """
+        try:
             # Get subscriptions to query
             if subscription_id:
                 subscriptions = [{"subscription_id": subscription_id}]
             else:
                 subscriptions = await self.get_all_subscriptions()
+        except Exception as e:
+            logger.error("Failed to retrieve Sentinel workspaces", error=str(e))
+            raise
+
+        # Scan subscriptions concurrently, bounded by max_concurrent_queries
+        semaphore = asyncio.Semaphore(self.settings.max_concurrent_queries)
+        scans = [
+            asyncio.create_task(self._scan_subscription_bounded(sub, semaphore))
+            for sub in subscriptions
+        ]
+
+        count = 0
+        try:
+            for scan in asyncio.as_completed(scans):
+                for workspace in await scan:
+                    count += 1
+                    yield workspace
+        finally:
+            # Stop outstanding scans if the consumer stops early
+            for scan in scans:
+                scan.cancel()
+
+        logger.info("Retrieved Sentinel workspaces", count=count)
+
+    async def _scan_subscription_bounded(
+        self, sub: Dict[str, Any], semaphore: asyncio.Semaphore
+    ) -> List[SentinelWorkspace]:
+        """
+        Scan one subscription under the concurrency bound and its own timeout
+
+        A failed or timed-out subscription is logged and yields no workspaces,
+        so it never stalls or fails the scans of other subscriptions.
+
+        Args:
+            sub: Subscription dictionary from get_all_subscriptions()
+            semaphore: Semaphore bounding concurrent subscription scans
+
+        Returns:
+            List of SentinelWorkspace objects found in the subscription
+        """
+        sub_id = sub["subscription_id"]
+        timeout = self.settings.query_timeout_seconds
+
+        async with semaphore:
+            try:
+                return await asyncio.wait_for(
+                    self._scan_subscription(sub),
+                    timeout=timeout,
+                )
+            except asyncio.TimeoutError:
+                logger.error(
+                    "Subscription scan timed out",
+                    subscription_id=sub_id,
+                    timeout_seconds=timeout,
+                )
+            except Exception as e:
+                logger.error(
+                    "Failed to query subscription",
+                    subscription_id=sub_id,
+                    error=str(e),
+                )
+        return []
+
+    async def _scan_subscription(self, sub: Dict[str, Any]) -> List[SentinelWorkspace]:
+        """
+        Find Sentinel workspaces in a single subscription
+
+        Args:
+            sub: Subscription dictionary from get_all_subscriptions()
+
+        Returns:
+            List of SentinelWorkspace objects found in the subscription
+        """
+        sub_id = sub["subscription_id"]
+        workspaces = []
+
+        # Get Log Analytics workspaces (Sentinel runs on LA)
+        async with ResourceManagementClient(
+            self.async_credential, sub_id, **arm_client_kwargs(self.rate_limiter)
+        ) as resource_client:
+            la_workspaces = [
+                resource
+                async for resource in resource_client.resources.list(
+                    filter="resourceType eq 'Microsoft.OperationalInsights/workspaces'"
+                )
+            ]
+
+            onboarded = await self._detect_sentinel_onboarding(
+                resource_client, sub_id, la_workspaces
+            )
+
+        for resource in la_workspaces:
+            if onboarded.get(resource.id.lower()) is False:
+                logger.debug(
+                    "Skipping workspace (Sentinel not enabled)",
+                    workspace_name=resource.name,
+                )
+                continue
+
+            workspaces.append(
+                SentinelWorkspace(
+                    workspace_id=resource.id,
+                    workspace_name=resource.name,
+                    resource_group=self._extract_resource_group(resource.id),
+                    subscription_id=sub_id,
+                    tenant_id=sub.get("tenant_id", ""),
+                    tenant_name=sub.get("display_name", ""),
+                    location=resource.location,
+                )
+            )
+            logger.info(
+                "Found Sentinel workspace",
+                workspace_name=resource.name,
+                subscription=sub_id,
+            )
+
+        return workspaces
+
+    def is_sentinel_enabled(self, workspace_id: str) -> Optional[bool]:
+        """
+        Get the cached Sentinel onboarding state of a workspace
+
+        Args:
+            workspace_id: Full Azure resource ID of the Log Analytics workspace
+
+        Returns:
+            True/False if a non-expired detection result is cached, else None
+        """
+        cached = self._onboarding_cache.get(workspace_id.lower())
+        if cached is None:
+            return None
+        enabled, checked_at = cached
+        if time.time() - checked_at >= self.settings.sentinel_onboarding_cache_ttl:
+            return None
+        return enabled
+
+    async def _detect_sentinel_onboarding(
+        self,
+        resource_client: ResourceManagementClient,
+        subscription_id: str,
+        la_workspaces: List[Any],
+    ) -> Dict[str, bool]:
+        """
+        Detect which Log Analytics workspaces have Sentinel enabled
+
+        Uses cached results where available. Otherwise the subscription's
+        SecurityInsights solutions are listed in one call and the candidates
+        are read to match their workspace resource IDs; if that is not
+        permitted, each workspace's onboarding states are probed instead.
+        Positive and negative results are cached per workspace.
+
+        Args:
+            resource_client: ResourceManagementClient for the subscription
+            subscription_id: Subscription being scanned
+            la_workspaces: Log Analytics workspace resources in the subscription
 
-            # Query each subscription for Sentinel workspaces
-            for sub in subscriptions:
-                sub_id = sub["subscription_id"]
+        Returns:
+            Mapping of lowercase workspace resource ID to onboarding state.
+            Workspaces whose state could not be determined are omitted.
+        """
+        states: Dict[str, bool] = {}
+        unknown = []
+        for resource in la_workspaces:
+            cached = self.is_sentinel_enabled(resource.id)
+            if cached is None:
+                unknown.append(resource)
+            else:
+                states[resource.id.lower()] = cached
+
+        if not unknown:
+            return states
+
+        try:
+            # Sentinel is installed as a "SecurityInsights(<workspace>)" solution,
+            # which may live in another resource group than its workspace; the
+            # workspace it belongs to is read from the solution's properties
+            wanted = {f"securityinsights({resource.name.lower()})" for resource in unknown}
+            solutions = [
+                solution
+                async for solution in resource_client.resources.list(
+                    filter="resourceType eq 'Microsoft.OperationsManagement/solutions'"
+                )
+                if solution.name.lower() in wanted
+            ]
+            details = await asyncio.gather(
+                *(
+                    resource_client.resources.get_by_id(solution.id, SOLUTIONS_API_VERSION)
+                    for solution in solutions
+                )
+            )
+            onboarded_ids = {
+                str((detail.properties or {}).get("workspaceResourceId", "")).lower()
+                for detail in details
+            }
+            for resource in unknown:
+                states[resource.id.lower()] = resource.id.lower() in onboarded_ids
 
+        except Exception as e:
+            logger.warning(
+                "Solution listing failed, probing onboarding states per workspace",
+                subscription_id=subscription_id,
+                error=str(e),
+            )
+            sentinel_client = self.client_registry.get_client(subscription_id)
+            for resource in unknown:
                 try:
-                    # Get Log Analytics workspaces (Sentinel runs on LA)
-                    resource_client = ResourceManagementClient(self.credential, sub_id)
-
-                    # Find Log Analytics workspaces
-                    la_workspaces = []
-                    for resource in resource_client.resources.list(
-                        filter="resourceType eq 'Microsoft.OperationalInsights/workspaces'"
-                    ):
-                        # Check if Sentinel is enabled on this workspace
-                        try:
-                            # Try to get Sentinel-specific data
-                            sentinel_client = SecurityInsights(
-                                self.credential, sub_id, resource.name
-                            )
-
-                            workspace = SentinelWorkspace(
-                                workspace_id=resource.id,
-                                workspace_name=resource.name,
-                                resource_group=self._extract_resource_group(resource.id),
-                                subscription_id=sub_id,
-                                tenant_id=sub.get("tenant_id", ""),
-                                tenant_name=sub.get("display_name", ""),
-                                location=resource.location,
-                            )
-                            workspaces.append(workspace)
-                            logger.info(
-                                "Found Sentinel workspace",
-                                workspace_name=resource.name,
-                                subscription=sub_id,
-                            )
-
-                        except Exception as e:
-                            # Workspace doesn't have Sentinel enabled or access denied
-                            logger.debug(
-                                "Skipping workspace (not Sentinel-enabled or no access)",
-                                workspace_name=resource.name,
-                                error=str(e),
-                            )
-                            continue
-
-                except Exception as e:
-                    logger.error(
-                        "Failed to query subscription",
-                        subscription_id=sub_id,
-                        error=str(e),
+                    onboarding = await sentinel_client.sentinel_onboarding_states.list(
+                        resource_group_name=self._extract_resource_group(resource.id),
+                        workspace_name=resource.name,
+                    )
+                    states[resource.id.lower()] = bool(onboarding.value)
+                except Exception as probe_error:
+                    # Unknown state: keep the workspace, but do not cache it
+                    logger.debug(
+                        "Could not determine Sentinel onboarding state",
+                        workspace_name=resource.name,
+                        error=str(probe_error),
                     )
-                    continue
 
-            logger.info("Retrieved Sentinel workspaces", count=len(workspaces))
-            return workspaces
+        checked_at = time.time()
+        for resource in unknown:
+            key = resource.id.lower()
+            if key in states:
+                self._onboarding_cache[key] = (states[key], checked_at)
 
-        except Exception as e:
-            logger.error("Failed to retrieve Sentinel workspaces", error=str(e))
-            raise
+        return states
 
     def _extract_resource_group(self, resource_id: str) -> str:
         """
@@ -176,6 +665,21 @@ class LighthouseManager:
         except (ValueError, IndexError):
             return ""
 
+    async def get_workspace_index(self):
+        """
+        Get the lookup index over the current workspace inventory
+
+        Returns:
+            WorkspaceIndex over the cached workspaces (built from a fresh
+            enumeration when the workspace cache is disabled)
+        """
+        from .workspace_index import WorkspaceIndex
+
+        workspaces = await self.get_sentinel_workspaces()
+        if self.settings.enable_workspace_cache and self._workspace_index is not None:
+            return self._workspace_index
+        return WorkspaceIndex(workspaces)
+
     async def get_workspace_by_name(
         self, workspace_name: str, subscription_id: Optional[str] = None
     ) -> Optional[SentinelWorkspace]:
@@ -189,43 +693,142 @@ class LighthouseManager:
         Returns:
             SentinelWorkspace if found, None otherwise
         """
-        workspaces = await self.get_sentinel_workspaces(subscription_id)
-        for workspace in workspaces:
-            if workspace.workspace_name.lower() == workspace_name.lower():
-                return workspace
-        return None
+        index = await self.get_workspace_index()
+        return index.get_by_name(workspace_name, subscription_id)
+
+    async def resolve_workspace(
+        self,
+        workspace: str,
+        subscription_id: Optional[str] = None,
+        resource_group: Optional[str] = None,
+    ) -> Optional[SentinelWorkspace]:
+        """
+        Resolve a workspace address without enumerating every subscription
+
+        A full resource ID, or a name with subscription and resource group,
+        identifies the workspace directly: it is looked up in the cached
+        inventory and, if the inventory does not know it (yet), addressed as
+        given, so no ARM call is needed. A name with only a subscription scans
+        that one subscription while the cache is cold; a bare name falls back
+        to get_workspace_by_name().
+
+        Args:
+            workspace: Workspace name or full workspace resource ID
+            subscription_id: Optional subscription ID of the workspace
+            resource_group: Optional resource group of the workspace
+
+        Returns:
+            SentinelWorkspace if found (always for a direct address), None otherwise
+
+        Raises:
+            ValueError: If a resource ID is malformed
+        """
+        from .workspace_index import parse_workspace_resource_id, workspace_resource_id
+
+        await self._load_persisted_inventory()
+
+        if workspace.startswith("/"):
+            subscription_id, resource_group, workspace_name = parse_workspace_resource_id(
+                workspace
+            )
+        elif subscription_id and resource_group:
+            workspace_name = workspace
+        else:
+            if subscription_id and not self._has_inventory():
+                workspaces = await self.get_sentinel_workspaces(subscription_id)
+                return next(
+                    (ws for ws in workspaces if ws.workspace_name.lower() == workspace.lower()),
+                    None,
+                )
+            return await self.get_workspace_by_name(workspace, subscription_id)
+
+        resource_id = workspace_resource_id(subscription_id, resource_group, workspace_name)
+        if self._has_inventory():
+            cached = self._workspace_index.get_by_resource_id(resource_id)
+            if cached is not None:
+                return cached
+
+        logger.debug("Addressing workspace directly", workspace_id=resource_id)
+        return SentinelWorkspace(
+            workspace_id=resource_id,
+            workspace_name=workspace_name,
+            resource_group=resource_group,
+            subscription_id=subscription_id,
+            # Unknown until the workspace is enumerated; not needed to address it
+            tenant_id="",
+        )
+
+    def _has_inventory(self) -> bool:
+        """Check whether a workspace index is available without enumerating"""
+        return self.settings.enable_workspace_cache and self._workspace_index is not None
+
+    async def find_workspaces(
+        self,
+        workspace_filter: Optional[str] = None,
+        tenant_filter: Optional[str] = None,
+    ) -> List[SentinelWorkspace]:
+        """
+        Find workspaces by name and tenant filters
+
+        Args:
+            workspace_filter: Optional workspace name substring or glob pattern
+            tenant_filter: Optional tenant name substring/glob or tenant ID
+
+        Returns:
+            List of matching SentinelWorkspace objects
+        """
+        tenant_ids = await self._resolve_tenant_filter(tenant_filter)
+        index = await self.get_workspace_index()
+        return index.match(workspace_filter, tenant_filter, tenant_ids)
+
+    async def _resolve_tenant_filter(
+        self, tenant_filter: Optional[str]
+    ) -> Optional[Set[str]]:
+        """
+        Resolve a tenant filter to tenant IDs through the tenant directory
+
+        Args:
+            tenant_filter: Optional tenant ID, display name or name pattern
 
-    async def validate_workspace_access(self, workspace: SentinelWorkspace) -> bool:
+        Returns:
+            Set of lowercase tenant IDs, or None to fall back to matching
+            the filter against workspace tenant names
+        """
+        if not tenant_filter:
+            return None
+        return await self.tenant_directory.resolve_filter(tenant_filter)
+
+    async def validate_workspace_access(
+        self, workspace: SentinelWorkspace, use_cache: bool = True
+    ) -> bool:
         """
         Validate that we have access to a specific workspace
 
+        The result is recorded in the access cache. Denials (401/403) are
+        cached for ACCESS_DENIED_CACHE_TTL, confirmed access for
+        ACCESS_CACHE_TTL; other failures are reported but not cached.
+
         Args:
             workspace: SentinelWorkspace to validate
+            use_cache: If True, answer from a non-expired cached result
 
         Returns:
             True if access is valid, False otherwise
         """
-        try:
-            sentinel_client = SecurityInsights(
-                self.credential,
-                workspace.subscription_id,
-                workspace.workspace_name,
-            )
+        if use_cache:
+            cached = self.get_workspace_access(workspace)
+            if cached is not None:
+                return cached
 
-            # Try to list incidents as an access test
-            # This is a lightweight operation
-            incidents = sentinel_client.incidents.list(
-                resource_group_name=workspace.resource_group,
-                workspace_name=workspace.workspace_name,
-            )
-
-            # Just check if we can list (no need to iterate)
-            next(incidents, None)
+        try:
+            # Listing a single incident is a lightweight access test
+            await self._probe_workspace_access(workspace)
 
             logger.info(
                 "Workspace access validated",
                 workspace_name=workspace.workspace_name,
             )
+            self.record_workspace_access(workspace, True)
             return True
 
         except Exception as e:
@@ -234,17 +837,116 @@ class LighthouseManager:
                 workspace_name=workspace.workspace_name,
                 error=str(e),
             )
+            if is_access_denied_error(e):
+                self.record_workspace_access(workspace, False)
             return False
 
+    async def validate_workspaces_access(
+        self, workspaces: List[SentinelWorkspace], use_cache: bool = True
+    ) -> Dict[str, bool]:
+        """
+        Validate access to many workspaces concurrently
+
+        Probes run in parallel, bounded by max_concurrent_queries.
+
+        Args:
+            workspaces: Workspaces to validate
+            use_cache: If True, skip probes for workspaces with a cached result
+
+        Returns:
+            Mapping of workspace resource ID to access result
+        """
+        semaphore = asyncio.Semaphore(self.settings.max_concurrent_queries)
+
+        async def validate(workspace: SentinelWorkspace) -> bool:
+            async with semaphore:
+                return await self.validate_workspace_access(workspace, use_cache)
+
+        results = await asyncio.gather(*(validate(ws) for ws in workspaces))
+        logger.info(
+            "Workspace access sweep completed",
+            workspaces=len(workspaces),
+            denied=sum(1 for allowed in results if not allowed),
+        )
+        return {ws.workspace_id: allowed for ws, allowed in zip(workspaces, results)}
+
+    def get_workspace_access(self, workspace: SentinelWorkspace) -> Optional[bool]:
+        """
+        Get the cached access state of a workspace
+
+        Args:
+            workspace: SentinelWorkspace to look up
+
+        Returns:
+            True/False if a non-expired result is cached, else None
+        """
+        cached = self._access_cache.get(workspace.workspace_id.lower())
+        if cached is None:
+            return None
+        allowed, expires_at = cached
+        if time.time() >= expires_at:
+            return None
+        return allowed
+
+    def is_access_denied(self, workspace: SentinelWorkspace) -> bool:
+        """Check whether a workspace is known (cached) to deny access"""
+        return self.get_workspace_access(workspace) is False
+
+    def record_workspace_access(self, workspace: SentinelWorkspace, allowed: bool) -> None:
+        """
+        Record the access state of a workspace
+
+        Args:
+            workspace: SentinelWorkspace the result applies to
+            allowed: Whether access succeeded
+        """
+        ttl = (
+            self.settings.access_cache_ttl
+            if allowed
+            else self.settings.access_denied_cache_ttl
+        )
+        self._access_cache[workspace.workspace_id.lower()] = (allowed, time.time() + ttl)
+
+    async def _probe_workspace_access(self, workspace: SentinelWorkspace) -> None:
+        """List at most one incident to test access"""
+        sentinel_client = self.client_registry.get_client(workspace.subscription_id)
+        incidents = sentinel_client.incidents.list(
+            resource_group_name=workspace.resource_group,
+            workspace_name=workspace.workspace_name,
+            top=1,
+        )
+        # Just check if we can list (no need to iterate)
+        async for _ in incidents:
+            break
+
+
+def is_access_denied_error(error: Exception) -> bool:
+    """
+    Check whether an Azure SDK error means access was denied
+
+    Args:
+        error: Exception raised by an Azure SDK call
+
+    Returns:
+        True for authentication failures and HTTP 401/403 responses
+    """
+    if isinstance(error, ClientAuthenticationError):
+        return True
+    return getattr(error, "status_code", None) in (401, 403)
+
 
-async def get_lighthouse_manager(authenticator: AzureAuthenticator) -> LighthouseManager:
+async def get_lighthouse_manager(
+    authenticator: AzureAuthenticator,
+    settings: Optional[Settings] = None,
+) -> LighthouseManager:
     """
     Factory function to create a LighthouseManager
 
     Args:
         authenticator: AzureAuthenticator instance
+        settings: Optional Settings instance (defaults to global settings)
 
     Returns:
         LighthouseManager instance
     """
-    return LighthouseManager(authenticator)
+    return LighthouseManager(authenticator, settings)
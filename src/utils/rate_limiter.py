@@ -0,0 +1,295 @@
+"""
+ARM Rate Limiter Module
+
+Per-tenant token buckets that adapt to ARM throttling signals. A pipeline
+policy reads the ``x-ms-ratelimit-remaining-*-reads`` headers and honours
+``Retry-After`` on 429 responses, slowing a tenant down before ARM starts
+rejecting requests and speeding it back up while quota is plentiful.
+"""
+
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Mapping, Optional
+import asyncio
+import re
+import time
+import structlog
+from azure.core.pipeline import PipelineRequest, PipelineResponse
+from azure.core.pipeline.policies import AsyncHTTPPolicy
+
+from .config import Settings, get_settings
+
+logger = structlog.get_logger(__name__)
+
+REMAINING_READS_HEADERS = (
+    "x-ms-ratelimit-remaining-subscription-reads",
+    "x-ms-ratelimit-remaining-tenant-reads",
+)
+
+# Rate multiplier when quota runs low, and after a 429
+LOW_QUOTA_BACKOFF = 0.75
+THROTTLED_BACKOFF = 0.5
+# Rate increase (requests/second) per response with plenty of quota left
+RATE_INCREASE_STEP = 1.0
+# Pause applied on a 429 without a usable Retry-After header
+DEFAULT_RETRY_AFTER_SECONDS = 5.0
+# Bucket key for requests that are not scoped to a subscription
+DEFAULT_BUCKET = "default"
+# Pipeline context key marking a request whose last attempt was throttled
+THROTTLED_CONTEXT_KEY = "arm_throttled"
+
+_SUBSCRIPTION_PATTERN = re.compile(r"/subscriptions/([^/?]+)", re.IGNORECASE)
+
+
+def subscription_from_url(url: str) -> Optional[str]:
+    """Extract the subscription ID from an ARM request URL"""
+    match = _SUBSCRIPTION_PATTERN.search(url)
+    return match.group(1).lower() if match else None
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header value
+
+    Args:
+        value: Header value in seconds or as an HTTP date
+
+    Returns:
+        Delay in seconds, or None if the value cannot be parsed
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """Token bucket whose refill rate can change at runtime"""
+
+    def __init__(self, rate: float):
+        """
+        Initialize token bucket
+
+        Args:
+            rate: Refill rate in tokens per second (also the burst size)
+        """
+        self.rate = rate
+        self.tokens = max(1.0, rate)
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+
+    def _refill(self, now: float) -> None:
+        """Add tokens accrued since the last update"""
+        if now <= self.updated:
+            return
+        capacity = max(1.0, self.rate)
+        self.tokens = min(capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self) -> None:
+        """Wait until a token is available (and any pause has elapsed), then take it"""
+        while True:
+            now = time.monotonic()
+            if now < self.paused_until:
+                await asyncio.sleep(self.paused_until - now)
+                continue
+            self._refill(now)
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    def set_rate(self, rate: float) -> None:
+        """Change the refill rate, keeping tokens already accrued"""
+        self._refill(time.monotonic())
+        self.rate = rate
+        self.tokens = min(self.tokens, max(1.0, rate))
+
+    def pause(self, seconds: float) -> None:
+        """Stop handing out tokens for the given number of seconds"""
+        self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+        # Tokens only start accruing again once the pause is over
+        self.tokens = 0.0
+        self.updated = self.paused_until
+
+
+class AdaptiveRateLimiter:
+    """Per-tenant ARM read rate limiter driven by throttling headers"""
+
+    def __init__(
+        self,
+        max_rate: float = 20.0,
+        min_rate: float = 1.0,
+        low_watermark: int = 100,
+    ):
+        """
+        Initialize rate limiter
+
+        Args:
+            max_rate: Highest (and initial) request rate per tenant, per second
+            min_rate: Lowest request rate per tenant, per second
+            low_watermark: Remaining-reads count below which the rate is reduced
+        """
+        self.max_rate = max_rate
+        self.min_rate = min(min_rate, max_rate)
+        self.low_watermark = low_watermark
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._tenant_by_subscription: Dict[str, str] = {}
+
+    def register_subscription(self, subscription_id: str, tenant_id: str) -> None:
+        """Map a subscription to its tenant so its requests share the tenant's bucket"""
+        self._tenant_by_subscription[subscription_id.lower()] = tenant_id.lower()
+
+    def bucket_key(self, subscription_id: Optional[str]) -> str:
+        """Get the bucket key (tenant ID when known) for a subscription"""
+        if not subscription_id:
+            return DEFAULT_BUCKET
+        subscription_id = subscription_id.lower()
+        return self._tenant_by_subscription.get(subscription_id, subscription_id)
+
+    def _get_bucket(self, key: str) -> TokenBucket:
+        """Get or create the bucket for a key"""
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = TokenBucket(self.max_rate)
+        return bucket
+
+    async def acquire(self, subscription_id: Optional[str]) -> None:
+        """Wait for permission to send one request for a subscription"""
+        await self._get_bucket(self.bucket_key(subscription_id)).acquire()
+
+    def observe(
+        self, subscription_id: Optional[str], status_code: int, headers: Mapping[str, str]
+    ) -> None:
+        """
+        Adapt the tenant's rate to an ARM response
+
+        Args:
+            subscription_id: Subscription the request was scoped to
+            status_code: HTTP status code
+            headers: Response headers
+        """
+        key = self.bucket_key(subscription_id)
+        bucket = self._get_bucket(key)
+
+        if status_code == 429:
+            retry_after = parse_retry_after(headers.get("Retry-After"))
+            delay = retry_after if retry_after is not None else DEFAULT_RETRY_AFTER_SECONDS
+            bucket.pause(delay)
+            bucket.set_rate(max(self.min_rate, bucket.rate * THROTTLED_BACKOFF))
+            logger.warning(
+                "ARM throttled requests", bucket=key, retry_after_seconds=delay, rate=bucket.rate
+            )
+            return
+
+        remaining = self._remaining_reads(headers)
+        if remaining is None:
+            return
+        if remaining < self.low_watermark:
+            rate = max(self.min_rate, bucket.rate * LOW_QUOTA_BACKOFF)
+        else:
+            rate = min(self.max_rate, bucket.rate + RATE_INCREASE_STEP)
+        if rate != bucket.rate:
+            bucket.set_rate(rate)
+            logger.debug("ARM rate adjusted", bucket=key, remaining=remaining, rate=rate)
+
+    @staticmethod
+    def _remaining_reads(headers: Mapping[str, str]) -> Optional[int]:
+        """Get the lowest remaining-reads count reported by the response"""
+        values = []
+        for header in REMAINING_READS_HEADERS:
+            value = headers.get(header)
+            if value is not None:
+                try:
+                    values.append(int(value))
+                except ValueError:
+                    continue
+        return min(values) if values else None
+
+    def get_rates(self) -> Dict[str, float]:
+        """
+        Get the current request rate of every bucket
+
+        Returns:
+            Mapping of tenant ID (or subscription ID, if its tenant is unknown)
+            to requests per second
+        """
+        return {key: round(bucket.rate, 2) for key, bucket in self._buckets.items()}
+
+
+class ArmThrottlingPolicy(AsyncHTTPPolicy):
+    """Pipeline policy that paces ARM requests through an AdaptiveRateLimiter"""
+
+    def __init__(self, limiter: AdaptiveRateLimiter):
+        """
+        Initialize policy
+
+        Args:
+            limiter: Shared rate limiter
+        """
+        super().__init__()
+        self.limiter = limiter
+
+    async def send(self, request: PipelineRequest) -> PipelineResponse:
+        """
+        Wait for a token, send the request, then feed its headers back
+
+        A 429 pauses the tenant's bucket for Retry-After, which holds back
+        other requests. The retry policy already sleeps for Retry-After
+        before retrying the throttled request itself, so that retry is sent
+        without waiting on the bucket again.
+        """
+        subscription_id = subscription_from_url(request.http_request.url)
+        if not request.context.pop(THROTTLED_CONTEXT_KEY, False):
+            await self.limiter.acquire(subscription_id)
+        response = await self.next.send(request)
+        http_response = response.http_response
+        self.limiter.observe(subscription_id, http_response.status_code, http_response.headers)
+        if http_response.status_code == 429:
+            request.context[THROTTLED_CONTEXT_KEY] = True
+        return response
+
+
+# Global rate limiter instance
+_rate_limiter: Optional[AdaptiveRateLimiter] = None
+
+
+def get_rate_limiter(settings: Optional[Settings] = None) -> AdaptiveRateLimiter:
+    """
+    Get or create the global ARM rate limiter
+
+    Args:
+        settings: Optional Settings instance (defaults to global settings)
+
+    Returns:
+        AdaptiveRateLimiter instance
+    """
+    global _rate_limiter
+    if _rate_limiter is None:
+        settings = settings or get_settings()
+        _rate_limiter = AdaptiveRateLimiter(
+            max_rate=settings.arm_read_rate_limit,
+            low_watermark=settings.arm_ratelimit_low_watermark,
+        )
+    return _rate_limiter
+
+
+def arm_client_kwargs(limiter: Optional[AdaptiveRateLimiter] = None) -> Dict[str, Any]:
+    """
+    Get keyword arguments that install the throttling policy on an ARM client
+
+    The policy runs per retry, so every attempt takes a token and reports
+    the quota headers of its response.
+
+    Args:
+        limiter: Optional rate limiter (defaults to the global one)
+
+    Returns:
+        Keyword arguments for an azure-mgmt client constructor
+    """
+    return {"per_retry_policies": [ArmThrottlingPolicy(limiter or get_rate_limiter())]}
@@ -0,0 +1,184 @@
+"""
+Azure Resource Graph Workspace Enumeration Module
+
+Enumerates Microsoft Sentinel workspaces across all delegated subscriptions
+with paged Azure Resource Graph queries instead of one ARM resource listing
+per subscription.
+"""
+
+from typing import List, Dict, Any, Optional, AsyncIterator
+import structlog
+from azure.core.credentials import TokenCredential
+
+from .executor import BlockingCallExecutor, get_blocking_executor
+from .lighthouse import SentinelWorkspace
+
+try:
+    from azure.mgmt.resourcegraph import ResourceGraphClient
+    from azure.mgmt.resourcegraph.models import QueryRequest, QueryRequestOptions
+    RESOURCE_GRAPH_AVAILABLE = True
+except ImportError:
+    RESOURCE_GRAPH_AVAILABLE = False
+
+logger = structlog.get_logger(__name__)
+
+# Log Analytics workspaces joined with their SecurityInsights solution, so only
+# Sentinel-enabled workspaces are returned. Subscription names are joined in to
+# keep tenant_name consistent with the ARM enumeration path.
+SENTINEL_WORKSPACES_QUERY = """
+resources
+| where type =~ 'microsoft.operationalinsights/workspaces'
+| extend workspaceKey = tolower(id)
+| join kind=inner (
+    resources
+    | where type =~ 'microsoft.operationsmanagement/solutions'
+    | where name startswith 'SecurityInsights('
+    | extend workspaceKey = tolower(tostring(properties.workspaceResourceId))
+    | distinct workspaceKey
+) on workspaceKey
+| join kind=leftouter (
+    resourcecontainers
+    | where type =~ 'microsoft.resources/subscriptions'
+    | project subscriptionId, subscriptionName = name
+) on subscriptionId
+| project id, name, resourceGroup, subscriptionId, tenantId, location,
+          sku = tostring(properties.sku.name), subscriptionName
+| order by id asc
+"""
+
+DEFAULT_PAGE_SIZE = 1000
+
+
+class ResourceGraphWorkspaceEnumerator:
+    """Enumerates Sentinel workspaces with Azure Resource Graph queries"""
+
+    def __init__(
+        self,
+        credential: TokenCredential,
+        client: Optional[Any] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        executor: Optional[BlockingCallExecutor] = None,
+        timeout: Optional[float] = None,
+    ):
+        """
+        Initialize Resource Graph enumerator
+
+        Args:
+            credential: Azure credential
+            client: Optional Resource Graph client (defaults to ResourceGraphClient)
+            page_size: Number of rows requested per page (max 1000)
+            executor: Optional executor for the blocking client (defaults to the global one)
+            timeout: Optional per-page request timeout in seconds
+        """
+        if client is None:
+            if not RESOURCE_GRAPH_AVAILABLE:
+                raise RuntimeError(
+                    "azure-mgmt-resourcegraph is not installed. "
+                    "Install it with: pip install azure-mgmt-resourcegraph"
+                )
+            client = ResourceGraphClient(credential)
+
+        self.client = client
+        self.page_size = page_size
+        self.executor = executor or get_blocking_executor()
+        self.timeout = timeout
+
+    async def get_sentinel_workspaces(
+        self, subscription_ids: Optional[List[str]] = None
+    ) -> List[SentinelWorkspace]:
+        """
+        Get all Sentinel workspaces visible to the credential
+
+        Args:
+            subscription_ids: Optional list of subscription IDs to scope the query.
+                              Defaults to every subscription the credential can see,
+                              including Lighthouse-delegated subscriptions.
+
+        Returns:
+            List of SentinelWorkspace objects
+        """
+        return [ws async for ws in self.iter_sentinel_workspaces(subscription_ids)]
+
+    async def iter_sentinel_workspaces(
+        self, subscription_ids: Optional[List[str]] = None
+    ) -> AsyncIterator[SentinelWorkspace]:
+        """
+        Stream Sentinel workspaces page by page
+
+        Args:
+            subscription_ids: Optional list of subscription IDs to scope the query
+
+        Yields:
+            SentinelWorkspace objects as each result page arrives
+        """
+        count = 0
+        async for rows in self._query_pages(SENTINEL_WORKSPACES_QUERY, subscription_ids):
+            for row in rows:
+                count += 1
+                yield self._row_to_workspace(row)
+
+        logger.info(
+            "Retrieved Sentinel workspaces from Resource Graph",
+            count=count,
+        )
+
+    async def _query_pages(
+        self, query: str, subscription_ids: Optional[List[str]] = None
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Run a Resource Graph query, following skip tokens across pages
+
+        Args:
+            query: KQL query to run
+            subscription_ids: Optional subscription scope
+
+        Yields:
+            Result rows of each page as dictionaries
+        """
+        skip_token: Optional[str] = None
+        pages = 0
+
+        while True:
+            request = QueryRequest(
+                query=query,
+                subscriptions=subscription_ids or None,
+                options=QueryRequestOptions(
+                    top=self.page_size,
+                    skip_token=skip_token,
+                    result_format="objectArray",
+                ),
+            )
+            # The client is synchronous, so run the request off the event loop
+            response = await self.executor.run(
+                self.client.resources, request, timeout=self.timeout
+            )
+            pages += 1
+            yield response.data or []
+
+            skip_token = getattr(response, "skip_token", None)
+            if not skip_token:
+                break
+
+        logger.debug("Resource Graph query completed", pages=pages)
+
+    @staticmethod
+    def _row_to_workspace(row: Dict[str, Any]) -> SentinelWorkspace:
+        """
+        Convert a Resource Graph result row to a SentinelWorkspace
+
+        Args:
+            row: Result row from SENTINEL_WORKSPACES_QUERY
+
+        Returns:
+            SentinelWorkspace instance
+        """
+        return SentinelWorkspace(
+            workspace_id=row["id"],
+            workspace_name=row["name"],
+            resource_group=row.get("resourceGroup", ""),
+            subscription_id=row.get("subscriptionId", ""),
+            tenant_id=row.get("tenantId", ""),
+            tenant_name=row.get("subscriptionName") or "",
+            location=row.get("location") or "",
+            sku=row.get("sku") or "",
+        )
@@ -0,0 +1,230 @@
+"""
+Rule Catalog Module
+
+Per-workspace cache of analytics rule definitions keyed by rule name. Once
+the TTL expires a workspace is listed again in full: the alert rules API has
+no conditional listing, so every refresh costs the same ARM calls as a cold
+read. Each entry keeps the rule's ``etag`` and ``last_modified_utc`` so that
+the refreshed listing keeps the entries (and their derived views) of rules
+that did not change. Single-rule reads are answered from the last listing.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+import time
+import structlog
+
+from .config import Settings, get_settings
+from .lighthouse import SentinelWorkspace
+
+logger = structlog.get_logger(__name__)
+
+
+@dataclass
+class CachedRule:
+    """A cached analytics rule and values derived from it"""
+
+    rule: Any
+    etag: Optional[str]
+    last_modified_utc: Any
+    fetched_at: float
+    # Derived views (e.g. the listing summary), valid while the rule is unchanged
+    derived: Dict[str, Any] = field(default_factory=dict)
+
+    def matches(self, rule: Any) -> bool:
+        """Check whether a freshly listed rule is the same version as this entry"""
+        etag = getattr(rule, "etag", None)
+        if etag is not None or self.etag is not None:
+            return etag == self.etag
+        last_modified = getattr(rule, "last_modified_utc", None)
+        return last_modified is not None and last_modified == self.last_modified_utc
+
+
+@dataclass
+class _WorkspaceCatalog:
+    """Rules of one workspace and when they were last listed in full"""
+
+    rules: Dict[str, CachedRule] = field(default_factory=dict)
+    listed_at: Optional[float] = None
+
+
+class RuleCatalog:
+    """TTL cache of analytics rules per workspace, reusing unchanged entries by etag"""
+
+    def __init__(self, ttl_seconds: int = 300):
+        """
+        Initialize rule catalog
+
+        Args:
+            ttl_seconds: How long a listing is served without revalidating
+        """
+        self.ttl_seconds = ttl_seconds
+        self._workspaces: Dict[str, _WorkspaceCatalog] = {}
+        self.hits = 0
+        self.revalidations = 0
+        self.unchanged = 0
+        self.changed = 0
+
+    @staticmethod
+    def _key(workspace: SentinelWorkspace) -> str:
+        return workspace.workspace_id.lower()
+
+    def _is_fresh(self, timestamp: Optional[float]) -> bool:
+        return timestamp is not None and time.time() - timestamp < self.ttl_seconds
+
+    async def get_or_load(
+        self,
+        workspace: SentinelWorkspace,
+        fetch: Callable[[], Awaitable[List[Any]]],
+    ) -> List[CachedRule]:
+        """
+        Get a workspace's rules, listing them again once the TTL expires
+
+        Args:
+            workspace: Workspace whose rules to get
+            fetch: Coroutine function listing the workspace's rules from Azure
+
+        Returns:
+            Cached rule entries in listing order
+        """
+        catalog = self._workspaces.get(self._key(workspace))
+        if catalog is not None and self._is_fresh(catalog.listed_at):
+            self.hits += 1
+            return list(catalog.rules.values())
+
+        self.revalidations += 1
+        rules = await fetch()
+        return self.update(workspace, rules)
+
+    def update(self, workspace: SentinelWorkspace, rules: List[Any]) -> List[CachedRule]:
+        """
+        Replace a workspace's rules with a fresh listing
+
+        Entries whose etag (or, without etags, last_modified_utc) is unchanged
+        are kept, together with their derived views.
+
+        Args:
+            workspace: Workspace the rules belong to
+            rules: Rules as returned by alert_rules.list
+
+        Returns:
+            Cached rule entries in listing order
+        """
+        previous = self._workspaces.get(self._key(workspace))
+        previous_rules = previous.rules if previous else {}
+        now = time.time()
+        catalog = _WorkspaceCatalog(listed_at=now)
+        unchanged = 0
+
+        for rule in rules:
+            name = rule.name.lower()
+            entry = previous_rules.get(name)
+            if entry is not None and entry.matches(rule):
+                entry.fetched_at = now
+                unchanged += 1
+            else:
+                entry = self._new_entry(rule, now)
+            catalog.rules[name] = entry
+
+        self._workspaces[self._key(workspace)] = catalog
+        self.unchanged += unchanged
+        self.changed += len(rules) - unchanged
+        logger.debug(
+            "Rule catalog revalidated",
+            workspace_name=workspace.workspace_name,
+            rules=len(rules),
+            unchanged=unchanged,
+        )
+        return list(catalog.rules.values())
+
+    def get_rule(self, workspace: SentinelWorkspace, rule_id: str) -> Optional[CachedRule]:
+        """
+        Get one cached rule if it is still within the TTL
+
+        Args:
+            workspace: Workspace containing the rule
+            rule_id: Rule name
+
+        Returns:
+            CachedRule, or None if not cached or expired
+        """
+        catalog = self._workspaces.get(self._key(workspace))
+        entry = catalog.rules.get(rule_id.lower()) if catalog else None
+        if entry is None or not self._is_fresh(entry.fetched_at):
+            return None
+        self.hits += 1
+        return entry
+
+    def put_rule(self, workspace: SentinelWorkspace, rule: Any) -> CachedRule:
+        """
+        Store a single rule read with alert_rules.get
+
+        Args:
+            workspace: Workspace containing the rule
+            rule: Rule object
+
+        Returns:
+            The (possibly reused) cache entry
+        """
+        catalog = self._workspaces.setdefault(self._key(workspace), _WorkspaceCatalog())
+        name = rule.name.lower()
+        now = time.time()
+        entry = catalog.rules.get(name)
+        if entry is not None and entry.matches(rule):
+            entry.fetched_at = now
+        else:
+            entry = catalog.rules[name] = self._new_entry(rule, now)
+        return entry
+
+    @staticmethod
+    def _new_entry(rule: Any, fetched_at: float) -> CachedRule:
+        return CachedRule(
+            rule=rule,
+            etag=getattr(rule, "etag", None),
+            last_modified_utc=getattr(rule, "last_modified_utc", None),
+            fetched_at=fetched_at,
+        )
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get catalog statistics
+
+        Returns:
+            Dictionary with cached workspaces and rules, hits, revalidations
+            and how many revalidated rules were unchanged or changed
+        """
+        return {
+            "workspaces": len(self._workspaces),
+            "rules": sum(len(c.rules) for c in self._workspaces.values()),
+            "hits": self.hits,
+            "revalidations": self.revalidations,
+            "unchanged": self.unchanged,
+            "changed": self.changed,
+        }
+
+
+# Global rule catalog instance
+_rule_catalog: Optional[RuleCatalog] = None
+
+
+def get_rule_catalog(settings: Optional[Settings] = None) -> RuleCatalog:
+    """
+    Get or create the global rule catalog
+
+    Args:
+        settings: Optional Settings instance (defaults to global settings)
+
+    Returns:
+        RuleCatalog instance
+    """
+    global _rule_catalog
+    if _rule_catalog is None:
+        settings = settings or get_settings()
+        _rule_catalog = RuleCatalog(ttl_seconds=settings.rule_catalog_ttl)
+    return _rule_catalog
+
+
+def reset_rule_catalog() -> None:
+    """Discard the global rule catalog"""
+    global _rule_catalog
+    _rule_catalog = None
@@ -0,0 +1,178 @@
+"""
+Rule Extraction Module
+
+Converts SecurityInsights alert rule models into the summary and details
+dictionaries returned by the analytics rules tools. SDK models keep their
+attributes in the instance ``__dict__``, so rules are projected with plain
+dictionary lookups instead of ``hasattr``/``getattr`` chains, which pay for
+the attribute protocol (and a caught AttributeError for every attribute a
+rule kind lacks).
+"""
+
+from typing import Any, Dict, Optional
+
+from .lighthouse import SentinelWorkspace
+
+_NO_ATTRIBUTES: Dict[str, Any] = {}
+
+# Rules share a handful of durations (PT1H, PT5H, P1D, ...), so their text is
+# cached instead of formatting a timedelta several times per rule
+MAX_CACHED_DURATIONS = 256
+_duration_text: Dict[Any, str] = {}
+
+# Kind-specific "configuration" fields: (output key, attribute, stringify)
+_TEMPLATE_FIELDS = (("template_name", "alert_rule_template_name", False),)
+CONFIGURATION_FIELDS = {
+    "Scheduled": (
+        ("query", "query", False),
+        ("query_frequency", "query_frequency", True),
+        ("query_period", "query_period", True),
+        ("trigger_operator", "trigger_operator", False),
+        ("trigger_threshold", "trigger_threshold", False),
+        ("suppression_enabled", "suppression_enabled", False),
+        ("suppression_duration", "suppression_duration", True),
+    ),
+    "MicrosoftSecurityIncidentCreation": (
+        ("product_filter", "product_filter", False),
+        ("display_name_filter", "display_name_filter", False),
+    ),
+    "Fusion": _TEMPLATE_FIELDS,
+    "MLBehaviorAnalytics": _TEMPLATE_FIELDS,
+}
+
+ALERT_DETAILS_OVERRIDE_FIELDS = (
+    ("display_name_format", "alert_display_name_format"),
+    ("description_format", "alert_description_format"),
+    ("severity_column", "alert_severity_column_name"),
+    ("tactics_column", "alert_tactics_column_name"),
+)
+
+
+def _duration(value: Any) -> str:
+    """Text of a duration (or any other value) as str() formats it"""
+    text = _duration_text.get(value)
+    if text is None:
+        text = str(value)
+        if len(_duration_text) < MAX_CACHED_DURATIONS:
+            _duration_text[value] = text
+    return text
+
+
+def _attributes(obj: Optional[Any]) -> Dict[str, Any]:
+    """Get the attributes of a model instance (none for an unset value)"""
+    return obj.__dict__ if obj is not None else _NO_ATTRIBUTES
+
+
+def extract_rule_summary(rule: Any, workspace: SentinelWorkspace) -> Dict[str, Any]:
+    """
+    Extract summary information from a rule object
+
+    Args:
+        rule: Alert rule object from Azure SDK
+        workspace: SentinelWorkspace the rule belongs to
+
+    Returns:
+        Dictionary with rule summary information
+    """
+    attributes = rule.__dict__
+    name = rule.name
+
+    # Basic information available for all rule types
+    summary = {
+        "rule_id": name,
+        "rule_name": attributes.get("display_name", name),
+        "kind": attributes.get("kind", "Unknown"),
+        "enabled": attributes.get("enabled", False),
+        "workspace_name": workspace.workspace_name,
+        "workspace_id": workspace.workspace_id,
+    }
+
+    # Add type-specific information
+    if "severity" in attributes:
+        summary["severity"] = attributes["severity"]
+    if "tactics" in attributes:
+        summary["tactics"] = attributes["tactics"] or []
+    if "techniques" in attributes:
+        summary["techniques"] = attributes["techniques"] or []
+    if "description" in attributes:
+        summary["description"] = attributes["description"]
+    if "last_modified_utc" in attributes:
+        last_modified = attributes["last_modified_utc"]
+        summary["last_modified"] = last_modified.isoformat() if last_modified else None
+
+    return summary
+
+
+def extract_rule_details(rule: Any, workspace: SentinelWorkspace) -> Dict[str, Any]:
+    """
+    Extract detailed information from a rule object
+
+    Args:
+        rule: Alert rule object from Azure SDK
+        workspace: SentinelWorkspace the rule belongs to
+
+    Returns:
+        Dictionary with detailed rule information
+    """
+    details = extract_rule_summary(rule, workspace)
+    attributes = rule.__dict__
+
+    # Add detailed configuration based on rule type
+    kind = details["kind"]
+    configuration = details["configuration"] = {}
+    for key, attribute, stringify in CONFIGURATION_FIELDS.get(getattr(kind, "value", kind), ()):
+        if attribute in attributes:
+            value = attributes[attribute]
+            configuration[key] = _duration(value) if stringify else value
+
+    # Add incident configuration if available
+    if "incident_configuration" in attributes:
+        incident_config = _attributes(attributes["incident_configuration"])
+        incident = details["incident_configuration"] = {
+            "create_incident": incident_config.get("create_incident", False),
+        }
+        if "grouping_configuration" in incident_config:
+            grouping = _attributes(incident_config["grouping_configuration"])
+            incident["grouping"] = {
+                "enabled": grouping.get("enabled", False),
+                "reopen_closed_incidents": grouping.get("reopen_closed_incident", False),
+                "lookback_duration": _duration(grouping.get("lookback_duration", "PT5H")),
+                "matching_method": grouping.get("matching_method", "AllEntities"),
+            }
+            if "group_by_entities" in grouping:
+                incident["grouping"]["group_by_entities"] = grouping["group_by_entities"]
+            if "group_by_alert_details" in grouping:
+                incident["grouping"]["group_by_alert_details"] = grouping["group_by_alert_details"]
+
+    # Add alert details configuration if available
+    if "alert_details_override" in attributes:
+        alert_override = _attributes(attributes["alert_details_override"])
+        details["alert_details_override"] = {
+            key: alert_override[attribute]
+            for key, attribute in ALERT_DETAILS_OVERRIDE_FIELDS
+            if attribute in alert_override
+        }
+
+    # Add entity mappings if available
+    entity_mappings = attributes.get("entity_mappings")
+    if entity_mappings:
+        details["entity_mappings"] = []
+        for mapping in entity_mappings:
+            mapping_attributes = _attributes(mapping)
+            details["entity_mappings"].append({
+                "entity_type": mapping_attributes.get("entity_type"),
+                "field_mappings": [
+                    {
+                        "identifier": _attributes(field_map).get("identifier"),
+                        "column_name": _attributes(field_map).get("column_name"),
+                    }
+                    for field_map in mapping_attributes.get("field_mappings") or ()
+                ],
+            })
+
+    # Add custom details if available
+    custom_details = attributes.get("custom_details")
+    if custom_details:
+        details["custom_details"] = dict(custom_details)
+
+    return details
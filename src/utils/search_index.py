@@ -0,0 +1,367 @@
+"""
+Rule Search Index Module
+
+In-memory inverted index over analytics rules, fed from the rule catalog.
+Rule names, descriptions, KQL query tokens and the tables a query reads are
+indexed per field; a workspace update only re-indexes rules whose catalog
+entry changed, so keeping the index current costs little once it is built.
+"""
+
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+import re
+import structlog
+
+from .lighthouse import SentinelWorkspace
+from .rule_catalog import CachedRule
+
+logger = structlog.get_logger(__name__)
+
+# Indexed fields and their weight in the match score
+SEARCH_FIELDS = {
+    "name": 3.0,
+    "tables": 2.0,
+    "description": 1.0,
+    "query": 1.0,
+}
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9_]{2,}")
+# A table is read where a tabular expression starts: at the start of the
+# query or of a statement, after join, or on the right of a let binding, and
+# is followed by a pipe or the end of the expression
+_TABLE_PATTERN = re.compile(
+    r"(?:\A|;|\blet\s+[A-Za-z_][A-Za-z0-9_]*\s*=|\bjoin\b(?:\s+kind\s*=\s*\w+)?\s*\(?)"
+    r"\s*([A-Z][A-Za-z0-9_]*)\s*(?=\||\)|;|$)"
+)
+# A parenthesised tabular expression, e.g. "in (Table | ...)"; function calls
+# such as tostring(Column) have the same shape and are told apart by the word
+# before the parenthesis
+_PARENTHESIZED_PATTERN = re.compile(r"\(\s*([A-Z][A-Za-z0-9_]*)\s*(?=\||\)|;|$)")
+_WORD_BEFORE_PATTERN = re.compile(r"([\w-]+)\s*$")
+# Words that take a tabular expression in parentheses
+_TABULAR_KEYWORDS = frozenset({"in", "join", "lookup", "materialize", "toscalar", "union"})
+_COMMENT_PATTERN = re.compile(r"//[^\n]*")
+# union takes a comma-separated list of tables after its options
+_UNION_PATTERN = re.compile(r"\bunion\b(?:\s+\w+\s*=\s*\w+)*\s+([^|;()]+)")
+_IDENTIFIER_PATTERN = re.compile(r"^[A-Z][A-Za-z0-9_]*$")
+# Capitalised KQL words that can sit where a table name would
+_NOT_TABLES = frozenset({"True", "False"})
+
+DocKey = Tuple[str, str]
+
+
+def tokenize(text: Optional[str]) -> Set[str]:
+    """Split text into lowercase search tokens"""
+    if not text:
+        return set()
+    return set(_TOKEN_PATTERN.findall(text.lower()))
+
+
+def referenced_tables(query: Optional[str]) -> Set[str]:
+    """
+    Find the tables a KQL query reads
+
+    A lexical heuristic: identifiers starting with an uppercase letter at the
+    start of a tabular expression. Let-bound names, function arguments and
+    column lists are excluded.
+
+    Args:
+        query: KQL query text
+
+    Returns:
+        Table names as written in the query
+    """
+    if not query:
+        return set()
+    query = _COMMENT_PATTERN.sub("", query)
+    let_names = set(re.findall(r"\blet\s+([A-Za-z_][A-Za-z0-9_]*)", query))
+    tables = set(_TABLE_PATTERN.findall(query))
+    for match in _PARENTHESIZED_PATTERN.finditer(query):
+        word = _WORD_BEFORE_PATTERN.search(query[max(0, match.start() - 32):match.start()])
+        if word is None or word.group(1).lower() in _TABULAR_KEYWORDS:
+            tables.add(match.group(1))
+    for union_list in _UNION_PATTERN.findall(query):
+        tables.update(
+            name.strip()
+            for name in union_list.split(",")
+            if _IDENTIFIER_PATTERN.match(name.strip())
+        )
+    return tables - let_names - _NOT_TABLES
+
+
+def parse_search(
+    query: str, fields: Optional[List[str]] = None, limit: int = 1
+) -> Tuple[Set[str], List[str]]:
+    """
+    Validate a search and split it into tokens
+
+    Args:
+        query: Search text
+        fields: Fields to search, or None/empty for all SEARCH_FIELDS
+        limit: Maximum matches to return
+
+    Returns:
+        Tuple of search tokens and fields
+
+    Raises:
+        ValueError: If limit is below 1, a field is unknown or the query has
+            no searchable tokens
+    """
+    if limit < 1:
+        raise ValueError("limit must be at least 1")
+    fields = fields or list(SEARCH_FIELDS)
+    unknown = [field for field in fields if field not in SEARCH_FIELDS]
+    if unknown:
+        raise ValueError(
+            f"Unknown search field(s): {', '.join(unknown)}. "
+            f"Available fields: {', '.join(SEARCH_FIELDS)}"
+        )
+    tokens = tokenize(query)
+    if not tokens:
+        raise ValueError(f"Search text '{query}' has no searchable words")
+    return tokens, fields
+
+
+@dataclass
+class SearchDocument:
+    """Indexed form of one rule"""
+
+    workspace: SentinelWorkspace
+    entry: CachedRule
+    terms: Dict[str, FrozenSet[str]]
+    tables: List[str]
+
+
+def document_terms(entry: CachedRule) -> Tuple[Dict[str, FrozenSet[str]], List[str]]:
+    """
+    Get the per-field search terms of a catalog entry, computed once per rule version
+
+    Args:
+        entry: Rule catalog entry
+
+    Returns:
+        Tuple of terms by field and the tables the rule's query reads
+    """
+    cached = entry.derived.get("search_terms")
+    if cached is None:
+        rule = entry.rule
+        query = getattr(rule, "query", None)
+        tables = sorted(referenced_tables(query))
+        terms = {
+            "name": frozenset(
+                tokenize(getattr(rule, "display_name", None)) | tokenize(rule.name)
+            ),
+            "description": frozenset(tokenize(getattr(rule, "description", None))),
+            "query": frozenset(tokenize(query)),
+            "tables": frozenset(table.lower() for table in tables),
+        }
+        cached = entry.derived["search_terms"] = (terms, tables)
+    return cached
+
+
+class RuleSearchIndex:
+    """Inverted index of analytics rules across workspaces"""
+
+    def __init__(self):
+        """Initialize an empty index"""
+        self._documents: Dict[DocKey, SearchDocument] = {}
+        self._by_workspace: Dict[str, Set[DocKey]] = defaultdict(set)
+        self._postings: Dict[str, Dict[str, Set[DocKey]]] = {
+            field: defaultdict(set) for field in SEARCH_FIELDS
+        }
+        self.indexed = 0
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def update_workspace(self, workspace: SentinelWorkspace, entries: Iterable[CachedRule]) -> int:
+        """
+        Bring a workspace's rules in line with its catalog entries
+
+        Entries already indexed (the catalog keeps the same entry while a
+        rule's etag is unchanged) are skipped; changed rules are re-indexed and
+        deleted rules removed.
+
+        Args:
+            workspace: Workspace the rules belong to
+            entries: The workspace's current catalog entries
+
+        Returns:
+            Number of rules (re-)indexed
+        """
+        workspace_key = workspace.workspace_id.lower()
+        current: Set[DocKey] = set()
+        indexed = 0
+
+        for entry in entries:
+            key = (workspace_key, entry.rule.name.lower())
+            current.add(key)
+            document = self._documents.get(key)
+            if document is not None and document.entry is entry:
+                continue
+            if document is not None:
+                self._remove(key)
+            terms, tables = document_terms(entry)
+            self._documents[key] = SearchDocument(workspace, entry, terms, tables)
+            self._by_workspace[workspace_key].add(key)
+            for field, field_terms in terms.items():
+                postings = self._postings[field]
+                for term in field_terms:
+                    postings[term].add(key)
+            indexed += 1
+
+        for key in self._by_workspace[workspace_key] - current:
+            self._remove(key)
+
+        self.indexed += indexed
+        if indexed:
+            logger.debug(
+                "Rule search index updated",
+                workspace_name=workspace.workspace_name,
+                indexed=indexed,
+                rules=len(current),
+            )
+        return indexed
+
+    def retain_workspaces(self, workspace_ids: Set[str]) -> int:
+        """
+        Drop the rules of every workspace not in a set
+
+        Args:
+            workspace_ids: Lowercase IDs of the workspaces to keep
+
+        Returns:
+            Number of workspaces dropped
+        """
+        dropped = [key for key in self._by_workspace if key not in workspace_ids]
+        for workspace_key in dropped:
+            for key in list(self._by_workspace[workspace_key]):
+                self._remove(key)
+            del self._by_workspace[workspace_key]
+        return len(dropped)
+
+    def _remove(self, key: DocKey) -> None:
+        """Drop a document and its postings"""
+        document = self._documents.pop(key)
+        self._by_workspace[key[0]].discard(key)
+        for field, field_terms in document.terms.items():
+            postings = self._postings[field]
+            for term in field_terms:
+                docs = postings.get(term)
+                if docs is not None:
+                    docs.discard(key)
+                    if not docs:
+                        del postings[term]
+
+    def search(
+        self,
+        query: str,
+        fields: Optional[List[str]] = None,
+        workspace_ids: Optional[Set[str]] = None,
+        limit: int = 100,
+    ) -> Tuple[int, List[Dict[str, Any]]]:
+        """
+        Find rules containing every token of a query
+
+        Args:
+            query: Search text; all of its tokens must match
+            fields: Fields to search (defaults to all SEARCH_FIELDS)
+            workspace_ids: Optional lowercase workspace IDs to restrict results to
+            limit: Maximum matches returned
+
+        Returns:
+            Tuple of the total match count and the best matches, highest score first
+
+        Raises:
+            ValueError: If limit is below 1, a field is unknown or the query
+                has no searchable tokens
+        """
+        tokens, fields = parse_search(query, fields, limit)
+
+        matched_fields: Dict[DocKey, Set[str]] = defaultdict(set)
+        candidates: Optional[Set[DocKey]] = None
+        # Rarest tokens first keeps the intersection small
+        for token in sorted(tokens, key=lambda t: self._document_frequency(t, fields)):
+            docs: Set[DocKey] = set()
+            for field in fields:
+                field_docs = self._postings[field].get(token)
+                if field_docs:
+                    docs |= field_docs
+                    for key in field_docs:
+                        matched_fields[key].add(field)
+            candidates = docs if candidates is None else candidates & docs
+            if not candidates:
+                return 0, []
+
+        if workspace_ids is not None:
+            candidates = {key for key in candidates if key[0] in workspace_ids}
+
+        scored = sorted(
+            (
+                (sum(SEARCH_FIELDS[field] for field in matched_fields[key]), key)
+                for key in candidates
+            ),
+            key=lambda item: (-item[0], item[1]),
+        )
+        return len(scored), [
+            self._match(self._documents[key], score, matched_fields[key])
+            for score, key in scored[:limit]
+        ]
+
+    def _document_frequency(self, token: str, fields: List[str]) -> int:
+        return sum(len(self._postings[field].get(token, ())) for field in fields)
+
+    @staticmethod
+    def _match(document: SearchDocument, score: float, fields: Set[str]) -> Dict[str, Any]:
+        rule = document.entry.rule
+        return {
+            "workspace_name": document.workspace.workspace_name,
+            "workspace_id": document.workspace.workspace_id,
+            "tenant_name": document.workspace.tenant_name,
+            "rule_id": rule.name,
+            "rule_name": getattr(rule, "display_name", None) or rule.name,
+            "kind": getattr(rule, "kind", "Unknown"),
+            "enabled": getattr(rule, "enabled", False),
+            "tables": document.tables,
+            "matched_fields": [field for field in SEARCH_FIELDS if field in fields],
+            "score": score,
+        }
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get index statistics
+
+        Returns:
+            Dictionary with indexed rules, workspaces, distinct terms and the
+            number of (re-)indexing operations so far
+        """
+        return {
+            "rules": len(self._documents),
+            "workspaces": sum(1 for keys in self._by_workspace.values() if keys),
+            "terms": sum(len(postings) for postings in self._postings.values()),
+            "indexed": self.indexed,
+        }
+
+
+# Global search index instance
+_search_index: Optional[RuleSearchIndex] = None
+
+
+def get_search_index() -> RuleSearchIndex:
+    """
+    Get or create the global rule search index
+
+    Returns:
+        RuleSearchIndex instance
+    """
+    global _search_index
+    if _search_index is None:
+        _search_index = RuleSearchIndex()
+    return _search_index
+
+
+def reset_search_index() -> None:
+    """Discard the global rule search index"""
+    global _search_index
+    _search_index = None
@@ -0,0 +1,105 @@
+"""
+Single-Flight Module
+
+Coalesces concurrent identical Azure reads: callers asking for the same key
+while a request is in flight await that request instead of issuing their own.
+"""
+
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+import asyncio
+import structlog
+
+from .lighthouse import SentinelWorkspace
+
+logger = structlog.get_logger(__name__)
+
+T = TypeVar("T")
+
+
+def workspace_read_key(operation: str, workspace: SentinelWorkspace, **params: Any) -> Tuple:
+    """
+    Build a single-flight key for a read against a workspace
+
+    Args:
+        operation: SDK operation name (e.g. "alert_rules.list")
+        workspace: Target workspace
+        **params: Additional request parameters that change the result
+
+    Returns:
+        Hashable key of operation, subscription, resource group, workspace and params
+    """
+    return (
+        operation,
+        workspace.subscription_id.lower(),
+        workspace.resource_group.lower(),
+        workspace.workspace_name.lower(),
+        tuple(sorted(params.items())),
+    )
+
+
+class SingleFlight:
+    """Shares one in-flight call between concurrent callers with the same key"""
+
+    def __init__(self):
+        """Initialize single-flight group"""
+        self._in_flight: Dict[Hashable, asyncio.Task] = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run func for key, or join the call already in flight for key
+
+        The result (or exception) is shared by every caller that joined, so
+        results must be treated as read-only. Only in-flight calls are shared;
+        nothing is cached once the call completes.
+
+        Args:
+            key: Hashable identity of the read
+            func: Coroutine function performing the read
+
+        Returns:
+            Result of the shared call
+        """
+        task = self._in_flight.get(key)
+        if task is None:
+            self.calls += 1
+            task = asyncio.create_task(func())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        else:
+            self.coalesced += 1
+            logger.debug("Joined in-flight request", key=key)
+
+        # Shield so one cancelled caller does not abort the read for the others
+        return await asyncio.shield(task)
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get single-flight statistics
+
+        Returns:
+            Dictionary with issued calls, coalesced callers and calls in flight
+        """
+        return {
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._in_flight),
+        }
+
+
+# Global single-flight group
+_single_flight: Optional[SingleFlight] = None
+
+
+def get_single_flight() -> SingleFlight:
+    """
+    Get or create the global single-flight group
+
+    Returns:
+        SingleFlight instance
+    """
+    global _single_flight
+    if _single_flight is None:
+        _single_flight = SingleFlight()
+    return _single_flight
@@ -0,0 +1,143 @@
+"""
+Result Snapshot Module
+
+Keeps recent tool results in memory so paginated responses can serve
+follow-up pages from the same snapshot instead of querying Azure again.
+Pages are addressed with opaque cursors.
+"""
+
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+import base64
+import binascii
+import json
+import time
+import uuid
+import structlog
+
+from .config import Settings, get_settings
+
+logger = structlog.get_logger(__name__)
+
+# Snapshots kept at once; the least recently used is evicted first
+DEFAULT_MAX_SNAPSHOTS = 32
+
+
+def encode_cursor(snapshot_id: str, offset: int, page_size: int) -> str:
+    """
+    Build an opaque page cursor
+
+    Args:
+        snapshot_id: Snapshot the cursor points into
+        offset: Index of the first item of the page
+        page_size: Items per page
+
+    Returns:
+        URL-safe cursor string
+    """
+    payload = json.dumps({"s": snapshot_id, "o": offset, "n": page_size}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[str, int, int]:
+    """
+    Decode a page cursor
+
+    Args:
+        cursor: Cursor returned by a previous page
+
+    Returns:
+        Tuple of snapshot ID, offset and page size
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return str(payload["s"]), int(payload["o"]), int(payload["n"])
+    except (binascii.Error, ValueError, TypeError, KeyError, UnicodeDecodeError):
+        raise ValueError("Invalid cursor")
+
+
+class SnapshotStore:
+    """In-memory LRU store of result snapshots with a TTL"""
+
+    def __init__(self, ttl_seconds: int = 300, max_snapshots: int = DEFAULT_MAX_SNAPSHOTS):
+        """
+        Initialize snapshot store
+
+        Args:
+            ttl_seconds: How long a snapshot can be paged through
+            max_snapshots: Maximum snapshots kept at once
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_snapshots = max_snapshots
+        self._snapshots: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+
+    def put(self, data: Any) -> str:
+        """
+        Store a snapshot
+
+        Args:
+            data: Result to keep (treated as read-only afterwards)
+
+        Returns:
+            Snapshot ID
+        """
+        self._evict_expired()
+        snapshot_id = uuid.uuid4().hex
+        self._snapshots[snapshot_id] = (data, time.time() + self.ttl_seconds)
+        while len(self._snapshots) > self.max_snapshots:
+            self._snapshots.popitem(last=False)
+        return snapshot_id
+
+    def get(self, snapshot_id: str) -> Optional[Any]:
+        """
+        Get a snapshot
+
+        Args:
+            snapshot_id: Snapshot ID from put()
+
+        Returns:
+            Stored data, or None if unknown or expired
+        """
+        entry = self._snapshots.get(snapshot_id)
+        if entry is None:
+            return None
+        data, expires_at = entry
+        if time.time() >= expires_at:
+            del self._snapshots[snapshot_id]
+            return None
+        self._snapshots.move_to_end(snapshot_id)
+        return data
+
+    def _evict_expired(self) -> None:
+        """Drop expired snapshots"""
+        now = time.time()
+        for snapshot_id in [sid for sid, (_, expires_at) in self._snapshots.items() if now >= expires_at]:
+            del self._snapshots[snapshot_id]
+
+    def __len__(self) -> int:
+        return len(self._snapshots)
+
+
+# Global snapshot store instance
+_snapshot_store: Optional[SnapshotStore] = None
+
+
+def get_snapshot_store(settings: Optional[Settings] = None) -> SnapshotStore:
+    """
+    Get or create the global snapshot store
+
+    Args:
+        settings: Optional Settings instance (defaults to global settings)
+
+    Returns:
+        SnapshotStore instance
+    """
+    global _snapshot_store
+    if _snapshot_store is None:
+        settings = settings or get_settings()
+        _snapshot_store = SnapshotStore(ttl_seconds=settings.listing_snapshot_ttl)
+    return _snapshot_store
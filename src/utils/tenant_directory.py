@@ -0,0 +1,148 @@
+"""
+Tenant Directory Module
+
+Caches the mapping of Azure AD tenant IDs to customer display names, loaded
+from the tenants API (which includes Lighthouse customer tenants projected
+into the managing tenant) and refreshed on a TTL.
+"""
+
+from typing import Dict, Optional, Set, Any
+import asyncio
+import time
+import structlog
+from azure.core.credentials_async import AsyncTokenCredential
+
+from .rate_limiter import AdaptiveRateLimiter, arm_client_kwargs
+
+logger = structlog.get_logger(__name__)
+
+# Back-off before retrying after a failed directory load
+FAILED_REFRESH_RETRY_SECONDS = 60
+
+
+class TenantDirectory:
+    """TTL cache of tenant ID to display name"""
+
+    def __init__(
+        self,
+        credential: AsyncTokenCredential,
+        ttl_seconds: int = 3600,
+        client: Optional[Any] = None,
+        rate_limiter: Optional[AdaptiveRateLimiter] = None,
+    ):
+        """
+        Initialize tenant directory
+
+        Args:
+            credential: Async Azure credential
+            ttl_seconds: How long a loaded directory stays valid
+            client: Optional async SubscriptionClient (created lazily if omitted)
+            rate_limiter: Optional ARM rate limiter for the created client
+                (defaults to the global one)
+        """
+        self.credential = credential
+        self.ttl_seconds = ttl_seconds
+        self.rate_limiter = rate_limiter
+        self._client = client
+        # Only a client created here is closed by close()
+        self._owns_client = False
+        self._names: Dict[str, str] = {}
+        self._ids_by_name: Dict[str, Set[str]] = {}
+        self._loaded_at: Optional[float] = None
+        self._failed_at: Optional[float] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    def _is_fresh(self) -> bool:
+        """Check whether the directory is loaded and within its TTL"""
+        now = time.time()
+        if self._failed_at is not None and now - self._failed_at < FAILED_REFRESH_RETRY_SECONDS:
+            return True
+        return self._loaded_at is not None and now - self._loaded_at < self.ttl_seconds
+
+    async def get_tenant_names(self) -> Dict[str, str]:
+        """
+        Get the tenant directory, refreshing it if expired
+
+        Concurrent callers share a single refresh. If a refresh fails, the
+        previously loaded directory (possibly empty) is returned.
+
+        Returns:
+            Mapping of lowercase tenant ID to display name
+        """
+        if not self._is_fresh():
+            if self._refresh_task is None or self._refresh_task.done():
+                self._refresh_task = asyncio.create_task(self._refresh())
+            try:
+                await asyncio.shield(self._refresh_task)
+            except Exception as e:
+                self._failed_at = time.time()
+                logger.warning("Failed to load tenant directory", error=str(e))
+        return self._names
+
+    async def resolve_filter(self, tenant_filter: str) -> Optional[Set[str]]:
+        """
+        Resolve a tenant filter to tenant IDs
+
+        An exact tenant ID or display name (case-insensitive) resolves by
+        dictionary lookup; anything else is matched as a substring or glob
+        pattern against the known display names.
+
+        Args:
+            tenant_filter: Tenant ID, display name or name pattern
+
+        Returns:
+            Set of lowercase tenant IDs, or None if the directory cannot
+            resolve the filter (callers then fall back to name matching)
+        """
+        from .workspace_index import pattern_matches
+
+        await self.get_tenant_names()
+        key = tenant_filter.lower()
+
+        if key in self._names:
+            return {key}
+        if key in self._ids_by_name:
+            return set(self._ids_by_name[key])
+
+        matched = {
+            tenant_id
+            for name, tenant_ids in self._ids_by_name.items()
+            if pattern_matches(tenant_filter, name)
+            for tenant_id in tenant_ids
+        }
+        return matched or None
+
+    async def _refresh(self) -> None:
+        """Reload the directory from the tenants API"""
+        if self._client is None:
+            from azure.mgmt.resource.subscriptions.aio import SubscriptionClient
+
+            self._client = SubscriptionClient(
+                self.credential, **arm_client_kwargs(self.rate_limiter)
+            )
+            self._owns_client = True
+
+        tenants = [tenant async for tenant in self._client.tenants.list()]
+
+        names: Dict[str, str] = {}
+        ids_by_name: Dict[str, Set[str]] = {}
+        for tenant in tenants:
+            if not tenant.tenant_id:
+                continue
+            tenant_id = tenant.tenant_id.lower()
+            name = tenant.display_name or tenant.default_domain or tenant.tenant_id
+            names[tenant_id] = name
+            ids_by_name.setdefault(name.lower(), set()).add(tenant_id)
+
+        self._names = names
+        self._ids_by_name = ids_by_name
+        self._loaded_at = time.time()
+        self._failed_at = None
+        logger.info("Tenant directory loaded", count=len(names))
+
+    async def close(self) -> None:
+        """Close the SubscriptionClient if it was created by the directory"""
+        if self._owns_client and self._client is not None:
+            await self._client.close()
+            self._client = None
+            self._owns_client = False
@@ -0,0 +1,242 @@
+"""
+Workspace Index Module
+
+In-memory lookup structures over the cached Sentinel workspace inventory,
+so single-workspace tools and filters resolve without touching ARM.
+"""
+
+from collections import OrderedDict, defaultdict
+from fnmatch import fnmatchcase
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from .lighthouse import SentinelWorkspace
+
+GLOB_CHARACTERS = frozenset("*?[")
+
+# Filter results memoized per index; the least recently used is evicted first
+DEFAULT_MAX_CACHED_MATCHES = 256
+
+WORKSPACE_RESOURCE_ID_FORMAT = (
+    "/subscriptions/{subscription_id}/resourceGroups/{resource_group}"
+    "/providers/Microsoft.OperationalInsights/workspaces/{workspace_name}"
+)
+
+
+def _is_glob(pattern: str) -> bool:
+    """Check whether a filter pattern uses glob syntax"""
+    return any(char in GLOB_CHARACTERS for char in pattern)
+
+
+def pattern_matches(pattern: str, value: Optional[str]) -> bool:
+    """
+    Case-insensitive filter match
+
+    Patterns containing glob characters (``*``, ``?``, ``[``) are matched as
+    globs against the whole value; anything else is a substring match.
+
+    Args:
+        pattern: Filter pattern
+        value: Value to test
+
+    Returns:
+        True if the value matches the pattern
+    """
+    if not value:
+        return False
+    pattern = pattern.lower()
+    value = value.lower()
+    if _is_glob(pattern):
+        return fnmatchcase(value, pattern)
+    return pattern in value
+
+
+def workspace_resource_id(subscription_id: str, resource_group: str, workspace_name: str) -> str:
+    """Build the Azure resource ID of a Log Analytics workspace"""
+    return WORKSPACE_RESOURCE_ID_FORMAT.format(
+        subscription_id=subscription_id,
+        resource_group=resource_group,
+        workspace_name=workspace_name,
+    )
+
+
+def parse_workspace_resource_id(resource_id: str) -> Tuple[str, str, str]:
+    """
+    Split a Log Analytics workspace resource ID into its parts
+
+    Args:
+        resource_id: Resource ID such as
+            /subscriptions/{sub}/resourceGroups/{rg}/providers/Microsoft.OperationalInsights/workspaces/{name}
+
+    Returns:
+        Tuple of subscription ID, resource group and workspace name
+
+    Raises:
+        ValueError: If the ID is not a workspace resource ID
+    """
+    parts = resource_id.strip("/").split("/")
+    if (
+        len(parts) != 8
+        or parts[0].lower() != "subscriptions"
+        or parts[2].lower() != "resourcegroups"
+        or parts[4].lower() != "providers"
+        or parts[5].lower() != "microsoft.operationalinsights"
+        or parts[6].lower() != "workspaces"
+        or not all(parts[i] for i in (1, 3, 7))
+    ):
+        raise ValueError(f"Not a Log Analytics workspace resource ID: '{resource_id}'")
+    return parts[1], parts[3], parts[7]
+
+
+def workspace_matches(
+    workspace: SentinelWorkspace,
+    workspace_filter: Optional[str] = None,
+    tenant_filter: Optional[str] = None,
+    tenant_ids: Optional[Set[str]] = None,
+) -> bool:
+    """
+    Check a single workspace against name and tenant filters
+
+    Uses the same semantics as ``WorkspaceIndex.match`` for workspaces that
+    are streamed before an index exists.
+
+    Args:
+        workspace: Workspace to test
+        workspace_filter: Optional workspace name pattern
+        tenant_filter: Optional tenant name pattern or tenant ID
+        tenant_ids: Lowercase tenant IDs the tenant filter resolved to via the
+                    tenant directory; takes precedence over tenant_filter
+
+    Returns:
+        True if the workspace passes both filters
+    """
+    if workspace_filter and not pattern_matches(workspace_filter, workspace.workspace_name):
+        return False
+    if tenant_ids is not None:
+        return workspace.tenant_id.lower() in tenant_ids
+    if tenant_filter:
+        return (
+            workspace.tenant_id.lower() == tenant_filter.lower()
+            or pattern_matches(tenant_filter, workspace.tenant_name)
+        )
+    return True
+
+
+class WorkspaceIndex:
+    """Immutable lookup index over a list of SentinelWorkspace objects"""
+
+    def __init__(
+        self,
+        workspaces: Iterable[SentinelWorkspace],
+        max_cached_matches: int = DEFAULT_MAX_CACHED_MATCHES,
+    ):
+        """
+        Build the index
+
+        Args:
+            workspaces: Workspaces to index
+            max_cached_matches: Maximum filter results memoized at once
+        """
+        self.max_cached_matches = max_cached_matches
+        self.workspaces: List[SentinelWorkspace] = list(workspaces)
+        self._by_name: Dict[str, List[SentinelWorkspace]] = defaultdict(list)
+        self._by_tenant_id: Dict[str, List[SentinelWorkspace]] = defaultdict(list)
+        self._by_tenant_name: Dict[str, List[SentinelWorkspace]] = defaultdict(list)
+        self._by_resource_id: Dict[str, SentinelWorkspace] = {}
+        self._match_cache: "OrderedDict[Tuple[str, str, Optional[FrozenSet[str]]], List[SentinelWorkspace]]" = OrderedDict()
+
+        for workspace in self.workspaces:
+            self._by_name[workspace.workspace_name.lower()].append(workspace)
+            self._by_tenant_id[workspace.tenant_id.lower()].append(workspace)
+            if workspace.tenant_name:
+                self._by_tenant_name[workspace.tenant_name.lower()].append(workspace)
+            self._by_resource_id[workspace.workspace_id.lower()] = workspace
+
+    def __len__(self) -> int:
+        return len(self.workspaces)
+
+    def get_by_resource_id(self, resource_id: str) -> Optional[SentinelWorkspace]:
+        """Get a workspace by its full Azure resource ID"""
+        return self._by_resource_id.get(resource_id.lower())
+
+    def get_by_name(
+        self, workspace_name: str, subscription_id: Optional[str] = None
+    ) -> Optional[SentinelWorkspace]:
+        """
+        Get a workspace by exact (case-insensitive) name
+
+        Args:
+            workspace_name: Workspace name
+            subscription_id: Optional subscription ID to disambiguate
+
+        Returns:
+            First matching SentinelWorkspace, or None
+        """
+        for workspace in self._by_name.get(workspace_name.lower(), []):
+            if subscription_id is None or workspace.subscription_id.lower() == subscription_id.lower():
+                return workspace
+        return None
+
+    def match(
+        self,
+        workspace_filter: Optional[str] = None,
+        tenant_filter: Optional[str] = None,
+        tenant_ids: Optional[Set[str]] = None,
+    ) -> List[SentinelWorkspace]:
+        """
+        Get workspaces matching name and tenant filters
+
+        Filters are substring or glob patterns (see ``pattern_matches``).
+        A tenant filter also matches exact tenant IDs. Results are memoized
+        per filter pair in a bounded LRU, since the index never changes once
+        built.
+
+        Args:
+            workspace_filter: Optional workspace name pattern
+            tenant_filter: Optional tenant name pattern or tenant ID
+            tenant_ids: Lowercase tenant IDs the tenant filter resolved to via
+                        the tenant directory; looked up directly in the tenant
+                        index and takes precedence over tenant_filter
+
+        Returns:
+            Matching workspaces
+        """
+        key = (
+            (workspace_filter or "").lower(),
+            (tenant_filter or "").lower(),
+            frozenset(tenant_ids) if tenant_ids is not None else None,
+        )
+        cached = self._match_cache.get(key)
+        if cached is not None:
+            self._match_cache.move_to_end(key)
+            return list(cached)
+
+        candidates = self.workspaces
+        if tenant_ids is not None:
+            candidates = [
+                ws for tenant_id in sorted(tenant_ids) for ws in self._by_tenant_id.get(tenant_id, [])
+            ]
+        elif tenant_filter:
+            candidates = self._match_tenant(tenant_filter)
+        if workspace_filter:
+            names = {
+                name for name in self._by_name if pattern_matches(workspace_filter, name)
+            }
+            candidates = [ws for ws in candidates if ws.workspace_name.lower() in names]
+
+        self._match_cache[key] = candidates
+        while len(self._match_cache) > self.max_cached_matches:
+            self._match_cache.popitem(last=False)
+        return list(candidates)
+
+    def _match_tenant(self, tenant_filter: str) -> List[SentinelWorkspace]:
+        """Get workspaces whose tenant ID equals or tenant name matches the filter"""
+        tenant_id = tenant_filter.lower()
+        names = {
+            name for name in self._by_tenant_name if pattern_matches(tenant_filter, name)
+        }
+        return [
+            ws
+            for ws in self.workspaces
+            if ws.tenant_id.lower() == tenant_id
+            or (ws.tenant_name and ws.tenant_name.lower() in names)
+        ]